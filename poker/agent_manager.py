@@ -3,7 +3,7 @@ Agent管理・接続テスト機能
 """
 
 import flet as ft
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 import requests
 import uuid
 import os
@@ -163,6 +163,32 @@ class AgentManager:
         """利用可能なAgent一覧を取得"""
         return self.dynamic_agents if self.dynamic_agents else []
 
+    def get_agent_choices(self) -> List[Tuple[str, str]]:
+        """Agent選択ドロップダウン用の (key, text) 一覧を取得
+
+        接続テスト成功済みのAgentを優先し、1つもなければ全Agentを返す。
+        """
+        agents = self.get_available_agents()
+        agents_by_id: Dict[str, Dict[str, Any]] = {}
+        for agent in agents:
+            agents_by_id.setdefault(agent.get("id"), agent)
+
+        selected = [
+            agents_by_id[agent_id]
+            for agent_id, result in self.test_results.items()
+            if result.get("status") == "success" and agent_id in agents_by_id
+        ]
+        if not selected:
+            selected = agents
+
+        return [
+            (
+                agent.get("id", "unknown"),
+                f"{agent.get('name', 'Unknown')} - {agent.get('description', 'No description')}",
+            )
+            for agent in selected
+        ]
+
     def create_agent_test_section(self) -> ft.Column:
         """Agent接続テスト部分のUIを作成"""
         # Agent カード一覧を作成
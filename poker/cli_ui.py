@@ -591,14 +591,11 @@ class PokerUI:
                             )
 
                         # 判断理由の表示（LLMApiPlayerの場合）
-                        if hasattr(current_player, "last_decision_reasoning"):
-                            reasoning = getattr(
-                                current_player, "last_decision_reasoning", ""
+                        reasoning = current_player.last_decision_reasoning
+                        if reasoning:
+                            print(
+                                f"  {current_player.name}: {decision['action']} - {reasoning[:80]}..."
                             )
-                            if reasoning:
-                                print(
-                                    f"  {current_player.name}: {decision['action']} - {reasoning[:80]}..."
-                                )
 
                         # 短い待機時間
                         time.sleep(0.1)  # エージェントモードでは少し長めに
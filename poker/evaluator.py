@@ -4,8 +4,16 @@ Poker hand evaluation system
 
 from typing import List, Tuple, Optional
 from enum import Enum
-from collections import Counter
 from .game_models import Card
+from .evaluator_lut import (
+    KICKERS,
+    best_hand,
+    card_code,
+    category,
+    evaluate5,
+    evaluate_batch,
+    has_straight,
+)
 
 
 class HandRank(Enum):
@@ -26,6 +34,8 @@ class HandRank(Enum):
 class HandResult:
     """ハンド評価結果"""
 
+    __slots__ = ("rank", "cards", "kickers", "description", "key")
+
     def __init__(
         self,
         rank: HandRank,
@@ -37,22 +47,19 @@ class HandResult:
         self.cards = cards  # ハンドを構成する5枚のカード
         self.kickers = kickers or []  # 同じランクの場合の比較用
         self.description = description
+        # 役と最大5枚のキッカーを4ビットずつ詰めた比較用の整数（大きいほど強い）
+        key = rank.value
+        for i in range(5):
+            key = key << 4 | (self.kickers[i] if i < len(self.kickers) else 0)
+        self.key = key
 
     def __lt__(self, other):
         """ハンドの強さを比較（弱い方がTrue）"""
-        if self.rank.value != other.rank.value:
-            return self.rank.value < other.rank.value
-
-        # 同じランクの場合はキッカーで比較
-        for my_kicker, other_kicker in zip(self.kickers, other.kickers):
-            if my_kicker != other_kicker:
-                return my_kicker < other_kicker
-
-        return False  # 同じ強さ
+        return self.key < other.key
 
     def __eq__(self, other):
         """ハンドの強さが同じかチェック"""
-        return self.rank == other.rank and self.kickers == other.kickers
+        return self.key == other.key
 
     def __str__(self):
         return f"{self.description} - {', '.join(str(card) for card in self.cards)}"
@@ -87,20 +94,33 @@ class HandEvaluator:
                 f"High Card: {sorted_cards[0]}",
             )
 
-        # 7枚から最強の5枚の組み合わせを探す
-        from itertools import combinations
+        # 7枚から最強の5枚の組み合わせを探す（同じカード構成の結果はキャッシュ済み）
+        by_bit = {card.bit: card for card in all_cards}
+        value, best_bits = best_hand(sum(by_bit))
+
+        return HandEvaluator._result_from_value(
+            value, [by_bit[bit] for bit in best_bits]
+        )
+
+    @staticmethod
+    def evaluate_batch(hole_cards, board):
+        """
+        モンテカルロ等で多数のハンドをまとめて評価
+
+        Args:
+            hole_cards: カード番号（0..51）の (N, 2) uint8 配列
+            board: カード番号の (N, 3..5) uint8 配列
 
-        best_hand = None
-        for five_cards in combinations(all_cards, 5):
-            hand_result = HandEvaluator._evaluate_five_cards(list(five_cards))
-            if (
-                best_hand is None
-                or hand_result.rank.value > best_hand.rank.value
-                or (hand_result.rank == best_hand.rank and not hand_result < best_hand)
-            ):
-                best_hand = hand_result
+        Returns:
+            各ハンドの評価値（1..7462、小さいほど強い）。
+            役は HandEvaluator.rank_of_value で求められる
+        """
+        return evaluate_batch(hole_cards, board)
 
-        return best_hand
+    @staticmethod
+    def rank_of_value(value: int) -> HandRank:
+        """評価値から役を求める"""
+        return HandRank(category(int(value)))
 
     @staticmethod
     def _evaluate_five_cards(cards: List[Card]) -> HandResult:
@@ -108,135 +128,57 @@ class HandEvaluator:
         if len(cards) != 5:
             raise ValueError("Must evaluate exactly 5 cards")
 
-        # カードをランク順にソート（降順）
-        sorted_cards = sorted(cards, key=lambda c: c.rank, reverse=True)
-        ranks = [c.rank for c in sorted_cards]
-        suits = [c.suit for c in sorted_cards]
-
-        # 各ランクの枚数をカウント
-        rank_counts = Counter(ranks)
-        count_values = sorted(rank_counts.values(), reverse=True)
-
-        # フラッシュとストレートをチェック
-        is_flush = len(set(suits)) == 1
-        is_straight = HandEvaluator._is_straight(ranks)
-
-        # ロイヤルフラッシュ
-        if is_flush and is_straight and ranks[0] == 14:  # A-K-Q-J-10
-            return HandResult(HandRank.ROYAL_FLUSH, sorted_cards, [14], "Royal Flush")
-
-        # ストレートフラッシュ
-        if is_flush and is_straight:
-            high_card = ranks[0] if ranks != [14, 5, 4, 3, 2] else 5  # A-5 straight
-            return HandResult(
-                HandRank.STRAIGHT_FLUSH,
-                sorted_cards,
-                [high_card],
-                f"Straight Flush: {sorted_cards[0]}-high",
-            )
-
-        # フォーカード
-        if count_values == [4, 1]:
-            four_rank = [rank for rank, count in rank_counts.items() if count == 4][0]
-            kicker = [rank for rank, count in rank_counts.items() if count == 1][0]
-            return HandResult(
-                HandRank.FOUR_OF_A_KIND,
-                sorted_cards,
-                [four_rank, kicker],
-                f"Four of a Kind: {Card.RANK_NAMES[four_rank]}s",
-            )
-
-        # フルハウス
-        if count_values == [3, 2]:
-            three_rank = [rank for rank, count in rank_counts.items() if count == 3][0]
-            pair_rank = [rank for rank, count in rank_counts.items() if count == 2][0]
-            return HandResult(
-                HandRank.FULL_HOUSE,
-                sorted_cards,
-                [three_rank, pair_rank],
-                f"Full House: {Card.RANK_NAMES[three_rank]}s over {Card.RANK_NAMES[pair_rank]}s",
-            )
-
-        # フラッシュ
-        if is_flush:
-            return HandResult(
-                HandRank.FLUSH, sorted_cards, ranks, f"Flush: {sorted_cards[0]}-high"
-            )
-
-        # ストレート
-        if is_straight:
-            high_card = ranks[0] if ranks != [14, 5, 4, 3, 2] else 5  # A-5 straight
-            return HandResult(
-                HandRank.STRAIGHT,
-                sorted_cards,
-                [high_card],
-                f"Straight: {Card.RANK_NAMES[high_card]}-high",
-            )
-
-        # スリーカード
-        if count_values == [3, 1, 1]:
-            three_rank = [rank for rank, count in rank_counts.items() if count == 3][0]
-            kickers = sorted(
-                [rank for rank, count in rank_counts.items() if count == 1],
-                reverse=True,
-            )
-            return HandResult(
-                HandRank.THREE_OF_A_KIND,
-                sorted_cards,
-                [three_rank] + kickers,
-                f"Three of a Kind: {Card.RANK_NAMES[three_rank]}s",
-            )
+        return HandEvaluator._result_from_value(
+            evaluate5(*(card_code(card) for card in cards)), cards
+        )
 
-        # ツーペア
-        if count_values == [2, 2, 1]:
-            pairs = sorted(
-                [rank for rank, count in rank_counts.items() if count == 2],
-                reverse=True,
-            )
-            kicker = [rank for rank, count in rank_counts.items() if count == 1][0]
-            return HandResult(
-                HandRank.TWO_PAIR,
-                sorted_cards,
-                pairs + [kicker],
-                f"Two Pair: {Card.RANK_NAMES[pairs[0]]}s and {Card.RANK_NAMES[pairs[1]]}s",
-            )
+    @staticmethod
+    def _result_from_value(value: int, cards: List[Card]) -> HandResult:
+        """ルックアップテーブルの評価値から HandResult を組み立てる"""
+        rank = HandRank(category(value))
+        kickers = list(KICKERS[value])
+        sorted_cards = sorted(cards, key=lambda c: c.rank, reverse=True)
 
-        # ワンペア
-        if count_values == [2, 1, 1, 1]:
-            pair_rank = [rank for rank, count in rank_counts.items() if count == 2][0]
-            kickers = sorted(
-                [rank for rank, count in rank_counts.items() if count == 1],
-                reverse=True,
+        if rank == HandRank.ROYAL_FLUSH:
+            description = "Royal Flush"
+        elif rank == HandRank.STRAIGHT_FLUSH:
+            description = f"Straight Flush: {sorted_cards[0]}-high"
+        elif rank == HandRank.FOUR_OF_A_KIND:
+            description = f"Four of a Kind: {Card.RANK_NAMES[kickers[0]]}s"
+        elif rank == HandRank.FULL_HOUSE:
+            description = (
+                f"Full House: {Card.RANK_NAMES[kickers[0]]}s"
+                f" over {Card.RANK_NAMES[kickers[1]]}s"
             )
-            return HandResult(
-                HandRank.ONE_PAIR,
-                sorted_cards,
-                [pair_rank] + kickers,
-                f"One Pair: {Card.RANK_NAMES[pair_rank]}s",
+        elif rank == HandRank.FLUSH:
+            description = f"Flush: {sorted_cards[0]}-high"
+        elif rank == HandRank.STRAIGHT:
+            description = f"Straight: {Card.RANK_NAMES[kickers[0]]}-high"
+        elif rank == HandRank.THREE_OF_A_KIND:
+            description = f"Three of a Kind: {Card.RANK_NAMES[kickers[0]]}s"
+        elif rank == HandRank.TWO_PAIR:
+            description = (
+                f"Two Pair: {Card.RANK_NAMES[kickers[0]]}s"
+                f" and {Card.RANK_NAMES[kickers[1]]}s"
             )
+        elif rank == HandRank.ONE_PAIR:
+            description = f"One Pair: {Card.RANK_NAMES[kickers[0]]}s"
+        else:
+            description = f"High Card: {sorted_cards[0]}"
 
-        # ハイカード
-        return HandResult(
-            HandRank.HIGH_CARD, sorted_cards, ranks, f"High Card: {sorted_cards[0]}"
-        )
+        return HandResult(rank, sorted_cards, kickers, description)
 
     @staticmethod
     def _is_straight(ranks: List[int]) -> bool:
         """ストレートかどうかをチェック"""
-        sorted_ranks = sorted(set(ranks), reverse=True)
-
-        if len(sorted_ranks) != 5:
-            return False
+        bits = 0
+        for rank in ranks:
+            bit = 1 << (rank - 2)
+            if bits & bit:
+                return False  # 同じランクがある
+            bits |= bit
 
-        # 通常のストレート
-        if sorted_ranks[0] - sorted_ranks[4] == 4:
-            return True
-
-        # A-5ストレート（A, 5, 4, 3, 2）
-        if sorted_ranks == [14, 5, 4, 3, 2]:
-            return True
-
-        return False
+        return len(ranks) == 5 and has_straight(bits)
 
     @staticmethod
     def compare_hands(hand1: HandResult, hand2: HandResult) -> int:
@@ -248,18 +190,7 @@ class HandEvaluator:
             -1: hand2が勝ち
             0: 引き分け
         """
-        if hand1.rank.value > hand2.rank.value:
-            return 1
-        elif hand1.rank.value < hand2.rank.value:
-            return -1
-        else:
-            # 同じランクの場合はキッカーで比較
-            for k1, k2 in zip(hand1.kickers, hand2.kickers):
-                if k1 > k2:
-                    return 1
-                elif k1 < k2:
-                    return -1
-            return 0  # 完全に同じ
+        return (hand1.key > hand2.key) - (hand1.key < hand2.key)
 
     @staticmethod
     def get_hand_strength_description(hand: HandResult) -> str:
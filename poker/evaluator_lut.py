@@ -0,0 +1,282 @@
+"""
+Cactus Kev style 5-card hand lookup tables
+
+The tables are built once at import time. Every 5-card hand maps to an
+equivalence class value in 1..7462, where 1 is a royal flush and 7462 is
+7-5-4-3-2 offsuit (smaller is stronger).
+"""
+
+from itertools import combinations
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+from .game_models import Card, Suit
+
+try:
+    # NumPy is optional; evaluate_batch falls back to a plain loop without it.
+    import numpy as np
+except ImportError:
+    np = None
+
+# 2..A の各ランクに割り当てる素数
+PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+SUIT_BITS = {
+    Suit.SPADES: 0x1000,
+    Suit.HEARTS: 0x2000,
+    Suit.DIAMONDS: 0x4000,
+    Suit.CLUBS: 0x8000,
+}
+
+WORST_VALUE = 7462
+
+# 各役の最後（最も弱い）の値。HandRank.value との対応は _CATEGORIES を参照
+_CATEGORY_LIMITS = (1, 10, 166, 322, 1599, 1609, 2467, 3325, 6185, 7462)
+_CATEGORIES = (10, 9, 8, 7, 6, 5, 4, 3, 2, 1)
+
+_RANKS_DESC = tuple(range(14, 1, -1))
+# A-5 ストレートは 5 ハイとして扱う
+_STRAIGHTS = tuple(
+    (high, high - 1, high - 2, high - 3, high - 4) for high in range(14, 5, -1)
+) + (
+    (5, 4, 3, 2, 14),
+)
+
+
+def _rank_bits(ranks) -> int:
+    bits = 0
+    for rank in ranks:
+        bits |= 1 << (rank - 2)
+    return bits
+
+
+def _prime_product(ranks) -> int:
+    product = 1
+    for rank in ranks:
+        product *= PRIMES[rank - 2]
+    return product
+
+
+def encode(rank: int, suit: Suit) -> int:
+    """カードを Cactus Kev 形式の整数に変換（xxxbbbbb bbbbbbbb cdhsrrrr xxpppppp）"""
+    return (
+        (1 << (rank - 2)) << 16 | SUIT_BITS[suit] | (rank - 2) << 8 | PRIMES[rank - 2]
+    )
+
+
+def _build_tables():
+    flushes = [0] * 8192
+    unique5 = [0] * 8192
+    products: Dict[int, int] = {}
+    # 値ごとのキッカー（インデックス0は未使用）
+    kickers: List[Tuple[int, ...]] = [()]
+
+    def add(table, key, kicker_ranks):
+        table[key] = len(kickers)
+        kickers.append(kicker_ranks)
+
+    straight_bits = {_rank_bits(ranks) for ranks in _STRAIGHTS}
+    # 強い順に並んだ、ストレートにならない5ランクの組み合わせ
+    high_cards = [
+        ranks
+        for ranks in combinations(_RANKS_DESC, 5)
+        if _rank_bits(ranks) not in straight_bits
+    ]
+
+    # ストレートフラッシュ（ロイヤルフラッシュを含む）
+    for ranks in _STRAIGHTS:
+        add(flushes, _rank_bits(ranks), (ranks[0],))
+
+    # フォーカード
+    for quad in _RANKS_DESC:
+        for kicker in _RANKS_DESC:
+            if kicker != quad:
+                add(
+                    products, PRIMES[quad - 2] ** 4 * PRIMES[kicker - 2], (quad, kicker)
+                )
+
+    # フルハウス
+    for trips in _RANKS_DESC:
+        for pair in _RANKS_DESC:
+            if pair != trips:
+                add(
+                    products,
+                    PRIMES[trips - 2] ** 3 * PRIMES[pair - 2] ** 2,
+                    (trips, pair),
+                )
+
+    # フラッシュ
+    for ranks in high_cards:
+        add(flushes, _rank_bits(ranks), ranks)
+
+    # ストレート
+    for ranks in _STRAIGHTS:
+        add(unique5, _rank_bits(ranks), (ranks[0],))
+
+    # スリーカード
+    for trips in _RANKS_DESC:
+        others = [rank for rank in _RANKS_DESC if rank != trips]
+        for rest in combinations(others, 2):
+            add(
+                products,
+                PRIMES[trips - 2] ** 3 * _prime_product(rest),
+                (trips,) + rest,
+            )
+
+    # ツーペア
+    for high, low in combinations(_RANKS_DESC, 2):
+        for kicker in _RANKS_DESC:
+            if kicker != high and kicker != low:
+                add(
+                    products,
+                    PRIMES[high - 2] ** 2 * PRIMES[low - 2] ** 2 * PRIMES[kicker - 2],
+                    (high, low, kicker),
+                )
+
+    # ワンペア
+    for pair in _RANKS_DESC:
+        others = [rank for rank in _RANKS_DESC if rank != pair]
+        for rest in combinations(others, 3):
+            add(
+                products,
+                PRIMES[pair - 2] ** 2 * _prime_product(rest),
+                (pair,) + rest,
+            )
+
+    # ハイカード
+    for ranks in high_cards:
+        add(unique5, _rank_bits(ranks), ranks)
+
+    assert len(kickers) - 1 == WORST_VALUE
+    return flushes, unique5, products, kickers
+
+
+FLUSHES, UNIQUE5, PRODUCTS, KICKERS = _build_tables()
+
+
+# Card.bit から Cactus Kev 形式の整数への対応表
+_CARD_CODES = {
+    Card(rank, suit).bit: encode(rank, suit) for suit in Suit for rank in range(2, 15)
+}
+
+# カード番号（0..51、Card.bit のビット位置）から Cactus Kev 形式の整数への対応表
+INDEX_CODES = tuple(code for _, code in sorted(_CARD_CODES.items()))
+
+# A-2-3-4-5 のランクビット
+WHEEL_MASK = 0x100F
+
+
+def card_code(card: Card) -> int:
+    """Card を Cactus Kev 形式の整数に変換"""
+    return _CARD_CODES[card.bit]
+
+
+def card_index(card: Card) -> int:
+    """Card をカード番号（0..51）に変換"""
+    return card.bit.bit_length() - 1
+
+
+def has_straight(ranks: int) -> bool:
+    """13ビットのランクマスクに5連続のランクがあるか"""
+    return bool(
+        ranks & ranks >> 1 & ranks >> 2 & ranks >> 3 & ranks >> 4
+        or ranks & WHEEL_MASK == WHEEL_MASK
+    )
+
+
+def evaluate5(c1: int, c2: int, c3: int, c4: int, c5: int) -> int:
+    """エンコード済みの5枚を評価して 1..7462 の値を返す（小さいほど強い）"""
+    q = (c1 | c2 | c3 | c4 | c5) >> 16
+    if c1 & c2 & c3 & c4 & c5 & 0xF000:
+        return FLUSHES[q]
+    value = UNIQUE5[q]
+    if value:
+        return value
+    return PRODUCTS[(c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF) * (c4 & 0xFF) * (c5 & 0xFF)]
+
+
+def category(value: int) -> int:
+    """評価値から HandRank.value に対応する役の番号を求める"""
+    return _CATEGORIES[bisect_left(_CATEGORY_LIMITS, value)]
+
+
+def best_value(codes) -> int:
+    """エンコード済みの5〜7枚から最も強い5枚の評価値を返す"""
+    return min(evaluate5(*five) for five in combinations(codes, 5))
+
+
+@lru_cache(maxsize=1 << 16)
+def best_hand(mask: int) -> Tuple[int, Tuple[int, ...]]:
+    """
+    ハンドマスク（Card.bit の OR）から最も強い5枚を探す
+
+    モンテカルロでは同じカード構成が繰り返し現れるためキャッシュする。
+
+    Returns:
+        (評価値, 最も強い5枚の Card.bit)
+    """
+    bits = []
+    while mask:
+        bit = mask & -mask
+        bits.append(bit)
+        mask ^= bit
+
+    # エンコードは1枚につき1回だけ行い、最後にビットへ戻す
+    bit_of = {_CARD_CODES[bit]: bit for bit in bits}
+    best = WORST_VALUE + 1
+    best_codes = ()
+    for five in combinations(bit_of, 5):
+        value = evaluate5(*five)
+        if value < best:
+            best = value
+            best_codes = five
+    return best, tuple(bit_of[code] for code in best_codes)
+
+
+if np is not None:
+    _NP_CODES = np.array(INDEX_CODES, dtype=np.int64)
+    _NP_FLUSHES = np.array(FLUSHES, dtype=np.int32)
+    _NP_UNIQUE5 = np.array(UNIQUE5, dtype=np.int32)
+    _NP_PRODUCT_KEYS = np.array(sorted(PRODUCTS), dtype=np.int64)
+    _NP_PRODUCT_VALUES = np.array(
+        [PRODUCTS[key] for key in _NP_PRODUCT_KEYS.tolist()], dtype=np.int32
+    )
+    # n 枚から5枚を選ぶ組み合わせのインデックス表（7枚なら (21, 5)）
+    _FIVE_OF = {
+        n: np.array(list(combinations(range(n), 5)), dtype=np.intp) for n in (5, 6, 7)
+    }
+
+
+def evaluate_batch(hole_cards, board):
+    """
+    多数のハンドをまとめて評価
+
+    Args:
+        hole_cards: カード番号の (N, 2) 配列
+        board: カード番号の (N, 3..5) 配列
+
+    Returns:
+        各行の評価値（NumPy があれば np.int32 配列、なければ list）
+    """
+    if np is None:
+        return [
+            best_value([INDEX_CODES[i] for i in (*hole, *row)])
+            for hole, row in zip(hole_cards, board)
+        ]
+
+    codes = _NP_CODES[np.concatenate((hole_cards, board), axis=1)]
+    # 全行の全組み合わせを一度に取り出す: (N, 組み合わせ数, 5)
+    subsets = codes[:, _FIVE_OF[codes.shape[1]]]
+    q = np.bitwise_or.reduce(subsets, axis=2) >> 16
+    flush = np.bitwise_and.reduce(subsets, axis=2) & 0xF000
+    values = np.where(flush != 0, _NP_FLUSHES[q], _NP_UNIQUE5[q])
+    # ペアを含むハンドは素数の積をソート済みテーブルから二分探索する
+    paired = values == 0
+    if paired.any():
+        primes = subsets[paired] & 0xFF
+        products = (
+            primes[:, 0] * primes[:, 1] * primes[:, 2] * primes[:, 3] * primes[:, 4]
+        )
+        values[paired] = _NP_PRODUCT_VALUES[np.searchsorted(_NP_PRODUCT_KEYS, products)]
+    return values.min(axis=1)
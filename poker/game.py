@@ -5,10 +5,11 @@ Texas Hold'em Poker Game Management
 import json
 import random
 import logging
+import functools
 from typing import List, Dict, Any, Optional, Tuple
 from enum import Enum
 
-from .game_models import Deck, GamePhase, GameState, PlayerInfo
+from .game_models import ActionRecord, Deck, GamePhase, GameState, PlayerInfo
 from .player_models import (
     Player,
     HumanPlayer,
@@ -34,6 +35,22 @@ if not game_logger.handlers:
     game_logger.addHandler(handler)
 
 
+def _bumps_state_version(method):
+    """ゲーム状態を変更するメソッドの完了後にstate_versionを進めるデコレータ
+
+    観戦用サーバーはstate_versionが変わらない間、JSONをキャッシュして使い回す
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.state_version += 1
+
+    return wrapper
+
+
 class PokerGame:
     """テキサスホールデムゲーム管理クラス"""
 
@@ -46,7 +63,13 @@ class PokerGame:
 
         # プレイヤー管理
         self.players: List[Player] = []
+        # LLMApiPlayerだけを登録順に保持（観戦UIが毎回型判定しなくて済むように）
+        self.llm_api_players: List[LLMApiPlayer] = []
+        # IDからプレイヤーを引く索引（get_playerでリストを走査しないように）
+        self._players_by_id: Dict[int, Player] = {}
         self.dealer_button = 0
+        # ビッグブラインドの座席（ブラインド投稿時に記録し、毎回フラグを走査しない）
+        self.big_blind_index: Optional[int] = None
         self.current_player_index = 0
 
         # ゲーム状態
@@ -63,8 +86,10 @@ class PokerGame:
         # このベッティングラウンドでブラインド以外の「ベット/レイズ」が発生したか
         self.has_bet_or_raise_this_round = False
 
-        # アクション履歴
+        # アクション履歴（表示・LLM向けの文字列）
         self.action_history = []
+        # プレイヤーごとの最新アクション
+        self.last_action_by_player: Dict[int, ActionRecord] = {}
 
         # ゲーム統計
         self.game_stats = {"hands_played": 0, "players_eliminated": []}
@@ -75,6 +100,11 @@ class PokerGame:
         # 最後に実行したショーダウン結果（観戦UI向けに公開するため）
         self.last_showdown_results: Optional[Dict[str, Any]] = None
 
+        # 状態が変わるたびに増える番号（観戦UI向けキャッシュのキー）
+        self.state_version = 0
+        # プレイヤーIDごとの (state_version, GameState)。状態が変わるまで使い回す
+        self._llm_state_cache: Dict[int, Tuple[int, GameState]] = {}
+
         game_logger.info(
             "PokerGame initialized with SB=%d, BB=%d, initial_chips=%d",
             small_blind,
@@ -82,22 +112,25 @@ class PokerGame:
             initial_chips,
         )
 
+    @_bumps_state_version
     def add_player(self, player: Player):
         """プレイヤーを追加"""
         if len(self.players) >= 10:
             raise ValueError("Maximum 10 players allowed")
         self.players.append(player)
-        
+        # 同じIDが重複した場合は従来どおり先に追加したプレイヤーを返す
+        self._players_by_id.setdefault(player.id, player)
+        if isinstance(player, LLMApiPlayer):
+            self.llm_api_players.append(player)
+
         # 統計管理にプレイヤーを登録
         self.stats_manager.register_player(player.id, player.name)
 
     def get_player(self, player_id: int) -> Optional[Player]:
         """プレイヤーIDでプレイヤーを取得"""
-        for player in self.players:
-            if player.id == player_id:
-                return player
-        return None
+        return self._players_by_id.get(player_id)
 
+    @_bumps_state_version
     def setup_default_game(self):
         """デフォルトの4人ゲームをセットアップ"""
         self.add_player(HumanPlayer(0, "You", self.initial_chips))
@@ -108,6 +141,7 @@ class PokerGame:
         # ディーラーボタンをランダムに決定
         self.dealer_button = random.randint(0, 3)
 
+    @_bumps_state_version
     def setup_cpu_only_game(self):
         """全プレイヤーがCPU（ランダム）の4人ゲームをセットアップ"""
         self.add_player(RandomPlayer(0, "CPU0", self.initial_chips))
@@ -118,6 +152,7 @@ class PokerGame:
         # ディーラーボタンをランダムに決定
         self.dealer_button = random.randint(0, 3)
 
+    @_bumps_state_version
     def setup_configurable_game(self, player_types: List[str]):
         """
         カスタマイズ可能なゲームをセットアップ（2〜4人）
@@ -127,6 +162,10 @@ class PokerGame:
             raise ValueError("player_types must be a list of 2 to 10 strings")
 
         self.players = []
+        self.llm_api_players = []
+        self._players_by_id = {}
+        # 新しいプレイヤーは同じIDを再利用するため、前のゲームのアクションを残さない
+        self.last_action_by_player = {}
         for i, player_type in enumerate(player_types):
             if player_type == "human":
                 if i == 0:
@@ -143,6 +182,7 @@ class PokerGame:
         # ディーラーボタンをランダムに決定
         self.dealer_button = random.randint(0, len(self.players) - 1)
 
+    @_bumps_state_version
     def setup_configurable_game_with_models(self, player_configs: List[Dict[str, Any]]):
         """
         カスタマイズ可能なゲームをセットアップ（2〜4人、モデル・Agent指定対応）
@@ -152,6 +192,10 @@ class PokerGame:
             raise ValueError("player_configs must be a list of 2 to 10 dictionaries")
 
         self.players = []
+        self.llm_api_players = []
+        self._players_by_id = {}
+        # 新しいプレイヤーは同じIDを再利用するため、前のゲームのアクションを残さない
+        self.last_action_by_player = {}
         for i, config in enumerate(player_configs):
             player_type = config.get("type")
             model = config.get("model")
@@ -192,13 +236,15 @@ class PokerGame:
         # ディーラーボタンをランダムに決定
         self.dealer_button = random.randint(0, len(self.players) - 1)
 
+    @_bumps_state_version
     def start_new_hand(self):
         """新しいハンドを開始"""
         self.hand_number += 1
         game_logger.info(f"=== STARTING NEW HAND #{self.hand_number} ===")
 
         self.deck.reset()
-        self.community_cards = []
+        # リストは作り直さずに中身だけ空にして使い回す
+        self.community_cards.clear()
         self.current_phase = GamePhase.PREFLOP
         self.pot = 0
         self.current_bet = 0
@@ -211,6 +257,7 @@ class PokerGame:
         # プレイヤーをリセット
         for player in self.players:
             player.reset_for_new_hand()
+        self.big_blind_index = None
 
         # アクティブなプレイヤー数をチェック
         active_players = [p for p in self.players if p.status != PlayerStatus.BUSTED]
@@ -292,6 +339,7 @@ class PokerGame:
         self.action_history.append(f"Player {sb_pos} posted small blind {sb_amount}")
 
         self.players[bb_pos].is_big_blind = True
+        self.big_blind_index = bb_pos
         bb_amount = self.players[bb_pos].bet(self.big_blind)
         self.pot += bb_amount
         self.current_bet = bb_amount
@@ -347,6 +395,12 @@ class PokerGame:
         if player.status == PlayerStatus.BUSTED:
             raise ValueError(f"Player {player_id} is busted and cannot get game state")
 
+        # 前回の生成から状態が変わっていなければキャッシュのコピーを返す
+        # （呼び出し側が書き換えても次の呼び出しに影響しないように）
+        cached = self._llm_state_cache.get(player_id)
+        if cached is not None and cached[0] == self.state_version:
+            return cached[1].copy()
+
         # カードを視覚的な記号に変換
         your_cards = [str(card) for card in player.hole_cards]
         community = [str(card) for card in self.community_cards]
@@ -370,7 +424,7 @@ class PokerGame:
         # 最近のアクション履歴（最新20件）
         recent_history = self.action_history[-20:] if self.action_history else []
 
-        return GameState(
+        game_state = GameState(
             your_id=player_id,
             phase=self.current_phase.value,
             your_cards=your_cards,
@@ -386,6 +440,8 @@ class PokerGame:
             actions=actions,
             history=recent_history,
         )
+        self._llm_state_cache[player_id] = (self.state_version, game_state)
+        return game_state.copy()
 
     def _get_available_actions(self, player_id: int) -> List[str]:
         """プレイヤーが利用可能なアクションリストを取得"""
@@ -424,12 +480,7 @@ class PokerGame:
             and to_call == 0
             and self.current_bet == self.big_blind
         ):
-            bb_index = None
-            for i, p in enumerate(self.players):
-                if p.is_big_blind:
-                    bb_index = i
-                    break
-            is_big_blind_option = bb_index is not None and player_id == bb_index
+            is_big_blind_option = player_id == self.big_blind_index
 
         # 最低レイズ（総額）。オープンベット時はBB、既存ベットがある場合は current_bet + BB
         min_raise_total = (
@@ -453,6 +504,7 @@ class PokerGame:
 
         return actions
 
+    @_bumps_state_version
     def process_player_action(
         self, player_id: int, action: str, amount: int = 0
     ) -> bool:
@@ -488,6 +540,7 @@ class PokerGame:
         if action == "fold":
             player.fold()
             action_description = f"Player {player_id} folded"
+            last_action = ActionRecord(player_id, "fold", 0)
 
         elif action == "check":
             if self.current_bet > player.current_bet:
@@ -496,12 +549,14 @@ class PokerGame:
                 )
                 return False  # チェックできない状況
             action_description = f"Player {player_id} checked"
+            last_action = ActionRecord(player_id, "check", 0)
 
         elif action == "call":
             to_call = self.current_bet - player.current_bet
             # テキサスホールデムでは to_call == 0 のとき、"call" は実質的に "check" と同義
             if to_call <= 0:
                 action_description = f"Player {player_id} checked"
+                last_action = ActionRecord(player_id, "check", 0)
             else:
                 if player.chips < to_call:
                     game_logger.warning(
@@ -512,6 +567,7 @@ class PokerGame:
                 actual_call = player.bet(to_call)
                 self.pot += actual_call
                 action_description = f"Player {player_id} called {actual_call}"
+                last_action = ActionRecord(player_id, "call", actual_call)
 
         elif action == "raise":
             to_call = self.current_bet - player.current_bet
@@ -529,6 +585,7 @@ class PokerGame:
             self.last_raiser_index = player_id
             self.has_bet_or_raise_this_round = True
             action_description = f"Player {player_id} raised to {self.current_bet}"
+            last_action = ActionRecord(player_id, "raise", self.current_bet)
 
         elif action == "all_in":
             if player.chips <= 0:
@@ -548,6 +605,7 @@ class PokerGame:
 
             player.status = PlayerStatus.ALL_IN
             action_description = f"Player {player_id} went all-in with {actual_bet}"
+            last_action = ActionRecord(player_id, "all_in", actual_bet)
 
         else:
             game_logger.error(f"Unknown action: {action}")
@@ -555,6 +613,7 @@ class PokerGame:
 
         # アクション履歴に追加
         self.action_history.append(action_description)
+        self.last_action_by_player[player_id] = last_action
         game_logger.info(f"ACTION_EXECUTED: {action_description}")
         
         # 統計管理にアクションを記録
@@ -599,6 +658,7 @@ class PokerGame:
             
         self.stats_manager.record_action(player.id, action_type, phase, amount)
 
+    @_bumps_state_version
     def _advance_to_next_player(self):
         """次のアクティブプレイヤーに移動（座席順序を維持）"""
         game_logger.debug("_advance_to_next_player called")
@@ -756,12 +816,7 @@ class PokerGame:
         if self.current_phase == GamePhase.PREFLOP:
             # プリフロップでは、ビッグブラインドの次（UTG）が最初のアクター
             # 座席順序で探す
-            bb_index = None
-            for i, player in enumerate(self.players):
-                if player.is_big_blind:
-                    bb_index = i
-                    break
-
+            bb_index = self.big_blind_index
             if bb_index is not None:
                 # ビッグブラインドの次のアクティブプレイヤーを座席順序で探す
                 for i in range(1, len(self.players)):
@@ -793,6 +848,7 @@ class PokerGame:
 
         return None
 
+    @_bumps_state_version
     def advance_to_next_phase(self):
         """次のフェーズに進む"""
         game_logger.info(
@@ -933,6 +989,7 @@ class PokerGame:
             game_logger.warning("No active players - marking betting complete")
             self.betting_round_complete = True
 
+    @_bumps_state_version
     def conduct_showdown(self) -> Dict[str, Any]:
         """ショーダウンを実行して勝者を決定"""
         remaining_players = [
@@ -1032,19 +1089,14 @@ class PokerGame:
             game_logger.debug("Showdown logging (hands) failed: %s", e)
 
         # ハンドの強さでソート（強い順）
-        player_hands.sort(
-            key=lambda x: (x["hand"].rank.value, x["hand"].kickers), reverse=True
-        )
+        player_hands.sort(key=lambda x: x["hand"].key, reverse=True)
 
         # 勝者を決定（同じ強さの場合は分割）
         best_hand = player_hands[0]["hand"]
         winners = []
 
         for ph in player_hands:
-            if (
-                ph["hand"].rank == best_hand.rank
-                and ph["hand"].kickers == best_hand.kickers
-            ):
+            if ph["hand"] == best_hand:
                 winners.append(ph["player"])
             else:
                 break
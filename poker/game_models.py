@@ -3,9 +3,11 @@ Poker game models: Card, Deck, Suit classes and game state types
 """
 
 import random
+import re
 from typing import List, Dict, Any, Optional
 from enum import Enum
 from dataclasses import dataclass
+from functools import cached_property
 
 
 class Suit(Enum):
@@ -20,6 +22,8 @@ class Suit(Enum):
 class Card:
     """トランプカードクラス"""
 
+    __slots__ = ("rank", "suit", "bit", "_str")
+
     # スートの記号マップ
     SUIT_SYMBOLS = {
         Suit.HEARTS: "♥",
@@ -28,6 +32,14 @@ class Card:
         Suit.SPADES: "♠",
     }
 
+    # ビットマスク上のスート位置（1スートにつき13ビット）
+    SUIT_INDEX = {
+        Suit.HEARTS: 0,
+        Suit.DIAMONDS: 1,
+        Suit.CLUBS: 2,
+        Suit.SPADES: 3,
+    }
+
     # ランクの表記マップ
     RANK_NAMES = {
         2: "2",
@@ -55,6 +67,11 @@ class Card:
             raise ValueError("Rank must be between 2 and 14")
         self.rank = rank
         self.suit = suit
+        index = self.SUIT_INDEX[suit] * 13 + rank - 2
+        # 52ビットのハンドマスク上でこのカードを表すビット
+        self.bit = 1 << index
+        # カードは不変なので文字列表現は52枚分の表から引く
+        self._str = _CARD_STRINGS[index]
 
     @property
     def rank_name(self) -> str:
@@ -68,22 +85,39 @@ class Card:
 
     def __str__(self) -> str:
         """カードの文字列表現（例: A♠）"""
-        return f"{self.rank_name}{self.suit_symbol}"
+        return self._str
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, Card):
             return False
-        return self.rank == other.rank and self.suit == other.suit
+        return self.bit == other.bit
 
     def __hash__(self) -> int:
-        return hash((self.rank, self.suit))
+        return self.bit
 
     def __repr__(self) -> str:
         return f"Card({self.rank_name}, {self.suit.value})"
 
 
+# カード番号（スート位置 * 13 + ランク - 2）ごとの文字列表現（例: A♠）
+_CARD_STRINGS = tuple(
+    f"{Card.RANK_NAMES[rank]}{Card.SUIT_SYMBOLS[suit]}"
+    for suit in sorted(Card.SUIT_INDEX, key=Card.SUIT_INDEX.get)
+    for rank in range(2, 15)
+)
+
+# 全52枚（Deck.reset のたびに Card を作り直さないように共有する）
+_FULL_DECK = tuple(Card(rank, suit) for suit in Suit for rank in range(2, 15))
+
+
 class Deck:
-    """トランプデッキクラス"""
+    """
+    トランプデッキクラス
+
+    cards は未配布のカードの集合で、並び順に意味はない（reset 直後は
+    スート・ランク順）。無作為化は deal_card だけが行い、残りから1枚を
+    一様に選んで配るため、事前のシャッフルは不要。
+    """
 
     def __init__(self):
         """標準的な52枚のデッキを作成"""
@@ -92,21 +126,18 @@ class Deck:
 
     def reset(self):
         """デッキをリセットして全カードを追加"""
-        self.cards = []
-        for suit in Suit:
-            for rank in range(2, 15):  # 2-14 (A)
-                self.cards.append(Card(rank, suit))
-        self.shuffle()
-
-    def shuffle(self):
-        """デッキをシャッフル"""
-        random.shuffle(self.cards)
+        # カードは不変なので52枚は使い回し、並べ替えは配るときに1枚ずつ行う
+        self.cards[:] = _FULL_DECK
 
     def deal_card(self) -> Card:
         """カードを1枚配る"""
-        if not self.cards:
+        cards = self.cards
+        if not cards:
             raise ValueError("Cannot deal from empty deck")
-        return self.cards.pop()
+        # 残りから1枚を無作為に選んで末尾と入れ替える（部分的な Fisher-Yates）
+        j = random.randrange(len(cards))
+        cards[j], cards[-1] = cards[-1], cards[j]
+        return cards.pop()
 
     def cards_remaining(self) -> int:
         """残りカード数を取得"""
@@ -134,6 +165,55 @@ class PlayerInfo:
     status: str
 
 
+@dataclass(frozen=True, slots=True)
+class ActionRecord:
+    """プレイヤーのアクション1件の構造化記録"""
+
+    player_id: int
+    action: str  # fold / check / call / raise / all_in
+    amount: int = 0
+
+
+# "fold" / "check" / "call (20)" / "raise (min 40)" / "all-in (970)" 形式のアクション文字列
+_ACTION_PATTERN = re.compile(
+    r"(?P<kind>fold|check|call|raise|all-in)(?: \((?:min )?(?P<amount>\d+)\))?"
+)
+
+
+@dataclass(slots=True)
+class AvailableActions:
+    """利用可能なアクション文字列を構造化したもの"""
+
+    can_fold: bool = False
+    can_check: bool = False
+    call_amount: Optional[int] = None
+    min_raise: Optional[int] = None
+    can_allin: bool = False
+
+    @classmethod
+    def from_strings(cls, actions: List[str]) -> "AvailableActions":
+        """アクション文字列のリストから作成"""
+        parsed = cls()
+        for action in actions:
+            match = _ACTION_PATTERN.fullmatch(action)
+            if match is None:
+                continue
+            kind = match.group("kind")
+            if kind == "fold":
+                parsed.can_fold = True
+            elif kind == "check":
+                parsed.can_check = True
+            elif kind == "call":
+                if match.group("amount") is not None:
+                    parsed.call_amount = int(match.group("amount"))
+            elif kind == "raise":
+                if match.group("amount") is not None:
+                    parsed.min_raise = int(match.group("amount"))
+            else:
+                parsed.can_allin = True
+        return parsed
+
+
 @dataclass
 class GameState:
     """LLMプレイヤー用のゲーム状態"""
@@ -153,6 +233,38 @@ class GameState:
     actions: List[str]
     history: List[str]
 
+    @cached_property
+    def parsed_actions(self) -> AvailableActions:
+        """actionsを一度だけパースした構造化表現"""
+        return AvailableActions.from_strings(self.actions)
+
+    @cached_property
+    def as_dict(self) -> Dict[str, Any]:
+        """to_dictの結果をキャッシュしたもの（読み取り専用として扱う）"""
+        return self.to_dict()
+
+    def copy(self) -> "GameState":
+        """リストとプレイヤー情報を複製した独立なコピー（キャッシュは引き継がない）"""
+        return GameState(
+            your_id=self.your_id,
+            phase=self.phase,
+            your_cards=list(self.your_cards),
+            community=list(self.community),
+            your_chips=self.your_chips,
+            your_bet_this_round=self.your_bet_this_round,
+            your_total_bet_this_hand=self.your_total_bet_this_hand,
+            pot=self.pot,
+            to_call=self.to_call,
+            dealer_button=self.dealer_button,
+            current_turn=self.current_turn,
+            players=[
+                PlayerInfo(id=p.id, chips=p.chips, bet=p.bet, status=p.status)
+                for p in self.players
+            ],
+            actions=list(self.actions),
+            history=list(self.history),
+        )
+
     def to_dict(self) -> Dict[str, Any]:
         """辞書形式に変換"""
         return {
@@ -26,6 +26,14 @@ from google.adk.sessions import InMemorySessionService
 from google.genai import types
 from dotenv import load_dotenv
 
+try:
+    # orjsonがあれば高速なJSONデコードを使う（任意依存）
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 load_dotenv()
 
 
@@ -38,9 +46,83 @@ class PlayerStatus(Enum):
     BUSTED = "busted"
 
 
+def _balanced_object_end(text: str, start: int) -> int:
+    """text[start] の { に対応する } の位置を返す（対応しなければ -1）
+
+    文字列リテラル（エスケープ含む）内の波括弧は数えない
+    """
+    depth = 0
+    in_string = False
+    escape = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return i
+    return -1
+
+
+def _extract_json_object(text: str) -> Optional[str]:
+    """
+    テキストから "action" キーを持つ最初のJSONオブジェクトを抜き出す
+
+    波括弧の対応は文字列リテラルを考慮して追うため、reasoning内に { や } が
+    含まれていても正しく切り出せる。"action" キーを持たないオブジェクトは
+    読み飛ばし、その内側（{"decision": {"action": ...}} など）と後ろを探す
+
+    Args:
+        text: LLMからの応答文字列
+
+    Returns:
+        JSONオブジェクト部分の文字列（見つからない場合はNone）
+    """
+    if '"action"' not in text:
+        return None
+
+    start = text.find("{")
+    while start != -1:
+        end = _balanced_object_end(text, start)
+        if end != -1:
+            candidate = text[start : end + 1]
+            try:
+                obj = _json_loads(candidate)
+            except ValueError:
+                obj = None
+            if isinstance(obj, dict) and "action" in obj:
+                return candidate
+        start = text.find("{", start + 1)
+    return None
+
+
 class Player(ABC):
     """プレイヤー抽象基底クラス"""
 
+    __slots__ = (
+        "id",
+        "name",
+        "chips",
+        "hole_cards",
+        "current_bet",
+        "total_bet_this_hand",
+        "status",
+        "is_dealer",
+        "is_small_blind",
+        "is_big_blind",
+        "last_decision_reasoning",
+    )
+
     def __init__(self, player_id: int, name: str, initial_chips: int = 1000):
         self.id = player_id
         self.name = name
@@ -52,10 +134,11 @@ class Player(ABC):
         self.is_dealer = False
         self.is_small_blind = False
         self.is_big_blind = False
+        self.last_decision_reasoning = ""  # 最後の判断理由を保存
 
     def reset_for_new_hand(self):
         """新しいハンド用にリセット"""
-        self.hole_cards = []
+        self.hole_cards.clear()
         self.current_bet = 0
         self.total_bet_this_hand = 0
         if self.chips > 0:
@@ -65,6 +148,7 @@ class Player(ABC):
         self.is_dealer = False
         self.is_small_blind = False
         self.is_big_blind = False
+        self.last_decision_reasoning = ""
 
     def reset_for_new_betting_round(self):
         """新しいベッティングラウンド用にリセット"""
@@ -96,6 +180,14 @@ class Player(ABC):
         """フォールドする"""
         self.status = PlayerStatus.FOLDED
 
+    def get_last_reasoning(self) -> str:
+        """最後の判断理由を取得"""
+        return (
+            self.last_decision_reasoning
+            if self.last_decision_reasoning
+            else "理由が記録されていません"
+        )
+
     def can_bet(self, amount: int) -> bool:
         """指定した額をベットできるかチェック"""
         return self.chips >= amount and self.status == PlayerStatus.ACTIVE
@@ -168,14 +260,11 @@ class Player(ABC):
             else:
                 logger.debug(f"[{self.name}] No markdown code block detected")
 
-            json_match = re.search(
-                r'\{[^}]*"action"[^}]*\}', cleaned_response, re.DOTALL
-            )
-            if json_match:
-                json_str = json_match.group()
+            json_str = _extract_json_object(cleaned_response)
+            if json_str is not None:
                 logger.debug(f"[{self.name}] JSON pattern found: {json_str}")
 
-                decision = json.loads(json_str)
+                decision = _json_loads(json_str)
                 logger.debug(f"[{self.name}] JSON parsing successful: {decision}")
 
                 # バリデーション
@@ -187,9 +276,8 @@ class Player(ABC):
                     f"[{self.name}] Extracted values - action: '{action}', amount: {amount}"
                 )
 
-                # 理由を保存（last_decision_reasoningがある場合のみ）
-                if hasattr(self, "last_decision_reasoning"):
-                    self.last_decision_reasoning = reasoning
+                # 理由を保存
+                self.last_decision_reasoning = reasoning
 
                 # アクションの正規化
                 if action in ["fold", "check"]:
@@ -198,26 +286,16 @@ class Player(ABC):
                         f"[{self.name}] Action '{action}' normalized - amount set to 0"
                     )
                 elif action == "call":
-                    # コール額を計算
-                    available_actions = game_state.actions
+                    # コール額をゲーム状態から取得
+                    call_amount = game_state.parsed_actions.call_amount
                     logger.debug(
-                        f"[{self.name}] Processing call action - available actions: {available_actions}"
+                        f"[{self.name}] Processing call action - available actions: {game_state.actions}"
                     )
-                    original_amount = amount
-                    for act in available_actions:
-                        if "call" in str(act).lower():
-                            # "call (20)" のような形式から金額を抽出
-                            call_match = re.search(r"call.*\((\d+)\)", str(act))
-                            if call_match:
-                                amount = int(call_match.group(1))
-                                logger.debug(
-                                    f"[{self.name}] Call amount extracted from '{act}': {amount}"
-                                )
-                            break
-                    if original_amount != amount:
+                    if call_amount is not None and call_amount != amount:
                         logger.debug(
-                            f"[{self.name}] Call amount adjusted from {original_amount} to {amount}"
+                            f"[{self.name}] Call amount adjusted from {amount} to {call_amount}"
                         )
+                        amount = call_amount
                 elif action == "all_in" or action == "all-in":
                     original_action = action
                     action = "all_in"
@@ -227,22 +305,10 @@ class Player(ABC):
                     )
                 elif action == "raise":
                     # 最低レイズ額をゲーム状態から取得
-                    min_raise = 0
-                    available_actions = game_state.actions
+                    min_raise = game_state.parsed_actions.min_raise or 0
                     logger.debug(
-                        f"[{self.name}] Processing raise action - available actions: {available_actions}"
+                        f"[{self.name}] Processing raise action - available actions: {game_state.actions}"
                     )
-                    original_amount = amount
-                    for act in available_actions:
-                        if "raise" in str(act).lower():
-                            # "raise (min 40)" のような形式から最低額を抽出
-                            raise_match = re.search(r"raise.*min (\d+)", str(act))
-                            if raise_match:
-                                min_raise = int(raise_match.group(1))
-                                logger.debug(
-                                    f"[{self.name}] Minimum raise amount extracted from '{act}': {min_raise}"
-                                )
-                                break
 
                     # 最低レイズ額を下回る場合のみ調整
                     if min_raise > 0 and amount < min_raise:
@@ -279,10 +345,9 @@ class Player(ABC):
             )
 
         # パースに失敗した場合はフォールド
-        if hasattr(self, "last_decision_reasoning"):
-            self.last_decision_reasoning = (
-                "レスポンスのパースに失敗したため、フォールドします"
-            )
+        self.last_decision_reasoning = (
+            "レスポンスのパースに失敗したため、フォールドします"
+        )
         return {"action": "fold", "amount": 0}
 
     def __str__(self) -> str:
@@ -292,6 +357,8 @@ class Player(ABC):
 class HumanPlayer(Player):
     """人間プレイヤークラス"""
 
+    __slots__ = ()
+
     def make_decision(self, game_state: GameState) -> Dict[str, Any]:
         """
         人間プレイヤーの場合、UIから入力を受け取る
@@ -301,13 +368,70 @@ class HumanPlayer(Player):
         raise NotImplementedError("Human player decisions are handled by UI layer")
 
 
+def _random_fallback_decision(game_state: GameState, chips: int) -> Dict[str, Any]:
+    """
+    利用可能なアクションから重み付きランダムで意思決定する
+
+    RandomPlayer本体と、LLMプレイヤーのフォールバック経路で共有する
+    （フォールバックのたびにRandomPlayerを生成しないため）
+
+    Args:
+        game_state: 型安全なゲーム状態オブジェクト
+        chips: 意思決定するプレイヤーの残りチップ
+
+    Returns:
+        {"action": "fold|check|call|raise|all_in", "amount": int}
+    """
+    available = game_state.parsed_actions
+    fold_w, check_call_w, raise_w, all_in_w = RandomPlayer.ACTION_WEIGHTS
+
+    # 利用可能なアクションごとに累積重みを積み、乱数1回で選択する
+    total = 0
+    cumulative = []  # (累積重み, アクション)
+    if available.can_fold:
+        total += fold_w
+        cumulative.append((total, "fold"))
+    if available.can_check:
+        total += check_call_w
+        cumulative.append((total, "check"))
+    if available.call_amount is not None:
+        total += check_call_w
+        cumulative.append((total, "call"))
+    if available.min_raise is not None:
+        total += raise_w
+        cumulative.append((total, "raise"))
+    if available.can_allin:
+        total += all_in_w
+        cumulative.append((total, "all_in"))
+
+    if not cumulative:
+        return {"action": "fold", "amount": 0}
+
+    threshold = random.random() * total
+    for bound, action in cumulative:
+        if threshold < bound:
+            break
+
+    # 選ばれたアクションの金額だけを計算する
+    if action == "call":
+        amount = available.call_amount
+    elif action == "raise":
+        # ランダムにレイズ額を決定（最低額の1-3倍）
+        amount = min(available.min_raise * random.randint(1, 3), chips)
+    elif action == "all_in":
+        amount = chips
+    else:
+        amount = 0
+    return {"action": action, "amount": amount}
+
+
 class RandomPlayer(Player):
     """ランダムプレイヤークラス（ランダム行動）"""
 
-    def __init__(self, player_id: int, name: str, initial_chips: int = 1000):
-        super().__init__(player_id, name, initial_chips)
-        # 要件定義書に従った確率重み
-        self.action_weights = {"fold": 30, "check_call": 50, "raise": 15, "all_in": 5}
+    __slots__ = ()
+
+    # 要件定義書に従った確率重み (fold, check_call, raise, all_in)
+    ACTION_WEIGHTS = (30, 50, 15, 5)
 
     def make_decision(self, game_state: GameState) -> Dict[str, Any]:
         """
@@ -319,47 +443,19 @@ class RandomPlayer(Player):
         Returns:
             {"action": "fold|check|call|raise|all_in", "amount": int}
         """
-        available_actions = game_state.actions
-
-        if not available_actions:
-            return {"action": "fold", "amount": 0}
-
-        # 利用可能なアクションに基づいて重み付きランダム選択
-        action_options = []
-        weights = []
-
-        for action in available_actions:
-            if action == "fold":
-                action_options.append({"action": "fold", "amount": 0})
-                weights.append(self.action_weights["fold"])
-            elif action.startswith("check"):
-                action_options.append({"action": "check", "amount": 0})
-                weights.append(self.action_weights["check_call"])
-            elif action.startswith("call"):
-                # "call (20)" のような形式から金額を抽出
-                amount = int(action.split("(")[1].split(")")[0])
-                action_options.append({"action": "call", "amount": amount})
-                weights.append(self.action_weights["check_call"])
-            elif action.startswith("raise"):
-                # "raise (min 40)" のような形式から最低レイズ額を抽出
-                amount = int(action.split("min ")[1].split(")")[0])
-                # ランダムにレイズ額を決定（最低額の1-3倍）
-                raise_amount = amount * random.randint(1, 3)
-                raise_amount = min(raise_amount, self.chips)
-                action_options.append({"action": "raise", "amount": raise_amount})
-                weights.append(self.action_weights["raise"])
-            elif action.startswith("all-in"):
-                action_options.append({"action": "all_in", "amount": self.chips})
-                weights.append(self.action_weights["all_in"])
-
-        # 重み付きランダム選択
-        selected_action = random.choices(action_options, weights=weights)[0]
-        return selected_action
+        return _random_fallback_decision(game_state, self.chips)
 
 
 class LLMPlayer(Player):
     """LLMプレイヤークラス（ADK使用）"""
 
+    __slots__ = (
+        "model",
+        "_agent",
+        "_session_service",
+        "_runner",
+    )
+
     def __init__(
         self,
         player_id: int,
@@ -370,7 +466,9 @@ class LLMPlayer(Player):
         super().__init__(player_id, name, initial_chips)
         self.model = model
         self._agent = None
-        self.last_decision_reasoning = ""  # 最後の判断理由を保存
+        # Runner/SessionServiceはプレイヤーごとに1回だけ生成して使い回す
+        self._session_service = None
+        self._runner = None
         self._setup_agent()
 
     def _setup_agent(self):
@@ -416,9 +514,17 @@ Consider:
 
 Be strategic and analytical. Provide clear reasoning for every decision.""",
             )
+            self._session_service = InMemorySessionService()
+            self._runner = Runner(
+                agent=self._agent,
+                app_name="poker_game",
+                session_service=self._session_service,
+            )
         except ImportError:
             print("Warning: ADK not available, falling back to random behavior")
             self._agent = None
+            self._session_service = None
+            self._runner = None
 
     def make_decision(self, game_state: GameState) -> Dict[str, Any]:
         """
@@ -432,8 +538,7 @@ Be strategic and analytical. Provide clear reasoning for every decision.""",
         """
         if self._agent is None:
             # ADKが利用できない場合はランダム行動
-            random_player = RandomPlayer(self.id, self.name, self.chips)
-            return random_player.make_decision(game_state)
+            return _random_fallback_decision(game_state, self.chips)
 
         # ロガーは先に用意して例外時にも参照可能にする
         logger = logging.getLogger("poker_game")
@@ -444,52 +549,59 @@ Be strategic and analytical. Provide clear reasoning for every decision.""",
             # ロガーを使ってプロンプトをログファイルに出力
             logger.info(f"LLM Prompt for {self.name}: {prompt}")
 
-            # ADKエージェントに問い合わせ
-            session_service = InMemorySessionService()
-            runner = Runner(
-                agent=self._agent,
-                app_name="poker_game",
-                session_service=session_service,
-            )
+            # ADKエージェントに問い合わせ（セッションは判断ごとに作成・破棄）
+            session_service = self._session_service
+            runner = self._runner
+            user_id = f"player_{self.id}"
+            session_id = f"session_{self.id}"
 
             async def get_decision():
                 session = await session_service.create_session(
                     app_name="poker_game",
-                    user_id=f"player_{self.id}",
-                    session_id=f"session_{self.id}",
+                    user_id=user_id,
+                    session_id=session_id,
                 )
 
-                # Content型のメッセージを作成
-                content = types.Content(role="user", parts=[types.Part(text=prompt)])
-
-                # run_asyncはイベントストリームを返すので、最終レスポンスを取得
-                final_response_text = None
-                async for event in runner.run_async(
-                    user_id=f"player_{self.id}",
-                    session_id=session.id,
-                    new_message=content,
-                ):
-                    if event.is_final_response():
-                        if event.content and event.content.parts:
-                            final_response_text = event.content.parts[0].text
-                        break
+                try:
+                    # Content型のメッセージを作成
+                    content = types.Content(
+                        role="user", parts=[types.Part(text=prompt)]
+                    )
 
-                return final_response_text
+                    # run_asyncはイベントストリームを返すので、最終レスポンスを取得
+                    final_response_text = None
+                    async for event in runner.run_async(
+                        user_id=user_id,
+                        session_id=session.id,
+                        new_message=content,
+                    ):
+                        if event.is_final_response():
+                            if event.content and event.content.parts:
+                                final_response_text = event.content.parts[0].text
+                            break
+
+                    return final_response_text
+                finally:
+                    await session_service.delete_session(
+                        app_name="poker_game",
+                        user_id=user_id,
+                        session_id=session.id,
+                    )
 
             # 非同期関数を同期的に実行 (Python 3.7+)
             response_content = asyncio.run(get_decision())
             logger.info(f"LLM Response for {self.name}: {response_content}")
 
-            print(f"test: {type(response_content)}")
-            print(f"test: {response_content}")
+            logger.debug(
+                "LLM response type for %s: %s", self.name, type(response_content)
+            )
 
             return self._parse_llm_response(response_content, game_state)
 
         except Exception as e:
             logger.error(f"LLM decision error for {self.name}: {e}")
             # エラー時はランダム行動
-            random_player = RandomPlayer(self.id, self.name, self.chips)
-            return random_player.make_decision(game_state)
+            return _random_fallback_decision(game_state, self.chips)
 
     def _create_decision_prompt(self, game_state: GameState) -> str:
         """LLM用のプロンプトを作成"""
@@ -497,7 +609,7 @@ Be strategic and analytical. Provide clear reasoning for every decision.""",
         return f"""
 現在のポーカー状況を分析して、最適な行動を決定してください：
 
-{json.dumps(game_state.to_dict(), ensure_ascii=False, indent=2)}
+{json.dumps(game_state.as_dict, ensure_ascii=False, separators=(",", ":"))}
 
 あなたのチップ数: {self.chips}
 現在のベット額: {self.current_bet}
@@ -526,23 +638,12 @@ Be strategic and analytical. Provide clear reasoning for every decision.""",
         """LLMの応答をパース（共通実装を使用）"""
         return super()._parse_llm_response(response, game_state, "LLM")
 
-    def reset_for_new_hand(self):
-        """新しいハンド用にリセット（理由もクリア）"""
-        super().reset_for_new_hand()
-        self.last_decision_reasoning = ""
-
-    def get_last_reasoning(self) -> str:
-        """最後の判断理由を取得"""
-        return (
-            self.last_decision_reasoning
-            if self.last_decision_reasoning
-            else "理由が記録されていません"
-        )
-
 
 class LLMApiPlayer(Player):
     """adk api_serverを使用し、Localhostに公開されたAgentを使用するプレイヤー"""
 
+    __slots__ = ("app_name", "user_id", "url", "_http")
+
     def __init__(
         self,
         player_id: int,
@@ -556,7 +657,8 @@ class LLMApiPlayer(Player):
         self.app_name = app_name
         self.user_id = user_id
         self.url = url
-        self.last_decision_reasoning = ""  # 最後の判断理由を保存
+        # api_serverへの接続をkeep-aliveで使い回す
+        self._http = requests.Session()
 
     def make_decision(self, game_state: GameState) -> Dict[str, Any]:
         """
@@ -573,13 +675,15 @@ class LLMApiPlayer(Player):
             logger = logging.getLogger("poker_game")
             session_id = str(uuid.uuid4())
 
-            # ゲーム状態をJSON文字列に変換
-            input_json = json.dumps(game_state.to_dict(), ensure_ascii=False, indent=2)
+            # ゲーム状態をJSON文字列に変換（LLMには整形不要なのでコンパクト形式）
+            input_json = json.dumps(
+                game_state.as_dict, ensure_ascii=False, separators=(",", ":")
+            )
             logger.debug(f"LLM Prompt for {self.name}: {input_json}")
 
             # セッションの作成（短いタイムアウト）
             try:
-                create_session = requests.post(
+                create_session = self._http.post(
                     f"{self.url}/apps/{self.app_name}/users/{self.user_id}/sessions/{session_id}",
                     json={},
                     headers={"Content-Type": "application/json"},
@@ -597,7 +701,7 @@ class LLMApiPlayer(Player):
             # 実際の実行リクエストを別スレッドで発行し、20秒待機・10秒ごとにログ
             def run_request():
                 try:
-                    return requests.post(
+                    return self._http.post(
                         f"{self.url}/run",
                         json={
                             "app_name": self.app_name,
@@ -649,10 +753,9 @@ class LLMApiPlayer(Player):
                         logger.warning(
                             f"LLM API response timeout for {self.name} after 40 seconds - folding"
                         )
-                        if hasattr(self, "last_decision_reasoning"):
-                            self.last_decision_reasoning = (
-                                "40秒経過しても応答がないため、フォールドします"
-                            )
+                        self.last_decision_reasoning = (
+                            "40秒経過しても応答がないため、フォールドします"
+                        )
                         return {
                             "action": "fold",
                             "amount": 0,
@@ -662,8 +765,7 @@ class LLMApiPlayer(Player):
             # スレッド結果の処理
             if isinstance(response, Exception):
                 logger.error(f"LLM decision error for {self.name}: {response}")
-                random_player = RandomPlayer(self.id, self.name, self.chips)
-                return random_player.make_decision(game_state)
+                return _random_fallback_decision(game_state, self.chips)
 
             if response is None:
                 logger.error(f"Empty response received for {self.name}")
@@ -693,44 +795,28 @@ class LLMApiPlayer(Player):
                     "reasoning": "20秒経過しても応答がないため、フォールドします",
                 }
 
-            # 正常応答
+            # 正常応答（レスポンスボディのJSONデコードは1回だけ行う）
             try:
-                logger.info(f"LLM raw Response for {self.name}: {response.json()}")
-                logger.debug(
-                    f"LLM [-1]['content']['parts'][0]['text'] for {self.name}:"
-                )
-                logger.debug(response.json()[-1]["content"]["parts"][0]["text"])
-            except Exception:
-                # JSONでない/形式不正でも後続のパースで対応
-                pass
-
-            return self._parse_llm_response(
-                response.json()[-1]["content"]["parts"][0]["text"],
-                game_state,
+                data = response.json()
+                logger.info("LLM raw Response for %s: %s", self.name, data)
+                text = data[-1]["content"]["parts"][0]["text"]
+            except (ValueError, KeyError, IndexError, TypeError) as e:
+                logger.error(f"Unexpected LLM API response format for {self.name}: {e}")
+                return _random_fallback_decision(game_state, self.chips)
+            logger.debug(
+                "LLM [-1]['content']['parts'][0]['text'] for %s: %s", self.name, text
             )
 
+            return self._parse_llm_response(text, game_state)
+
         except Exception as e:
             logger = logging.getLogger("poker_game")
             logger.error(f"LLM decision error for {self.name}: {e}")
             # エラー時はランダム行動
-            random_player = RandomPlayer(self.id, self.name, self.chips)
-            return random_player.make_decision(game_state)
+            return _random_fallback_decision(game_state, self.chips)
 
     def _parse_llm_response(
         self, response: str, game_state: GameState
     ) -> Dict[str, Any]:
         """LLMの応答をパース（共通実装を使用）"""
         return super()._parse_llm_response(response, game_state, "LLM API")
-
-    def reset_for_new_hand(self):
-        """新しいハンド用にリセット（理由もクリア）"""
-        super().reset_for_new_hand()
-        self.last_decision_reasoning = ""
-
-    def get_last_reasoning(self) -> str:
-        """最後の判断理由を取得"""
-        return (
-            self.last_decision_reasoning
-            if self.last_decision_reasoning
-            else "理由が記録されていません"
-        )
@@ -4,8 +4,6 @@
 
 from typing import Dict, List, Optional, Any
 from enum import Enum
-from dataclasses import dataclass, field
-from collections import defaultdict
 
 
 class ActionType(Enum):
@@ -18,46 +16,69 @@ class ActionType(Enum):
     ALL_IN = "all_in"
 
 
-@dataclass
+# action_countsの添字（ActionTypeの定義順）
+_ACTION_INDEX = {action: i for i, action in enumerate(ActionType)}
+
+
 class PlayerActionStats:
     """プレイヤーアクション統計クラス"""
+
+    __slots__ = (
+        "player_id",
+        "player_name",
+        "action_counts",
+        "preflop_participated",
+        "preflop_total_hands",
+        "post_preflop_hands",
+        "post_preflop_wins",
+        "hand_results",
+        "preflop_actions_this_hand",
+        "_dirty",
+        "_cached_summary",
+        "_cached_max_hands",
+    )
     
     def __init__(self, player_id: int, player_name: str):
         self.player_id = player_id
         self.player_name = player_name
-        self.action_counts = defaultdict(int)
+        self.action_counts = [0] * len(ActionType)  # ActionTypeの定義順に回数を保持
         self.preflop_participated = 0
         self.preflop_total_hands = 0
         self.post_preflop_hands = 0
         self.post_preflop_wins = 0
         self.hand_results = []
         self.preflop_actions_this_hand = False  # 現在のハンドでプリフロップアクションを取ったか
+        # get_action_summaryのキャッシュ（統計が更新されるまで再利用）
+        self._dirty = True
+        self._cached_summary: Optional[Dict[str, Any]] = None
+        self._cached_max_hands: Optional[int] = None
         
     def record_action(self, action_type: ActionType, phase: str, amount: int = 0):
         """アクションを記録"""
-        self.action_counts[action_type] += 1
+        self.action_counts[_ACTION_INDEX[action_type]] += 1
         
         # プリフロップでアクションを取った場合（フォールド以外）
         if phase == "preflop" and action_type != ActionType.FOLD:
             self.preflop_actions_this_hand = True
+        self._dirty = True
             
-    def record_preflop_participation(self, participated: bool):
-        """プリフロップ参加を記録"""
+    def record_hand_end(self, participated: bool, won: bool):
+        """ハンド終了時にプリフロップ参加と参加後の結果を記録"""
         self.preflop_total_hands += 1
         if participated:
             self.preflop_participated += 1
+            # プリフロップ参加後の結果を記録
+            self.post_preflop_hands += 1
+            if won:
+                self.post_preflop_wins += 1
         # ハンド終了時にリセット
         self.preflop_actions_this_hand = False
-            
-    def record_post_preflop_result(self, won: bool):
-        """プリフロップ参加後の結果を記録"""
-        self.post_preflop_hands += 1
-        if won:
-            self.post_preflop_wins += 1
+        self._dirty = True
             
     def record_hand_result(self, hand_data: Dict[str, Any]):
         """ハンド結果を記録"""
         self.hand_results.append(hand_data)
+        self._dirty = True
         
     @property
     def ppr(self) -> float:
@@ -74,7 +95,27 @@ class PlayerActionStats:
         return self.post_preflop_wins / self.post_preflop_hands
         
     def get_action_summary(self, max_hands: int = None) -> Dict[str, Any]:
-        """アクション統計のサマリーを取得"""
+        """アクション統計のサマリーを取得（統計が変わっていなければキャッシュから作る）"""
+        if (
+            self._dirty
+            or self._cached_summary is None
+            or self._cached_max_hands != max_hands
+        ):
+            self._cached_summary = self._build_summary(max_hands)
+            self._cached_max_hands = max_hands
+            self._dirty = False
+
+        # 呼び出し側が書き換えてもキャッシュに影響しないよう、入れ子の辞書ごと複製して返す
+        summary = self._cached_summary
+        return {
+            **summary,
+            "action_counts": dict(summary["action_counts"]),
+            "preflop_stats": dict(summary["preflop_stats"]),
+            "post_preflop_stats": dict(summary["post_preflop_stats"]),
+        }
+
+    def _build_summary(self, max_hands: Optional[int]) -> Dict[str, Any]:
+        """アクション統計のサマリーを作成"""
         # max_handsが指定されている場合は、それを使用して総ハンド数を調整
         total_hands = max_hands if max_hands is not None else self.preflop_total_hands
         
@@ -83,7 +124,11 @@ class PlayerActionStats:
             "player_name": self.player_name,
             "ppr": self.ppr,
             "post_preflop_win_rate": self.post_preflop_win_rate,
-            "action_counts": {action.value: count for action, count in self.action_counts.items()},
+            "action_counts": {
+                action.value: count
+                for action, count in zip(ActionType, self.action_counts)
+                if count
+            },
             "preflop_stats": {
                 "participated": self.preflop_participated,
                 "total_hands": total_hands
@@ -102,7 +147,9 @@ class PlayerStatsManager:
         self.player_stats: Dict[int, PlayerActionStats] = {}
         self.current_hand_players: set = set()  # 現在のハンドに参加しているプレイヤー
         self.max_hands: int = max_hands
-        
+        # 統計に反映したハンド数（全プレイヤー中の最大preflop_total_handsと一致）
+        self.hands_recorded = 0
+
     def register_player(self, player_id: int, player_name: str):
         """プレイヤーを登録"""
         if player_id not in self.player_stats:
@@ -110,8 +157,9 @@ class PlayerStatsManager:
             
     def record_action(self, player_id: int, action_type: ActionType, phase: str, amount: int = 0):
         """アクションを記録"""
-        if player_id in self.player_stats:
-            self.player_stats[player_id].record_action(action_type, phase, amount)
+        stats = self.player_stats.get(player_id)
+        if stats is not None:
+            stats.record_action(action_type, phase, amount)
             
             # プリフロップでのアクションを記録
             if phase == "preflop":
@@ -130,16 +178,16 @@ class PlayerStatsManager:
     def record_hand_end(self, winners: List[int], phase: str):
         """ハンド終了時の処理"""
         # 実際にプリフロップでアクションを取ったプレイヤーのみを参加としてカウント
-        for player_id in self.player_stats.keys():
-            player_stats = self.player_stats[player_id]
+        winners_set = set(winners)
+        if self.player_stats:
+            # 最初に登録されたプレイヤーは以降すべてのハンドでカウントされるため、
+            # この値が各プレイヤーのpreflop_total_handsの最大値になる
+            self.hands_recorded += 1
+        for player_id, stats in self.player_stats.items():
             # プリフロップでフォールド以外のアクションを取ったかどうかで参加判定
-            participated = player_stats.preflop_actions_this_hand
-            self.player_stats[player_id].record_preflop_participation(participated)
-            
-            # プリフロップ参加後の結果を記録
-            if participated:
-                won = player_id in winners
-                self.player_stats[player_id].record_post_preflop_result(won)
+            stats.record_hand_end(
+                stats.preflop_actions_this_hand, player_id in winners_set
+            )
                 
     def get_player_stats(self, player_id: int) -> Optional[PlayerActionStats]:
         """プレイヤーの統計を取得"""
@@ -158,6 +206,6 @@ class PlayerStatsManager:
             "player_stats": self.get_all_stats(),
             "summary": {
                 "total_players": len(self.player_stats),
-                "total_hands": self.max_hands if self.max_hands is not None else max([stats.preflop_total_hands for stats in self.player_stats.values()], default=0)
+                "total_hands": self.max_hands if self.max_hands is not None else self.hands_recorded
             }
         }
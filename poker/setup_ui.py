@@ -3,7 +3,7 @@
 """
 
 import flet as ft
-from typing import List, Dict, Any, Callable
+from typing import List, Dict, Any, Callable, Optional, Tuple
 from .agent_manager import AgentManager
 
 # 利用可能なLLMモデル定義
@@ -58,6 +58,8 @@ class SetupUI:
         self.cpu_type_dropdowns = []
         self.model_dropdowns = []
         self.agent_dropdowns = []  # Agent選択用のドロップダウンを追加
+        # CPU番号ごとに最後に反映したAgent選択肢
+        self._applied_agent_choices: Dict[int, List[Tuple[str, str]]] = {}
 
         # プレイヤー設定UIを作成（レスポンシブなグリッド表示）
         # 画面幅に応じて 1列（xs:12）/ 2列（sm:6）/ 3列（md:4）になる
@@ -296,9 +298,13 @@ class SetupUI:
     def _on_total_players_changed(self, e):
         """プレイヤー人数が変更されたときの処理"""
         try:
-            self.total_players = max(2, min(10, int(e.control.value)))
+            total_players = max(2, min(10, int(e.control.value)))
         except Exception:
-            self.total_players = 4
+            total_players = 4
+        # 人数が変わっていなければ再描画しない
+        if total_players == self.total_players:
+            return
+        self.total_players = total_players
         self._update_cpu_visibility()
         if self.page:
             self.page.update()
@@ -307,70 +313,58 @@ class SetupUI:
         """選択された人数に応じてCPU設定の表示/非表示を切り替え"""
         cpu_needed = max(1, min(9, self.total_players - 1))
         for i, container in enumerate(self.cpu_containers):
-            container.visible = i < cpu_needed
-
-    def _update_agent_options(self, agent_dropdown: ft.Dropdown, cpu_number: int):
+            visible = i < cpu_needed
+            # 変化したコンテナだけ更新して差分送信を減らす
+            if container.visible != visible:
+                container.visible = visible
+
+    def _update_agent_options(
+        self,
+        agent_dropdown: ft.Dropdown,
+        cpu_number: int,
+        choices: Optional[List[Tuple[str, str]]] = None,
+    ):
         """接続テスト成功済みのAgentでドロップダウンのオプションを更新"""
-        # テスト結果から成功したAgentを取得
-        test_results = self.agent_manager.get_test_results()
-        successful_agents = []
-
-        for agent_id, result in test_results.items():
-            if result.get("status") == "success":
-                # 成功したAgentを追加
-                agent_info = next(
-                    (
-                        agent
-                        for agent in self.agent_manager.get_available_agents()
-                        if agent.get("id") == agent_id
-                    ),
-                    None,
-                )
-                if agent_info:
-                    successful_agents.append(agent_info)
-
-        # 成功したAgentがない場合は、全てのAgentを確認
-        if not successful_agents:
-            all_agents = self.agent_manager.get_available_agents()
-            if all_agents:
-                successful_agents = all_agents
-            else:
-                # Agentが全く存在しない場合は「Not Found」オプションを追加
-                agent_dropdown.label = f"CPU{cpu_number}のAgent - Not Found"
-                agent_dropdown.options = [
-                    ft.dropdown.Option("not_found", "Not Found - No agents available")
-                ]
-                agent_dropdown.value = "not_found"
-                agent_dropdown.disabled = True
-                return
+        if choices is None:
+            choices = self.agent_manager.get_agent_choices()
+
+        # 前回と同じ選択肢ならOptionを作り直さない
+        if self._applied_agent_choices.get(cpu_number) == choices:
+            return
+        self._applied_agent_choices[cpu_number] = choices
+
+        if not choices:
+            # Agentが全く存在しない場合は「Not Found」オプションを追加
+            agent_dropdown.label = f"CPU{cpu_number}のAgent - Not Found"
+            agent_dropdown.options = [
+                ft.dropdown.Option("not_found", "Not Found - No agents available")
+            ]
+            agent_dropdown.value = "not_found"
+            agent_dropdown.disabled = True
+            return
 
         # ドロップダウンのオプションを更新
         agent_dropdown.label = f"CPU{cpu_number}のAgent"
-        agent_dropdown.options = [
-            ft.dropdown.Option(
-                agent.get("id", "unknown"),
-                f"{agent.get('name', 'Unknown')} - {agent.get('description', 'No description')}",
-            )
-            for agent in successful_agents
-        ]
+        agent_dropdown.options = [ft.dropdown.Option(key, text) for key, text in choices]
 
         # ドロップダウンを有効化
         agent_dropdown.disabled = False
 
         # デフォルト値を設定（最初のAgentを選択）
-        if agent_dropdown.options:
-            agent_dropdown.value = agent_dropdown.options[0].key
+        agent_dropdown.value = choices[0][0]
 
     def _refresh_agent_dropdowns(self):
         """Agent refresh後にすべてのAgent dropdownを更新"""
         try:
             print("DEBUG: Refreshing agent dropdowns...")
 
+            # 選択肢は全ドロップダウンで共通なので一度だけ求める
+            choices = self.agent_manager.get_agent_choices()
             for i, agent_dropdown in enumerate(self.agent_dropdowns):
                 # llm_api タイプが選択されているAgent dropdownのみ更新
                 type_dropdown = self.cpu_type_dropdowns[i]
                 if type_dropdown.value == "llm_api" and agent_dropdown.visible:
-                    self._update_agent_options(agent_dropdown, i + 1)
+                    self._update_agent_options(agent_dropdown, i + 1, choices)
 
             # UIを更新
             if self.page:
@@ -29,6 +29,9 @@ def set_current_game(game: "PokerGame") -> None:
 
 
 def get_current_game() -> Optional["PokerGame"]:
-    """Get the currently active PokerGame instance if available."""
-    with _lock:
-        return _current_game
+    """Get the currently active PokerGame instance if available.
+
+    Reading a module global is atomic, so this hot path (every /state poll)
+    does not take the lock; writers still serialize through it.
+    """
+    return _current_game
@@ -6,12 +6,40 @@ This avoids adding external deps (FastAPI, etc.) by using http.server.
 
 from __future__ import annotations
 
+import gzip
 import json
+import re
+import threading
+import time
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from .shared_state import get_current_game
-from .player_models import PlayerStatus, LLMApiPlayer
+
+try:
+    # Prefer orjson (optional) for encoding the polled snapshot; it emits bytes.
+    import orjson
+
+    _dumps = orjson.dumps
+except ImportError:
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+
+# action_history grows for the whole session; the viewer only needs the
+# recent tail, so each snapshot carries at most this many entries.
+ACTION_HISTORY_LIMIT = 100
+
+# The viewer shows at most six lines of each agent's reasoning, so longer
+# text is cut here instead of being sent in full.
+REASONING_LIMIT = 240
+
+
+def _reasoning_preview(text: str) -> str:
+    if len(text) <= REASONING_LIMIT:
+        return text
+    return text[: REASONING_LIMIT - 1] + "…"
 
 
 def _card_to_str(card) -> str:
@@ -21,117 +49,348 @@ def _card_to_str(card) -> str:
         return "??"
 
 
-def _build_viewer_state() -> Dict[str, Any]:
+# (game, (hand_number, phase, card count), community_cards) of the last
+# snapshot. The phase changes just before the new cards are dealt, so the
+# card count is part of the key; otherwise a poll landing between the two
+# would pin the old board for the rest of the street.
+_sticky_cache: Tuple[Any, Tuple[int, str, int], List[str]] = (None, (-1, "", 0), [])
+
+
+def _community_cards(game, phase: str) -> List[str]:
+    """Return the stringified community cards, reused until the board changes."""
+    global _sticky_cache
+    board = game.community_cards
+    key = (game.hand_number, phase, len(board))
+    cached_game, cached_key, cards = _sticky_cache
+    if cached_game is game and cached_key == key:
+        return cards
+    cards = [_card_to_str(c) for c in board]
+    _sticky_cache = (game, key, cards)
+    return cards
+
+
+# Every history entry format the viewer styles, as one pattern. Exactly one
+# of fold/check/call/raise/all_in/blind/street is set on a match.
+_HISTORY_RE = re.compile(
+    r"Player (?P<pid>\d+) (?:"
+    r"(?P<fold>folded)"
+    r"|(?P<check>checked)"
+    r"|called (?P<call>\d+)"
+    r"|raised to (?P<raise>\d+)"
+    r"|went all-in with (?P<all_in>\d+)"
+    r"|posted (?P<blind>small|big) blind (?P<blind_amount>\d+)"
+    r")"
+    r"|(?P<street>Flop|Turn|River) dealt: (?P<cards>.+)"
+)
+
+
+def _history_event(text: str) -> Dict[str, Any]:
+    """Convert one action_history entry into a structured viewer event.
+
+    Player actions become {"kind", "player_id"[, "amount"]}, deals become
+    {"kind": "flop"/"turn"/"river", "cards": [...]}, and anything else is
+    passed through as {"kind": "text", "text": ...}.
+    """
+    m = _HISTORY_RE.match(text)
+    if m is None:
+        return {"kind": "text", "text": text}
+    street = m.group("street")
+    if street is not None:
+        cards = [c.strip() for c in m.group("cards").split(",")]
+        return {"kind": street.lower(), "cards": cards}
+    event: Dict[str, Any] = {"player_id": int(m.group("pid"))}
+    blind = m.group("blind")
+    if blind is not None:
+        event["kind"] = f"{blind}_blind"
+        event["amount"] = int(m.group("blind_amount"))
+    elif m.group("fold"):
+        event["kind"] = "fold"
+    elif m.group("check"):
+        event["kind"] = "check"
+    else:
+        for kind in ("call", "raise", "all_in"):
+            amount = m.group(kind)
+            if amount is not None:
+                event["kind"] = kind
+                event["amount"] = int(amount)
+                break
+    return event
+
+
+# action_history is append-only per game, so each entry is converted once.
+_history_lock = threading.Lock()
+_history_game: Any = None
+_history_events: List[Dict[str, Any]] = []
+
+
+def _history_tail(game) -> Tuple[List[Dict[str, Any]], int]:
+    """Return (events for the last ACTION_HISTORY_LIMIT entries, total count)."""
+    global _history_game, _history_events
+    with _history_lock:
+        if _history_game is not game:
+            _history_game = game
+            _history_events = []
+        history = game.action_history
+        events = _history_events
+        for text in history[len(events) :]:
+            events.append(_history_event(text))
+        return events[-ACTION_HISTORY_LIMIT:], len(events)
+
+
+def _build_viewer_state(game=None) -> Dict[str, Any]:
     """Build a viewer-friendly JSON snapshot of the current game.
 
     All hole cards are exposed intentionally for spectator view.
     """
-    game = get_current_game()
+    if game is None:
+        game = get_current_game()
     if not game:
         return {"ready": False}
 
-    def _latest_action_for_player(player_id: int) -> Tuple[str, int]:
-        """Parse the game's action_history to find the latest action by player.
-
-        Returns (action_label, amount). action_label examples: 'fold', 'check', 'call', 'raise', 'all_in', ''.
-        """
-        history: List[str] = list(getattr(game, "action_history", []))
-        for entry in reversed(history):
-            # Expected formats
-            # 'Player {id} folded'
-            # 'Player {id} checked'
-            # 'Player {id} called {amt}'
-            # 'Player {id} raised to {amt}'
-            # 'Player {id} went all-in with {amt}'
-            try:
-                if entry.startswith(f"Player {player_id} "):
-                    rest = entry.split(" ", 2)[2]
-                    if rest.startswith("folded"):
-                        return ("fold", 0)
-                    if rest.startswith("checked"):
-                        return ("check", 0)
-                    if rest.startswith("called"):
-                        amt = int(rest.split(" ")[1])
-                        return ("call", amt)
-                    if rest.startswith("raised to"):
-                        amt = int(rest.split(" ")[-1])
-                        return ("raise", amt)
-                    if rest.startswith("went all-in with"):
-                        amt = int(rest.split(" ")[-1])
-                        return ("all_in", amt)
-            except Exception:
-                continue
-        return ("", 0)
+    last_action_by_player = game.last_action_by_player
+    card_to_str = _card_to_str
 
+    # Every Player initializes these attributes, so read them directly
+    # instead of going through getattr() defaults on each poll.
     players: List[Dict[str, Any]] = []
-    llm_api_agents: List[Dict[str, Any]] = []
+    append_player = players.append
     for p in game.players:
-        players.append(
+        append_player(
             {
                 "id": p.id,
                 "name": p.name,
                 "chips": p.chips,
                 "current_bet": p.current_bet,
                 "total_bet_this_hand": p.total_bet_this_hand,
-                "status": getattr(p.status, "value", str(p.status)),
-                "is_dealer": bool(getattr(p, "is_dealer", False)),
-                "is_small_blind": bool(getattr(p, "is_small_blind", False)),
-                "is_big_blind": bool(getattr(p, "is_big_blind", False)),
-                "hole_cards": [_card_to_str(c) for c in getattr(p, "hole_cards", [])],
+                "status": p.status.value,
+                "is_dealer": p.is_dealer,
+                "is_small_blind": p.is_small_blind,
+                "is_big_blind": p.is_big_blind,
+                "hole_cards": [card_to_str(c) for c in p.hole_cards],
             }
         )
 
-        # Collect LLM API agent info (latest action + last reasoning)
-        if isinstance(p, LLMApiPlayer):
-            action, amount = _latest_action_for_player(p.id)
-            reasoning = getattr(p, "last_decision_reasoning", "")
-            llm_api_agents.append(
-                {
-                    "id": p.id,
-                    "name": p.name,
-                    "action": action,
-                    "amount": amount,
-                    "reasoning": reasoning,
-                }
-            )
+    # Collect LLM API agent info (latest action + last reasoning).
+    # The game keeps these players in their own list, so no type checks here.
+    llm_api_agents: List[Dict[str, Any]] = []
+    for p in game.llm_api_players:
+        record = last_action_by_player.get(p.id)
+        action, amount = (record.action, record.amount) if record else ("", 0)
+        llm_api_agents.append(
+            {
+                "id": p.id,
+                "name": p.name,
+                "action": action,
+                "amount": amount,
+                "reasoning": _reasoning_preview(p.last_decision_reasoning),
+            }
+        )
 
+    history_tail, history_len = _history_tail(game)
+    phase = game.current_phase.value
     state: Dict[str, Any] = {
         "ready": True,
         "hand_number": game.hand_number,
-        "phase": getattr(game.current_phase, "value", str(game.current_phase)),
+        "phase": phase,
         "pot": game.pot,
         "current_bet": game.current_bet,
         "dealer_button": game.dealer_button,
         "current_turn": game.current_player_index,
-        "community_cards": [_card_to_str(c) for c in game.community_cards],
+        "community_cards": _community_cards(game, phase),
         "players": players,
-        "action_history": list(game.action_history),
+        # Structured events for the recent tail of action_history.
+        # action_history_len is the total count, letting clients line the
+        # tail up with entries they have already seen.
+        "action_history": history_tail,
+        "action_history_len": history_len,
         "llm_api_agents": llm_api_agents,
         # ショーダウン結果（存在する場合のみ）
-        "showdown_results": getattr(game, "last_showdown_results", None),
+        "showdown_results": game.last_showdown_results,
     }
     return state
 
 
+# (game, state_version, etag, state, body, content_length) of the last
+# encoded snapshot. Replaced as a whole tuple so readers never see a torn
+# entry.
+_state_cache: Tuple[Any, int, str, Dict[str, Any], bytes, str] = (
+    None,
+    -1,
+    "",
+    {},
+    b"",
+    "0",
+)
+
+
+def _encoded_viewer_state() -> Tuple[Optional[str], Dict[str, Any], bytes, str]:
+    """Return (etag, state, JSON body, Content-Length value) for the current game.
+
+    The body is rebuilt only when the game's state_version has moved since
+    the last request; steady-state polls reuse the cached bytes and length.
+    """
+    global _state_cache
+    game = get_current_game()
+    if not game:
+        state = _build_viewer_state(game)
+        body = _dumps(state)
+        return None, state, body, str(len(body))
+
+    # Read the version before building so a concurrent mutation is never
+    # cached under the newer version number.
+    version = game.state_version
+    cached_game, cached_version, etag, state, body, length = _state_cache
+    if cached_game is game and cached_version == version:
+        return etag, state, body, length
+
+    state = _build_viewer_state(game)
+    body = _dumps(state)
+    etag = f'W/"{id(game):x}-{version}"'
+    length = str(len(body))
+    _state_cache = (game, version, etag, state, body, length)
+    return etag, state, body, length
+
+
+def _state_delta(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the top-level keys of new that differ from old.
+
+    The result is {"changed": {key: value}, "removed": [key]}; applying it to
+    old yields new.
+    """
+    return {
+        "changed": {k: v for k, v in new.items() if k not in old or old[k] != v},
+        "removed": [k for k in old if k not in new],
+    }
+
+
+# (etag, gzip body, content_length) for the last compressed snapshot, so each
+# state version is compressed at most once no matter how many viewers poll it.
+_gzip_cache: Tuple[str, bytes, str] = ("", b"", "0")
+
+
+def _gzipped(etag: Optional[str], body: bytes) -> Tuple[bytes, str]:
+    """Return (gzip body, Content-Length value), reusing the last result for the same etag."""
+    global _gzip_cache
+    if etag is None:
+        compressed = gzip.compress(body, compresslevel=1)
+        return compressed, str(len(compressed))
+    cached_etag, cached_body, cached_length = _gzip_cache
+    if cached_etag == etag:
+        return cached_body, cached_length
+    compressed = gzip.compress(body, compresslevel=1)
+    length = str(len(compressed))
+    _gzip_cache = (etag, compressed, length)
+    return compressed, length
+
+
+# How often an /events stream checks for a new state version, and how long
+# it may stay silent before sending a keep-alive comment.
+EVENTS_CHECK_INTERVAL = 0.1
+EVENTS_KEEPALIVE_INTERVAL = 15.0
+
+
 class _StateHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 keeps the connection open between /state polls, so every
+    # response must carry Content-Length (or be chunked, like /events).
+    protocol_version = "HTTP/1.1"
+    # Drop clients that connect but never send a request, or stay idle.
+    timeout = 5
+
+    def _write_chunk(self, data: bytes) -> None:
+        self.wfile.write(b"%X\r\n%s\r\n" % (len(data), data))
+        self.wfile.flush()
+
+    def _stream_events(self) -> None:
+        """Push a Server-Sent Event whenever the snapshot changes.
+
+        The first event carries the full snapshot; later ones are "delta"
+        events with only the top-level fields that changed (see _state_delta).
+        """
+        # Chunked encoding lets clients read each event as it arrives; the
+        # stream only ends when the client goes away.
+        self.close_connection = True
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+
+        last_key: Any = None
+        # State the client now holds, if later events may be sent as deltas
+        sent: Optional[Dict[str, Any]] = None
+        idle = 0.0
+        try:
+            while True:
+                etag, state, body, _ = _encoded_viewer_state()
+                # Without a game there is no etag; compare the body instead
+                key = etag if etag is not None else body
+                if key != last_key:
+                    if etag is None:
+                        event = b"data: " + body + b"\n\n"
+                    elif sent is None:
+                        event = b"id: " + etag.encode() + b"\ndata: " + body + b"\n\n"
+                    else:
+                        # Only the top-level fields that changed since the
+                        # last event; the client merges them into its copy
+                        event = (
+                            b"event: delta\nid: "
+                            + etag.encode()
+                            + b"\ndata: "
+                            + _dumps(_state_delta(sent, state))
+                            + b"\n\n"
+                        )
+                    self._write_chunk(event)
+                    sent = state if etag is not None else None
+                    last_key = key
+                    idle = 0.0
+                elif idle >= EVENTS_KEEPALIVE_INTERVAL:
+                    self._write_chunk(b": keep-alive\n\n")
+                    idle = 0.0
+                time.sleep(EVENTS_CHECK_INTERVAL)
+                idle += EVENTS_CHECK_INTERVAL
+        except OSError:
+            # Viewer disconnected
+            return
+
     def do_GET(self):  # noqa: N802 (keep stdlib signature)
         try:
-            if self.path.startswith("/state"):
-                state = _build_viewer_state()
-                body = json.dumps(state).encode("utf-8")
+            if self.path.startswith("/events"):
+                self._stream_events()
+            elif self.path.startswith("/state"):
+                etag, _, body, length = _encoded_viewer_state()
+                if etag is not None and self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Access-Control-Allow-Origin", "*")
+                    self.end_headers()
+                    return
+                use_gzip = "gzip" in self.headers.get("Accept-Encoding", "")
+                if use_gzip:
+                    body, length = _gzipped(etag, body)
                 self.send_response(200)
                 self.send_header("Content-Type", "application/json; charset=utf-8")
-                self.send_header("Content-Length", str(len(body)))
+                if use_gzip:
+                    self.send_header("Content-Encoding", "gzip")
+                self.send_header("Vary", "Accept-Encoding")
+                self.send_header("Content-Length", length)
+                if etag is not None:
+                    self.send_header("ETag", etag)
                 # Allow cross-origin for safety when opened from file or different port
                 self.send_header("Access-Control-Allow-Origin", "*")
                 self.end_headers()
                 self.wfile.write(body)
             else:
-                self.send_response(404)
-                self.end_headers()
+                self._send_empty(404)
         except Exception:
-            self.send_response(500)
-            self.end_headers()
+            # The response may already be partly written; don't reuse the socket.
+            self.close_connection = True
+            self._send_empty(500)
+
+    def _send_empty(self, code: int) -> None:
+        self.send_response(code)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
 
     # Suppress stdlib log noise
     def log_message(self, format: str, *args):  # noqa: A003
@@ -141,6 +400,8 @@ class _StateHandler(BaseHTTPRequestHandler):
 _server_singleton: ThreadingHTTPServer | None = None
 
 
+# Each /events subscriber holds its connection open, so requests are served
+# on their own (daemon) threads.
 def start_state_server(
     host: str = "127.0.0.1", port: int = 8765
 ) -> ThreadingHTTPServer:
@@ -2,18 +2,266 @@
 Spectator (viewer) UI for ADK Poker.
 
 This UI displays the full table status with all players' hole cards face-up.
-It is read-only and periodically polls the shared game state.
+It is read-only and follows state updates pushed by the main process,
+falling back to periodic polling when the push stream is unavailable.
 """
 
 from __future__ import annotations
 
 import asyncio
+import functools
+import itertools
+import json
 import math
-from typing import List, Optional
+from dataclasses import dataclass
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
 import flet as ft
 import os
 import requests
-import re
+
+try:
+    # Prefer orjson (optional) for decoding state snapshots; it accepts bytes.
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Style values shared by controls that are rebuilt on every refresh. Flet
+# serializes these by value, so one instance can back any number of controls.
+_BORDER_RED_200 = ft.border.all(1, ft.Colors.RED_200)
+_BORDER_BLUE_200 = ft.border.all(1, ft.Colors.BLUE_200)
+_BORDER_GREEN_200 = ft.border.all(1, ft.Colors.GREEN_200)
+_BORDER_ORANGE_200 = ft.border.all(1, ft.Colors.ORANGE_200)
+_BORDER_PURPLE_200 = ft.border.all(1, ft.Colors.PURPLE_200)
+_BORDER_CYAN_200 = ft.border.all(1, ft.Colors.CYAN_200)
+_BORDER_INDIGO_200 = ft.border.all(1, ft.Colors.INDIGO_200)
+_BORDER_LIGHT_GREEN_200 = ft.border.all(1, ft.Colors.LIGHT_GREEN_200)
+_BORDER_GREY_200 = ft.border.all(1, ft.Colors.GREY_200)
+_BORDER_GREY_300 = ft.border.all(1, ft.Colors.GREY_300)
+_BORDER_GREY_400 = ft.border.all(1, ft.Colors.GREY_400)
+_BORDER_PURPLE_400 = ft.border.all(1, ft.Colors.PURPLE_400)
+_BORDER_RED_400 = ft.border.all(1, ft.Colors.RED_400)
+_BORDER_BLUE_300 = ft.border.all(1, ft.Colors.BLUE_300)
+_PAD_CARD_FACE = ft.padding.only(left=4, right=4, top=2, bottom=2)
+_PAD_BADGE = ft.padding.symmetric(horizontal=6, vertical=2)
+_PAD_PILL = ft.padding.symmetric(horizontal=8, vertical=3)
+_PAD_OVERLAY_LABEL = ft.padding.symmetric(horizontal=8, vertical=4)
+
+
+_PHASE_NAMES = {
+    "preflop": "プリフロップ",
+    "flop": "フロップ",
+    "turn": "ターン",
+    "river": "リバー",
+    "showdown": "ショーダウン",
+    "finished": "終了",
+}
+
+
+class _HistoryStyle(NamedTuple):
+    label: str
+    bg: str
+    border: ft.Border
+    badge_bg: str
+    badge_fg: str
+
+
+# Action history event kind -> colors of its row and badge
+_HISTORY_STYLES: Dict[str, _HistoryStyle] = {
+    "fold": _HistoryStyle(
+        "FOLD",
+        ft.Colors.RED_50,
+        _BORDER_RED_200,
+        ft.Colors.RED_200,
+        ft.Colors.RED_900,
+    ),
+    "check": _HistoryStyle(
+        "CHECK",
+        ft.Colors.BLUE_50,
+        _BORDER_BLUE_200,
+        ft.Colors.BLUE_200,
+        ft.Colors.BLUE_900,
+    ),
+    "call": _HistoryStyle(
+        "CALL",
+        ft.Colors.GREEN_50,
+        _BORDER_GREEN_200,
+        ft.Colors.GREEN_200,
+        ft.Colors.GREEN_900,
+    ),
+    "raise": _HistoryStyle(
+        "RAISE",
+        ft.Colors.ORANGE_50,
+        _BORDER_ORANGE_200,
+        ft.Colors.ORANGE_200,
+        ft.Colors.ORANGE_900,
+    ),
+    "all_in": _HistoryStyle(
+        "ALL-IN",
+        ft.Colors.PURPLE_50,
+        _BORDER_PURPLE_200,
+        ft.Colors.PURPLE_200,
+        ft.Colors.PURPLE_900,
+    ),
+    "small_blind": _HistoryStyle(
+        "SB",
+        ft.Colors.CYAN_50,
+        _BORDER_CYAN_200,
+        ft.Colors.CYAN_200,
+        ft.Colors.CYAN_900,
+    ),
+    "big_blind": _HistoryStyle(
+        "BB",
+        ft.Colors.INDIGO_50,
+        _BORDER_INDIGO_200,
+        ft.Colors.INDIGO_200,
+        ft.Colors.INDIGO_900,
+    ),
+    "flop": _HistoryStyle(
+        "FLOP",
+        ft.Colors.LIGHT_GREEN_50,
+        _BORDER_LIGHT_GREEN_200,
+        ft.Colors.GREEN_200,
+        ft.Colors.GREEN_900,
+    ),
+    "turn": _HistoryStyle(
+        "TURN",
+        ft.Colors.LIGHT_GREEN_50,
+        _BORDER_LIGHT_GREEN_200,
+        ft.Colors.GREEN_200,
+        ft.Colors.GREEN_900,
+    ),
+    "river": _HistoryStyle(
+        "RIVER",
+        ft.Colors.LIGHT_GREEN_50,
+        _BORDER_LIGHT_GREEN_200,
+        ft.Colors.GREEN_200,
+        ft.Colors.GREEN_900,
+    ),
+}
+
+
+class _SeatStyle(NamedTuple):
+    bg: str
+    border: ft.Border
+    name_color: str
+    name_style: Optional[ft.TextStyle]
+    chips_color: str
+    chips_bg: str
+    bet_color: str
+    bet_bg: str
+
+
+# Statuses whose seats are greyed out and covered by an overlay, and the
+# overlay label of each
+_INACTIVE_STATUSES = frozenset(("folded", "busted"))
+_OVERLAY_TEXT = {"folded": "❌ フォールド", "busted": "❌ バスト"}
+
+_SEAT_OUT = _SeatStyle(
+    bg=ft.Colors.GREY_100,
+    border=_BORDER_GREY_400,
+    name_color=ft.Colors.GREY_600,
+    name_style=ft.TextStyle(decoration=ft.TextDecoration.LINE_THROUGH),
+    chips_color=ft.Colors.GREY_700,
+    chips_bg=ft.Colors.GREY_100,
+    bet_color=ft.Colors.GREY_600,
+    bet_bg=ft.Colors.GREY_100,
+)
+_SEAT_ACTIVE = _SeatStyle(
+    bg=ft.Colors.WHITE,
+    border=_BORDER_GREY_400,
+    name_color=ft.Colors.BLACK,
+    name_style=None,
+    chips_color=ft.Colors.GREEN_700,
+    chips_bg=ft.Colors.GREEN_50,
+    bet_color=ft.Colors.GREY_600,
+    bet_bg=ft.Colors.GREY_50,
+)
+_SEAT_ACTIVE_BET = _SEAT_ACTIVE._replace(
+    bet_color=ft.Colors.RED_600, bet_bg=ft.Colors.YELLOW_50
+)
+
+# (status class, has a bet out) -> seat style
+_SEAT_STYLES: Dict[Tuple[str, bool], _SeatStyle] = {
+    ("out", False): _SEAT_OUT,
+    ("out", True): _SEAT_OUT,
+    ("active", False): _SEAT_ACTIVE,
+    ("active", True): _SEAT_ACTIVE_BET,
+    ("all_in", False): _SEAT_ACTIVE._replace(
+        bg=ft.Colors.PURPLE_50, border=_BORDER_PURPLE_400
+    ),
+    ("all_in", True): _SEAT_ACTIVE_BET._replace(
+        bg=ft.Colors.PURPLE_50, border=_BORDER_PURPLE_400
+    ),
+}
+
+
+@dataclass(slots=True, frozen=True)
+class SeatView:
+    """What one seat displays; compared against the shown view to skip it."""
+
+    name: str
+    chips: int
+    current_bet: int
+    status: str
+    cards: Tuple[str, ...]
+    is_dealer: bool
+    is_small_blind: bool
+    is_big_blind: bool
+
+    @classmethod
+    def from_player(cls, player: dict, index: int) -> "SeatView":
+        # Normalize status and fall back to "busted" for players without chips.
+        # state_server sends typed fields, so they are read without coercion.
+        chips = player.get("chips", 0)
+        status = player.get("status", "").lower()
+        if status in ("bust", "busted_out"):
+            status = "busted"
+        if not status and chips <= 0:
+            status = "busted"
+        return cls(
+            name=player.get("name", f"P{index}"),
+            chips=chips,
+            current_bet=player.get("current_bet", 0),
+            status=status,
+            cards=tuple(str(c) for c in player.get("hole_cards", [])),
+            is_dealer=bool(player.get("is_dealer")),
+            is_small_blind=bool(player.get("is_small_blind")),
+            is_big_blind=bool(player.get("is_big_blind")),
+        )
+
+
+@dataclass(slots=True)
+class _SeatControls:
+    """The controls of one seat that _update_seat mutates in place."""
+
+    root: ft.Container
+    inner: ft.Container
+    cards_row: ft.Row
+    name_text: ft.Text
+    badges_row: ft.Row
+    chips_box: ft.Container
+    chips_text: ft.Text
+    bet_box: ft.Container
+    bet_text: ft.Text
+    overlay: ft.Container
+    overlay_text: ft.Text
+    # View currently shown by these controls
+    view: Optional[SeatView] = None
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_card(card_str: str) -> Tuple[str, str, str]:
+    """Split a card string such as "10♥" into (rank, suit, text color).
+
+    Only 52 card strings exist, so each is parsed once. Controls themselves
+    cannot be cached because a Flet control may have only one parent.
+    """
+    suit_symbol = card_str[-1]
+    color = ft.Colors.RED if suit_symbol in ("♥", "♦") else ft.Colors.BLACK
+    return card_str[:-1], suit_symbol, color
 
 
 class PokerViewerUI:
@@ -21,11 +269,42 @@ class PokerViewerUI:
         self.page: Optional[ft.Page] = None
         self.table_width = 1050
         self.table_height = 520
+        # Seat (left, top) positions keyed by player count
+        self._seat_geometry: Dict[int, List[Tuple[int, int]]] = {}
+        # Seat controls are kept for the whole session and updated in place;
+        # _seat_count is the player count they are currently laid out for
+        self._seat_pool: List[_SeatControls] = []
+        self._seat_count = 0
         # Viewer fetches JSON state from main process HTTP endpoint
         self.state_url = os.environ.get(
             "ADK_POKER_STATE_URL", "http://127.0.0.1:8765/state"
         )
+        # Server-Sent Events stream that pushes a snapshot on every change
+        self.events_url = os.environ.get(
+            "ADK_POKER_EVENTS_URL", self.state_url.rsplit("/", 1)[0] + "/events"
+        )
         self._last_state: Optional[dict] = None
+        # State most recently drawn by update_display (for section diffs)
+        self._rendered_state: Optional[dict] = None
+        # Action history entries already shown, and the (id, name) pairs
+        # they were rendered with
+        self._history_len = 0
+        self._history_names: Optional[list] = None
+        # Identity of each shown history row, parallel to its controls
+        self._history_keys: List[tuple] = []
+        # Last rendered LLM agent card per agent id, with the data it shows
+        self._llm_cards: Dict[int, Tuple[dict, ft.Control]] = {}
+        # Player names by id, rebuilt from each state in update_display
+        self._name_by_id: Dict[int, str] = {}
+        # Keep-alive session reused across polls, plus the ETag of the last
+        # snapshot so the server can answer 304 when nothing changed.
+        self._http = requests.Session()
+        self._etag: Optional[str] = None
+        # Newest pushed state waiting for the debounced redraw
+        self._pending_state: Optional[dict] = None
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # Cleared when the page session closes to end the poll loop
+        self._running = False
 
         # Root controls
         self.game_info_text: Optional[ft.Text] = None
@@ -116,9 +395,9 @@ class PokerViewerUI:
             width=width,
             height=height,
             bgcolor=ft.Colors.WHITE,
-            border=ft.border.all(1, ft.Colors.GREY_400),
+            border=_BORDER_GREY_400,
             border_radius=border_radius,
-            padding=ft.padding.only(left=4, right=4, top=2, bottom=2),
+            padding=_PAD_CARD_FACE,
             alignment=ft.alignment.center,
         )
 
@@ -129,13 +408,11 @@ class PokerViewerUI:
                 width=40,
                 height=48,
                 bgcolor=ft.Colors.BLUE_100,
-                border=ft.border.all(1, ft.Colors.BLUE_300),
+                border=_BORDER_BLUE_300,
                 border_radius=5,
                 alignment=ft.alignment.center,
             )
-        suit_symbol = card_str[-1]
-        rank_text = card_str[:-1]
-        color = ft.Colors.RED if suit_symbol in ["♥", "♦"] else ft.Colors.BLACK
+        rank_text, suit_symbol, color = _parse_card(card_str)
         return self._create_card_face(
             rank_text,
             suit_symbol,
@@ -150,27 +427,20 @@ class PokerViewerUI:
     def _create_badge(self, text: str, bg_color, fg_color) -> ft.Container:
         return ft.Container(
             content=ft.Text(text, size=10, weight=ft.FontWeight.BOLD, color=fg_color),
-            padding=ft.padding.symmetric(horizontal=6, vertical=2),
+            padding=_PAD_BADGE,
             bgcolor=bg_color,
             border_radius=50,
         )
 
     def _get_player_name(self, player_id: int) -> str:
-        state = self._last_state or {}
-        for p in state.get("players", []):
-            try:
-                if int(p.get("id")) == int(player_id):
-                    return str(p.get("name", f"Player {player_id}"))
-            except Exception:
-                continue
-        return f"Player {player_id}"
+        return self._name_by_id.get(player_id, f"Player {player_id}")
 
     def _create_amount_badge(self, amount: int, color_bg, color_fg) -> ft.Container:
         return ft.Container(
             content=ft.Text(
                 f"{amount}", size=10, weight=ft.FontWeight.BOLD, color=color_fg
             ),
-            padding=ft.padding.symmetric(horizontal=8, vertical=3),
+            padding=_PAD_PILL,
             bgcolor=color_bg,
             border=ft.border.all(1, color_fg),
             border_radius=20,
@@ -179,263 +449,92 @@ class PokerViewerUI:
     def _create_action_badge(self, text: str, bg, fg) -> ft.Container:
         return ft.Container(
             content=ft.Text(text, size=10, weight=ft.FontWeight.BOLD, color=fg),
-            padding=ft.padding.symmetric(horizontal=8, vertical=3),
+            padding=_PAD_PILL,
             bgcolor=bg,
             border_radius=20,
         )
 
-    def _create_action_history_item(self, action_text: str) -> ft.Container:
-        # Player folded
-        m = re.match(r"Player (\d+) folded", action_text)
-        if m:
-            pid = int(m.group(1))
-            return ft.Container(
-                bgcolor=ft.Colors.RED_50,
-                border=ft.border.all(1, ft.Colors.RED_200),
-                border_radius=8,
-                padding=6,
-                content=ft.Row(
-                    [
-                        self._create_action_badge(
-                            "FOLD", ft.Colors.RED_200, ft.Colors.RED_900
-                        ),
-                        ft.Text(
-                            self._get_player_name(pid),
-                            weight=ft.FontWeight.BOLD,
-                            max_lines=1,
-                            overflow=ft.TextOverflow.ELLIPSIS,
-                        ),
-                    ],
-                    spacing=8,
-                ),
-            )
-
-        # Player checked
-        m = re.match(r"Player (\d+) checked", action_text)
-        if m:
-            pid = int(m.group(1))
-            return ft.Container(
-                bgcolor=ft.Colors.BLUE_50,
-                border=ft.border.all(1, ft.Colors.BLUE_200),
-                border_radius=8,
-                padding=6,
-                content=ft.Row(
-                    [
-                        self._create_action_badge(
-                            "CHECK", ft.Colors.BLUE_200, ft.Colors.BLUE_900
-                        ),
-                        ft.Text(
-                            self._get_player_name(pid),
-                            weight=ft.FontWeight.BOLD,
-                            max_lines=1,
-                            overflow=ft.TextOverflow.ELLIPSIS,
-                        ),
-                    ],
-                    spacing=8,
-                ),
-            )
-
-        # Player called X
-        m = re.match(r"Player (\d+) called (\d+)", action_text)
-        if m:
-            pid = int(m.group(1))
-            amt = int(m.group(2))
-            return ft.Container(
-                bgcolor=ft.Colors.GREEN_50,
-                border=ft.border.all(1, ft.Colors.GREEN_200),
-                border_radius=8,
-                padding=6,
-                content=ft.Row(
-                    [
-                        self._create_action_badge(
-                            "CALL", ft.Colors.GREEN_200, ft.Colors.GREEN_900
-                        ),
-                        ft.Text(
-                            self._get_player_name(pid),
-                            weight=ft.FontWeight.BOLD,
-                            max_lines=1,
-                            overflow=ft.TextOverflow.ELLIPSIS,
-                        ),
-                        self._create_amount_badge(
-                            amt, ft.Colors.AMBER_50, ft.Colors.AMBER_800
-                        ),
-                    ],
-                    spacing=8,
-                ),
-            )
-
-        # Player raised to X
-        m = re.match(r"Player (\d+) raised to (\d+)", action_text)
-        if m:
-            pid = int(m.group(1))
-            to_amt = int(m.group(2))
-            return ft.Container(
-                bgcolor=ft.Colors.ORANGE_50,
-                border=ft.border.all(1, ft.Colors.ORANGE_200),
-                border_radius=8,
-                padding=6,
-                content=ft.Row(
-                    [
-                        self._create_action_badge(
-                            "RAISE", ft.Colors.ORANGE_200, ft.Colors.ORANGE_900
-                        ),
-                        ft.Text(
-                            self._get_player_name(pid),
-                            weight=ft.FontWeight.BOLD,
-                            max_lines=1,
-                            overflow=ft.TextOverflow.ELLIPSIS,
-                        ),
-                        self._create_amount_badge(
-                            to_amt, ft.Colors.AMBER_50, ft.Colors.AMBER_800
-                        ),
-                    ],
-                    spacing=8,
-                ),
-            )
-
-        # Player went all-in with X
-        m = re.match(r"Player (\d+) went all-in with (\d+)", action_text)
-        if m:
-            pid = int(m.group(1))
-            amt = int(m.group(2))
-            return ft.Container(
-                bgcolor=ft.Colors.PURPLE_50,
-                border=ft.border.all(1, ft.Colors.PURPLE_200),
-                border_radius=8,
-                padding=6,
-                content=ft.Row(
-                    [
-                        self._create_action_badge(
-                            "ALL-IN", ft.Colors.PURPLE_200, ft.Colors.PURPLE_900
-                        ),
-                        ft.Text(
-                            self._get_player_name(pid),
-                            weight=ft.FontWeight.BOLD,
-                            max_lines=1,
-                            overflow=ft.TextOverflow.ELLIPSIS,
-                        ),
-                        self._create_amount_badge(
-                            amt, ft.Colors.AMBER_50, ft.Colors.AMBER_800
-                        ),
-                    ],
-                    spacing=8,
-                ),
-            )
+    def _create_action_history_item(self, event: dict) -> ft.Container:
+        # The server sends history as structured events (see state_server)
+        kind = event.get("kind")
+        build = self._HISTORY_BUILDERS.get(kind)
+        if build is None:
+            return self._create_generic_history_item(str(event.get("text", "")))
+        style = _HISTORY_STYLES[kind]
+        return ft.Container(
+            bgcolor=style.bg,
+            border=style.border,
+            border_radius=8,
+            padding=6,
+            content=ft.Row(
+                [
+                    self._create_action_badge(
+                        style.label, style.badge_bg, style.badge_fg
+                    ),
+                    *build(self, event),
+                ],
+                spacing=8,
+                vertical_alignment=ft.CrossAxisAlignment.CENTER,
+            ),
+        )
 
-        # Small blind
-        m = re.match(r"Player (\d+) posted small blind (\d+)", action_text)
-        if m:
-            pid = int(m.group(1))
-            amt = int(m.group(2))
-            return ft.Container(
-                bgcolor=ft.Colors.CYAN_50,
-                border=ft.border.all(1, ft.Colors.CYAN_200),
-                border_radius=8,
-                padding=6,
-                content=ft.Row(
-                    [
-                        self._create_action_badge(
-                            "SB", ft.Colors.CYAN_200, ft.Colors.CYAN_900
-                        ),
-                        ft.Text(self._get_player_name(pid), weight=ft.FontWeight.BOLD),
-                        self._create_amount_badge(
-                            amt, ft.Colors.AMBER_50, ft.Colors.AMBER_800
-                        ),
-                    ],
-                    spacing=8,
-                ),
-            )
+    def _history_key(self, event: dict) -> tuple:
+        # Everything a history row renders: the event plus the player's name
+        return (
+            tuple(
+                (k, tuple(v) if isinstance(v, list) else v) for k, v in event.items()
+            ),
+            self._name_by_id.get(event.get("player_id")),
+        )
 
-        # Big blind
-        m = re.match(r"Player (\d+) posted big blind (\d+)", action_text)
-        if m:
-            pid = int(m.group(1))
-            amt = int(m.group(2))
-            return ft.Container(
-                bgcolor=ft.Colors.INDIGO_50,
-                border=ft.border.all(1, ft.Colors.INDIGO_200),
-                border_radius=8,
-                padding=6,
-                content=ft.Row(
-                    [
-                        self._create_action_badge(
-                            "BB", ft.Colors.INDIGO_200, ft.Colors.INDIGO_900
-                        ),
-                        ft.Text(self._get_player_name(pid), weight=ft.FontWeight.BOLD),
-                        self._create_amount_badge(
-                            amt, ft.Colors.AMBER_50, ft.Colors.AMBER_800
-                        ),
-                    ],
-                    spacing=8,
-                ),
+    def _history_player(self, event: dict) -> List[ft.Control]:
+        # Player folded / checked
+        return [
+            ft.Text(
+                self._get_player_name(event.get("player_id", -1)),
+                weight=ft.FontWeight.BOLD,
+                max_lines=1,
+                overflow=ft.TextOverflow.ELLIPSIS,
             )
+        ]
+
+    def _history_player_amount(self, event: dict) -> List[ft.Control]:
+        # Player called / raised to / went all-in with / posted a blind of X
+        return [
+            *self._history_player(event),
+            self._create_amount_badge(
+                event.get("amount", 0), ft.Colors.AMBER_50, ft.Colors.AMBER_800
+            ),
+        ]
 
+    def _history_board(self, event: dict) -> List[ft.Control]:
         # Flop dealt
-        m = re.match(r"Flop dealt: (.+)", action_text)
-        if m:
-            cards_str = m.group(1)
-            cards = [s.strip() for s in cards_str.split(",")]
-            return ft.Container(
-                bgcolor=ft.Colors.LIGHT_GREEN_50,
-                border=ft.border.all(1, ft.Colors.LIGHT_GREEN_200),
-                border_radius=8,
-                padding=6,
-                content=ft.Row(
-                    [
-                        self._create_action_badge(
-                            "FLOP", ft.Colors.GREEN_200, ft.Colors.GREEN_900
-                        ),
-                        ft.Row([self._create_card_small(c) for c in cards], spacing=4),
-                    ],
-                    spacing=8,
-                    vertical_alignment=ft.CrossAxisAlignment.CENTER,
-                ),
-            )
-
-        # Turn dealt
-        m = re.match(r"Turn dealt: (.+)", action_text)
-        if m:
-            c = m.group(1).strip()
-            return ft.Container(
-                bgcolor=ft.Colors.LIGHT_GREEN_50,
-                border=ft.border.all(1, ft.Colors.LIGHT_GREEN_200),
-                border_radius=8,
-                padding=6,
-                content=ft.Row(
-                    [
-                        self._create_action_badge(
-                            "TURN", ft.Colors.GREEN_200, ft.Colors.GREEN_900
-                        ),
-                        self._create_card_small(c),
-                    ],
-                    spacing=8,
-                ),
-            )
-
-        # River dealt
-        m = re.match(r"River dealt: (.+)", action_text)
-        if m:
-            c = m.group(1).strip()
-            return ft.Container(
-                bgcolor=ft.Colors.LIGHT_GREEN_50,
-                border=ft.border.all(1, ft.Colors.LIGHT_GREEN_200),
-                border_radius=8,
-                padding=6,
-                content=ft.Row(
-                    [
-                        self._create_action_badge(
-                            "RIVER", ft.Colors.GREEN_200, ft.Colors.GREEN_900
-                        ),
-                        self._create_card_small(c),
-                    ],
-                    spacing=8,
-                ),
-            )
-
+        cards = event.get("cards", [])
+        return [ft.Row([self._create_card_small(c) for c in cards], spacing=4)]
+
+    def _history_board_card(self, event: dict) -> List[ft.Control]:
+        # Turn / river dealt
+        return [self._create_card_small(event.get("cards", ["??"])[0])]
+
+    # Action history event kind -> builder of the controls after its badge
+    _HISTORY_BUILDERS: Dict[str, Callable[[PokerViewerUI, dict], List[ft.Control]]] = {
+        "fold": _history_player,
+        "check": _history_player,
+        "call": _history_player_amount,
+        "raise": _history_player_amount,
+        "all_in": _history_player_amount,
+        "small_blind": _history_player_amount,
+        "big_blind": _history_player_amount,
+        "flop": _history_board,
+        "turn": _history_board_card,
+        "river": _history_board_card,
+    }
+
+    def _create_generic_history_item(self, action_text: str) -> ft.Container:
         # Fallback generic item
         return ft.Container(
             bgcolor=ft.Colors.GREY_50,
-            border=ft.border.all(1, ft.Colors.GREY_200),
+            border=_BORDER_GREY_200,
             border_radius=8,
             padding=6,
             content=ft.Text(
@@ -447,10 +546,11 @@ class PokerViewerUI:
         )
 
     def _create_llm_agent_card(self, agent: dict) -> ft.Container:
-        name = str(agent.get("name", "Agent"))
-        action = str(agent.get("action", "")).lower()
-        amount = int(agent.get("amount", 0) or 0)
-        reasoning = str(agent.get("reasoning", "")).strip()
+        # state_server sends these already typed (str / int), so no coercion
+        name = agent.get("name", "Agent")
+        action = agent.get("action", "").lower()
+        amount = agent.get("amount", 0)
+        reasoning = agent.get("reasoning", "").strip()
 
         # Build action row
         row_items: List[ft.Control] = []
@@ -512,7 +612,7 @@ class PokerViewerUI:
                             overflow=ft.TextOverflow.ELLIPSIS,
                         ),
                         bgcolor=ft.Colors.WHITE,
-                        border=ft.border.all(1, ft.Colors.GREY_300),
+                        border=_BORDER_GREY_300,
                         border_radius=6,
                         padding=6,
                     ),
@@ -521,7 +621,7 @@ class PokerViewerUI:
             ),
             width=260,
             bgcolor=ft.Colors.WHITE,
-            border=ft.border.all(1, ft.Colors.GREY_300),
+            border=_BORDER_GREY_300,
             border_radius=8,
             padding=10,
             shadow=ft.BoxShadow(
@@ -636,7 +736,7 @@ class PokerViewerUI:
             content=self._showdown_results_column,
             padding=12,
             bgcolor=ft.Colors.WHITE,
-            border=ft.border.all(1, ft.Colors.GREY_400),
+            border=_BORDER_GREY_400,
             border_radius=10,
             shadow=ft.BoxShadow(
                 spread_radius=2,
@@ -706,7 +806,7 @@ class PokerViewerUI:
                                         ft.Container(
                                             content=self.action_history_column,
                                             height=self.table_height - 20,
-                                            border=ft.border.all(1, ft.Colors.GREY_400),
+                                            border=_BORDER_GREY_400,
                                             border_radius=5,
                                             padding=8,
                                         ),
@@ -725,7 +825,7 @@ class PokerViewerUI:
             padding=10,
             margin=ft.margin.only(bottom=15),
             bgcolor=ft.Colors.WHITE,
-            border=ft.border.all(1, ft.Colors.GREEN_200),
+            border=_BORDER_GREEN_200,
             border_radius=10,
             shadow=ft.BoxShadow(
                 spread_radius=1,
@@ -762,7 +862,7 @@ class PokerViewerUI:
                     ),
                     bgcolor=ft.Colors.GREY_50,
                     padding=10,
-                    border=ft.border.all(1, ft.Colors.GREY_300),
+                    border=_BORDER_GREY_300,
                     border_radius=6,
                 ),
             ],
@@ -771,262 +871,289 @@ class PokerViewerUI:
             scroll=ft.ScrollMode.AUTO,
         )
 
+    def _seat_positions(
+        self, n: int, seat_w: int, seat_h: int
+    ) -> List[Tuple[int, int]]:
+        """(left, top) of each seat around the table, computed once per count."""
+        positions = self._seat_geometry.get(n)
+        if positions is None:
+            cx, cy = self.table_width / 2, self.table_height / 2
+            rx = self.table_width * 0.42
+            ry = self.table_height * 0.36
+            positions = []
+            for i in range(n):
+                theta = 2 * math.pi * i / n + math.pi / 2
+                x = cx + rx * math.cos(theta)
+                y = cy + ry * math.sin(theta)
+                positions.append((int(x - seat_w / 2), int(y - seat_h / 2)))
+            self._seat_geometry[n] = positions
+        return positions
+
     def _build_seat_controls(self) -> List[ft.Control]:
         state = self._last_state or {}
         players = state.get("players", [])
         n = len(players)
         if n == 0:
+            self._seat_count = 0
             return []
 
-        seat_controls: List[ft.Control] = []
-        cx, cy = self.table_width / 2, self.table_height / 2
-        rx = self.table_width * 0.42
-        ry = self.table_height * 0.36
         seat_w, seat_h = 170, 115
+        # Seats only move when the player count changes
+        relayout = n != self._seat_count
+        self._seat_count = n
+        positions = self._seat_positions(n, seat_w, seat_h) if relayout else []
+        # Grow the pool of seat controls on demand; seats are never discarded
+        while len(self._seat_pool) < n:
+            self._seat_pool.append(self._create_seat(seat_w, seat_h))
 
         for i, player in enumerate(players):
-            theta = 2 * math.pi * i / n + math.pi / 2
-            x = cx + rx * math.cos(theta)
-            y = cy + ry * math.sin(theta)
-
-            # Show hole cards face-up in viewer
-            seat_cards = []
-            hole_cards = player.get("hole_cards", [])
-            if hole_cards:
-                for c in hole_cards:
-                    seat_cards.append(self._create_card_small(str(c)))
-            else:
-                seat_cards = [
-                    self._create_card_small("??"),
-                    self._create_card_small("??"),
-                ]
+            seat = self._seat_pool[i]
+            if relayout:
+                seat.root.left, seat.root.top = positions[i]
+            view = SeatView.from_player(player, i)
+            # Skip seats where nothing shown has changed
+            if view != seat.view:
+                self._update_seat(seat, view)
+
+        return [seat.root for seat in self._seat_pool[:n]]
+
+    def _create_seat(self, seat_w: int, seat_h: int) -> _SeatControls:
+        # Controls are created empty and filled in by _update_seat
+        cards_row = ft.Row(alignment=ft.MainAxisAlignment.CENTER, spacing=6)
+        name_text = ft.Text(
+            size=12,
+            weight=ft.FontWeight.BOLD,
+            max_lines=1,
+            overflow=ft.TextOverflow.ELLIPSIS,
+        )
+        badges_row = ft.Row(spacing=4)
+        chips_text = ft.Text(size=11)
+        chips_box = ft.Container(
+            content=chips_text, padding=_PAD_BADGE, border_radius=6
+        )
+        bet_text = ft.Text(size=11)
+        bet_box = ft.Container(content=bet_text, padding=_PAD_BADGE, border_radius=6)
 
-            # Badges
-            badges = []
-            if player.get("is_dealer"):
-                badges.append(
-                    self._create_badge("D", ft.Colors.AMBER_400, ft.Colors.BLACK)
-                )
-            if player.get("is_small_blind"):
-                badges.append(
-                    self._create_badge("SB", ft.Colors.BLUE_300, ft.Colors.BLACK)
-                )
-            if player.get("is_big_blind"):
-                badges.append(
-                    self._create_badge("BB", ft.Colors.BLUE_600, ft.Colors.WHITE)
-                )
+        # seat inner content
+        inner = ft.Container(
+            width=seat_w,
+            height=seat_h,
+            border_radius=10,
+            padding=8,
+            shadow=ft.BoxShadow(
+                spread_radius=1,
+                blur_radius=4,
+                color=ft.Colors.GREY_400,
+                offset=ft.Offset(0, 2),
+            ),
+            content=ft.Column(
+                [
+                    cards_row,
+                    ft.Row(
+                        [name_text, badges_row],
+                        alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
+                    ),
+                    ft.Row(
+                        [chips_box, bet_box],
+                        alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
+                    ),
+                ],
+                spacing=4,
+            ),
+        )
 
-            # Status background (normalize and fallback)
-            status = str(player.get("status", "")).lower()
-            if status in ("bust", "busted_out"):
-                status = "busted"
-            if not status and int(player.get("chips", 0) or 0) <= 0:
-                status = "busted"
-            if status in ("folded", "busted"):
-                bg = ft.Colors.GREY_100
-                border_color = ft.Colors.GREY_400
-            elif status == "all_in":
-                bg = ft.Colors.PURPLE_50
-                border_color = ft.Colors.PURPLE_400
-            else:
-                bg = ft.Colors.WHITE
-                border_color = ft.Colors.GREY_400
-
-            # seat inner content
-            seat_inner = ft.Container(
-                width=seat_w,
-                height=seat_h,
-                bgcolor=bg,
-                border=ft.border.all(1, border_color),
-                border_radius=10,
-                padding=8,
-                shadow=ft.BoxShadow(
-                    spread_radius=1,
-                    blur_radius=4,
-                    color=ft.Colors.GREY_400,
-                    offset=ft.Offset(0, 2),
-                ),
-                content=ft.Column(
-                    [
-                        ft.Row(
-                            seat_cards, alignment=ft.MainAxisAlignment.CENTER, spacing=6
-                        ),
-                        ft.Row(
-                            [
-                                ft.Text(
-                                    player.get("name", f"P{i}"),
-                                    size=12,
-                                    weight=ft.FontWeight.BOLD,
-                                    color=(
-                                        ft.Colors.GREY_600
-                                        if status in ("folded", "busted")
-                                        else ft.Colors.BLACK
-                                    ),
-                                    style=(
-                                        ft.TextStyle(
-                                            decoration=ft.TextDecoration.LINE_THROUGH
-                                        )
-                                        if status in ("folded", "busted")
-                                        else None
-                                    ),
-                                    max_lines=1,
-                                    overflow=ft.TextOverflow.ELLIPSIS,
-                                ),
-                                ft.Row(badges, spacing=4),
-                            ],
-                            alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
-                        ),
-                        ft.Row(
-                            [
-                                ft.Container(
-                                    content=ft.Text(
-                                        f"{player.get('chips', 0):,}",
-                                        size=11,
-                                        color=(
-                                            ft.Colors.GREY_700
-                                            if status in ("folded", "busted")
-                                            else ft.Colors.GREEN_700
-                                        ),
-                                    ),
-                                    bgcolor=(
-                                        ft.Colors.GREY_100
-                                        if status in ("folded", "busted")
-                                        else ft.Colors.GREEN_50
-                                    ),
-                                    padding=ft.padding.symmetric(
-                                        horizontal=6, vertical=2
-                                    ),
-                                    border_radius=6,
-                                ),
-                                ft.Container(
-                                    content=ft.Text(
-                                        (
-                                            f"Bet {player.get('current_bet', 0)}"
-                                            if player.get("current_bet", 0) > 0
-                                            else "Bet 0"
-                                        ),
-                                        size=11,
-                                        color=(
-                                            ft.Colors.GREY_600
-                                            if status in ("folded", "busted")
-                                            else (
-                                                ft.Colors.RED_600
-                                                if player.get("current_bet", 0) > 0
-                                                else ft.Colors.GREY_600
-                                            )
-                                        ),
-                                    ),
-                                    bgcolor=(
-                                        ft.Colors.GREY_100
-                                        if status in ("folded", "busted")
-                                        else (
-                                            ft.Colors.YELLOW_50
-                                            if player.get("current_bet", 0) > 0
-                                            else ft.Colors.GREY_50
-                                        )
-                                    ),
-                                    padding=ft.padding.symmetric(
-                                        horizontal=6, vertical=2
-                                    ),
-                                    border_radius=6,
-                                ),
-                            ],
-                            alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
-                        ),
-                    ],
-                    spacing=4,
-                ),
-            )
+        # Folded / busted overlay, shown only for those statuses
+        overlay_text = ft.Text(
+            size=14,
+            weight=ft.FontWeight.BOLD,
+            color=ft.Colors.RED_700,
+        )
+        overlay = ft.Container(
+            width=seat_w,
+            height=seat_h,
+            bgcolor=ft.Colors.with_opacity(0.55, ft.Colors.GREY_200),
+            border_radius=10,
+            alignment=ft.alignment.center,
+            visible=False,
+            content=ft.Container(
+                padding=_PAD_OVERLAY_LABEL,
+                bgcolor=ft.Colors.with_opacity(0.85, ft.Colors.WHITE),
+                border=_BORDER_RED_400,
+                border_radius=20,
+                content=overlay_text,
+            ),
+        )
 
-            if status in ("folded", "busted"):
-                overlay_text = "❌ フォールド" if status == "folded" else "❌ バスト"
-                state_overlay = ft.Container(
-                    width=seat_w,
-                    height=seat_h,
-                    bgcolor=ft.Colors.with_opacity(0.55, ft.Colors.GREY_200),
-                    border_radius=10,
-                    alignment=ft.alignment.center,
-                    content=ft.Container(
-                        padding=ft.padding.symmetric(horizontal=8, vertical=4),
-                        bgcolor=ft.Colors.with_opacity(0.85, ft.Colors.WHITE),
-                        border=ft.border.all(1, ft.Colors.RED_400),
-                        border_radius=20,
-                        content=ft.Text(
-                            overlay_text,
-                            size=14,
-                            weight=ft.FontWeight.BOLD,
-                            color=ft.Colors.RED_700,
-                        ),
-                    ),
-                )
-                seat = ft.Stack(
-                    width=seat_w, height=seat_h, controls=[seat_inner, state_overlay]
-                )
-            else:
-                seat = seat_inner
+        root = ft.Container(
+            content=ft.Stack(width=seat_w, height=seat_h, controls=[inner, overlay])
+        )
+        return _SeatControls(
+            root=root,
+            inner=inner,
+            cards_row=cards_row,
+            name_text=name_text,
+            badges_row=badges_row,
+            chips_box=chips_box,
+            chips_text=chips_text,
+            bet_box=bet_box,
+            bet_text=bet_text,
+            overlay=overlay,
+            overlay_text=overlay_text,
+        )
 
-            seat_controls.append(
-                ft.Container(
-                    left=int(x - seat_w / 2), top=int(y - seat_h / 2), content=seat
-                )
-            )
+    def _update_seat(self, seat: _SeatControls, view: SeatView) -> None:
+        prev = seat.view
+        seat.view = view
+
+        # Show hole cards face-up in viewer
+        if prev is None or prev.cards != view.cards:
+            seat.cards_row.controls = [
+                self._create_card_small(c) for c in view.cards or ("??", "??")
+            ]
 
-        return seat_controls
+        # Badges
+        badges = []
+        if view.is_dealer:
+            badges.append(self._create_badge("D", ft.Colors.AMBER_400, ft.Colors.BLACK))
+        if view.is_small_blind:
+            badges.append(self._create_badge("SB", ft.Colors.BLUE_300, ft.Colors.BLACK))
+        if view.is_big_blind:
+            badges.append(self._create_badge("BB", ft.Colors.BLUE_600, ft.Colors.WHITE))
+        seat.badges_row.controls = badges
+
+        # Style by status class and whether the player has a bet out
+        status = view.status
+        out = status in _INACTIVE_STATUSES
+        status_class = "out" if out else "all_in" if status == "all_in" else "active"
+        style = _SEAT_STYLES[status_class, view.current_bet > 0]
+
+        seat.inner.bgcolor = style.bg
+        seat.inner.border = style.border
+        seat.name_text.value = view.name
+        seat.name_text.color = style.name_color
+        seat.name_text.style = style.name_style
+        seat.chips_text.value = f"{view.chips:,}"
+        seat.chips_text.color = style.chips_color
+        seat.chips_box.bgcolor = style.chips_bg
+        seat.bet_text.value = f"Bet {view.current_bet}"
+        seat.bet_text.color = style.bet_color
+        seat.bet_box.bgcolor = style.bet_bg
+
+        seat.overlay.visible = out
+        if out:
+            seat.overlay_text.value = _OVERLAY_TEXT[status]
 
     def _phase_name(self, phase_value: str) -> str:
-        names = {
-            "preflop": "プリフロップ",
-            "flop": "フロップ",
-            "turn": "ターン",
-            "river": "リバー",
-            "showdown": "ショーダウン",
-            "finished": "終了",
-        }
-        return names.get(phase_value, "不明")
+        return _PHASE_NAMES.get(phase_value, "不明")
+
+    @staticmethod
+    def _changed(prev: Optional[dict], state: dict, *keys: str) -> bool:
+        """True if any of the given sections differ from the rendered state."""
+        if prev is None:
+            return True
+        return any(prev.get(key) != state.get(key) for key in keys)
 
     def update_display(self):
         state = self._last_state
         if not state or not state.get("ready"):
-            self.game_info_text.value = (
-                "ゲーム待機中... プレイヤーUIでゲーム開始してください"
-            )
+            waiting = "ゲーム待機中... プレイヤーUIでゲーム開始してください"
+            if self._rendered_state is None and self.game_info_text.value == waiting:
+                # Already showing the waiting message; nothing to send
+                return
+            self.game_info_text.value = waiting
+            # Force a full rebuild once the game becomes ready again
+            self._rendered_state = None
+            self._history_names = None
             if self.page:
                 self.page.update()
             return
 
-        # Info bar
-        phase_name = self._phase_name(state.get("phase", ""))
-        self.game_info_text.value = (
-            f"🎯 ハンド #{state.get('hand_number', 0)} | 🎲 フェーズ: {phase_name}"
+        # id -> name index for history rows and showdown results
+        players = state.get("players", [])
+        self._name_by_id = {
+            p["id"]: str(p.get("name", f"Player {p['id']}"))
+            for p in players
+            if "id" in p
+        }
+
+        # Only rebuild the sections whose data changed since the last render.
+        # Decide everything that is dirty first, then write the controls, and
+        # skip the page update entirely when nothing changed.
+        prev = self._rendered_state
+        changed = self._changed
+        info_dirty = changed(prev, state, "hand_number", "phase")
+        board_dirty = changed(prev, state, "community_cards")
+        pot_dirty = self.pot_text is not None and changed(
+            prev, state, "pot", "current_bet"
+        )
+        # The showdown overlay also shows the community cards; without an
+        # overlay, a new board card leaves the table stack as is
+        table_dirty = self.table_stack is not None and (
+            changed(prev, state, "players", "showdown_results")
+            or bool(state.get("showdown_results") and board_dirty)
+        )
+        agents_dirty = self.llm_agents_grid is not None and changed(
+            prev, state, "llm_api_agents"
+        )
+        # History is append-only, so normally only the new tail is built
+        actions = state.get("action_history", []) or []
+        total = state.get("action_history_len", len(actions))
+        names = [(p.get("id"), p.get("name")) for p in players]
+        new_count = total - self._history_len
+        # New game, renamed players, or too far behind: rebuild
+        history_rebuild = (
+            names != self._history_names or new_count < 0 or new_count > len(actions)
         )
+        if not (
+            info_dirty
+            or board_dirty
+            or pot_dirty
+            or table_dirty
+            or agents_dirty
+            or history_rebuild
+            or new_count
+        ):
+            return
 
-        # Community cards
-        self.community_cards_row.controls.clear()
-        community = state.get("community_cards", [])
-        if community:
-            for card in community:
-                self.community_cards_row.controls.append(
-                    self._create_card_small(str(card))
-                )
-        else:
-            self.community_cards_row.controls.append(
-                ft.Text("まだカードがありません", size=12, color=ft.Colors.WHITE)
+        # Info bar / header status
+        if info_dirty:
+            phase_name = self._phase_name(state.get("phase", ""))
+            self.game_info_text.value = (
+                f"🎯 ハンド #{state.get('hand_number', 0)} | 🎲 フェーズ: {phase_name}"
             )
+            if self.table_status_text:
+                self.table_status_text.value = (
+                    f"Hand #{state.get('hand_number', 0)}  •  {phase_name}"
+                )
+
+        # Community cards
+        if board_dirty:
+            community = state.get("community_cards", [])
+            if community:
+                # The board only grows within a hand, so keep the cards
+                # already shown and build just the newly dealt ones
+                shown = (prev or {}).get("community_cards") or []
+                keep = 0
+                for old, new in zip(shown, community):
+                    if old != new:
+                        break
+                    keep += 1
+                controls = self.community_cards_row.controls
+                del controls[keep:]
+                controls.extend(self._create_card_small(c) for c in community[keep:])
+            else:
+                self.community_cards_row.controls = [
+                    ft.Text("まだカードがありません", size=12, color=ft.Colors.WHITE)
+                ]
 
         # Pot / Bet
-        if self.pot_text:
+        if pot_dirty:
             pot = state.get("pot", 0)
             current_bet = state.get("current_bet", 0)
             self.pot_text.value = f"💰 Pot: {pot:,}   💵 Bet: {current_bet:,}"
 
-        # Header status
-        if self.table_status_text:
-            self.table_status_text.value = (
-                f"Hand #{state.get('hand_number', 0)}  •  {phase_name}"
-            )
-
-        # Seats
-        if self.table_stack:
+        # Seats and showdown overlay
+        if table_dirty:
             base_controls = [
                 self.table_background,
                 self.community_cards_holder,
@@ -1054,21 +1181,54 @@ class PokerViewerUI:
             self.table_stack.controls = base_controls + seat_controls + overlay_controls
 
         # Action history (latest first) - styled same as game_ui
-        self.action_history_column.controls.clear()
-        actions = state.get("action_history", [])
-        all_actions_desc = list(reversed(actions)) if actions else []
-        for action in all_actions_desc:
-            self.action_history_column.controls.append(
-                self._create_action_history_item(action)
-            )
+        history_controls = self.action_history_column.controls
+        if history_rebuild:
+            # Reuse rows already on screen for identical entries (each row at
+            # most once, since a control can have only one parent)
+            reusable: Dict[tuple, List[ft.Control]] = {}
+            for key, control in zip(self._history_keys, history_controls):
+                reusable.setdefault(key, []).append(control)
+            keys = [self._history_key(action) for action in reversed(actions)]
+            history_controls[:] = [
+                (
+                    reusable[key].pop()
+                    if reusable.get(key)
+                    else self._create_action_history_item(action)
+                )
+                for key, action in zip(keys, reversed(actions))
+            ]
+            self._history_keys = keys
+        elif new_count:
+            # Newest first, walking the tail in place without copying it
+            new_rows: List[ft.Control] = []
+            new_keys: List[tuple] = []
+            for action in itertools.islice(reversed(actions), new_count):
+                new_rows.append(self._create_action_history_item(action))
+                new_keys.append(self._history_key(action))
+            history_controls[0:0] = new_rows
+            self._history_keys[0:0] = new_keys
+            # Keep the same number of rows the server sends
+            del history_controls[len(actions) :]
+            del self._history_keys[len(actions) :]
 
         # LLM API Agents panel (latest decisions) - responsive wrap
-        if self.llm_agents_grid is not None:
-            self.llm_agents_grid.controls.clear()
+        if agents_dirty:
+            # Only agents with a new decision get a new card
             agents = state.get("llm_api_agents", []) or []
+            cards: Dict[int, Tuple[dict, ft.Control]] = {}
+            controls: List[ft.Control] = []
             for agent in agents:
-                self.llm_agents_grid.controls.append(self._create_llm_agent_card(agent))
-
+                cached = self._llm_cards.get(agent["id"])
+                if cached is None or cached[0] != agent:
+                    cached = (agent, self._create_llm_agent_card(agent))
+                cards[agent["id"]] = cached
+                controls.append(cached[1])
+            self._llm_cards = cards
+            self.llm_agents_grid.controls = controls
+
+        self._rendered_state = state
+        self._history_len = total
+        self._history_names = names
         if self.page:
             self.page.update()
 
@@ -1109,10 +1269,10 @@ class PokerViewerUI:
                 ft.Text("各プレイヤーのハンド", size=12, weight=ft.FontWeight.W_600)
             )
             for hand_info in all_hands:
-                pid = int(hand_info.get("player_id", -1))
-                player_name = self._get_player_name(pid)
-                cards = [str(c) for c in hand_info.get("cards", [])]
-                hand_desc = str(hand_info.get("hand", ""))
+                # PokerGame records showdown fields already typed
+                player_name = self._get_player_name(hand_info.get("player_id", -1))
+                cards = hand_info.get("cards", [])
+                hand_desc = hand_info.get("hand", "")
                 row = ft.Row(
                     [
                         ft.Text(player_name, size=12, weight=ft.FontWeight.BOLD),
@@ -1132,10 +1292,9 @@ class PokerViewerUI:
                 ft.Text("勝者", size=12, weight=ft.FontWeight.W_600)
             )
             for r in results_list:
-                pid = int(r.get("player_id", -1))
-                winnings = int(r.get("winnings", 0) or 0)
-                hand_desc = str(r.get("hand", ""))
-                player_name = self._get_player_name(pid)
+                winnings = r.get("winnings", 0)
+                hand_desc = r.get("hand", "")
+                player_name = self._get_player_name(r.get("player_id", -1))
                 winner_row = ft.Row(
                     [
                         ft.Text("🏆", size=14),
@@ -1160,24 +1319,129 @@ class PokerViewerUI:
         self._showdown_results_column.controls.clear()
         self.showdown_overlay_container.visible = False
 
+    def _fetch_state(self) -> Optional[dict]:
+        """Fetch state from the main process; None means unchanged (304)."""
+        headers = {"If-None-Match": self._etag} if self._etag else None
+        resp = self._http.get(self.state_url, headers=headers, timeout=1.0)
+        if resp.status_code == 304:
+            return None
+        if not resp.ok:
+            self._etag = None
+            return {"ready": False}
+        self._etag = resp.headers.get("ETag")
+        return _json_loads(resp.content)
+
+    def _listen_events(self, on_state: Callable[[dict], None]) -> None:
+        """Follow the /events stream, calling on_state for each pushed snapshot.
+
+        Returns when the stream ends and raises on connection errors. The
+        server sends a keep-alive comment at least every 15 seconds, so a
+        longer silence means the connection is gone. After the first full
+        snapshot, events may be deltas of the changed top-level fields.
+        """
+        with self._http.get(self.events_url, stream=True, timeout=(1.0, 30.0)) as resp:
+            resp.raise_for_status()
+            event_id = None
+            event_type = None
+            # Snapshot the stream has brought us to; "delta" events apply to it
+            base: Optional[dict] = None
+            for line in resp.iter_lines(chunk_size=None):
+                if not self._running:
+                    return
+                if line.startswith(b"event: "):
+                    event_type = line[7:]
+                elif line.startswith(b"id: "):
+                    event_id = line[4:].decode()
+                elif line.startswith(b"data: "):
+                    payload = _json_loads(line[6:])
+                    if event_type == b"delta":
+                        state = {
+                            k: v for k, v in base.items() if k not in payload["removed"]
+                        }
+                        state.update(payload["changed"])
+                    else:
+                        state = payload
+                    base = state
+                    # The id is the snapshot's ETag; skip one we already have
+                    if event_id is None or event_id != self._etag:
+                        self._etag = event_id
+                        on_state(state)
+                    event_id = None
+                    event_type = None
+
+    def _apply_state(self, state: dict) -> None:
+        self._last_state = state
+        self.update_display()
+
+    def _schedule_state(self, state: dict) -> None:
+        """Coalesce bursts of pushed states into one redraw of the newest.
+
+        Must run on the UI event loop.
+        """
+        self._pending_state = state
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                0.1, self._flush_state
+            )
+
+    def _flush_state(self) -> None:
+        state, self._pending_state = self._pending_state, None
+        self._flush_handle = None
+        if state is not None:
+            self._apply_state(state)
+
     async def _poll_loop(self):
-        while True:
+        loop = asyncio.get_running_loop()
+
+        def on_state(state: dict) -> None:
+            # Called from the stream thread; redraw on the UI event loop
+            loop.call_soon_threadsafe(self._schedule_state, state)
+
+        # Wait between reconnect attempts; doubles while the main process is
+        # unreachable so an idle viewer does not keep hammering it
+        retry_delay = 0.5
+        # Fallback poll interval while the stream is unavailable: short while
+        # the state keeps changing, stretched while it stays the same
+        poll_delay = 0.2
+        while self._running:
             try:
-                # Fetch state from HTTP server hosted by main process
+                # One-shot snapshot from the HTTP server hosted by main process.
+                # Run the blocking request off the UI event loop.
                 try:
-                    resp = requests.get(self.state_url, timeout=1.0)
-                    if resp.ok:
-                        self._last_state = resp.json()
-                    else:
-                        self._last_state = {"ready": False}
+                    state = await asyncio.to_thread(self._fetch_state)
+                    reachable = True
                 except Exception:
-                    self._last_state = {"ready": False}
-
-                self.update_display()
-                await asyncio.sleep(0.5)
+                    self._etag = None
+                    state = {"ready": False}
+                    reachable = False
+
+                # Skip decoding and redrawing when the server reports no change
+                if state is not None:
+                    self._apply_state(state)
+
+                # Then wait for pushed updates instead of polling. If the
+                # stream is unavailable, this falls back to adaptive-interval
+                # snapshots via the loop below.
+                if reachable:
+                    if state is None:
+                        poll_delay = min(poll_delay * 1.5, 2.0)
+                    else:
+                        poll_delay = 0.2
+                    retry_delay = poll_delay
+                    try:
+                        await asyncio.to_thread(self._listen_events, on_state)
+                    except Exception:
+                        pass
+                else:
+                    retry_delay = min(retry_delay * 2, 5.0)
+                await asyncio.sleep(retry_delay)
             except Exception:
                 # Avoid breaking the loop on transient errors
-                await asyncio.sleep(0.5)
+                await asyncio.sleep(retry_delay)
+
+    def _on_close(self, e) -> None:
+        # Let the poll loop and stream thread finish on their own
+        self._running = False
 
     # --- Flet entry ------------------------------------------------------
     def main(self, page: ft.Page):
@@ -1193,7 +1457,9 @@ class PokerViewerUI:
         page.add(layout)
         page.update()
 
-        # Start polling JSON state periodically
+        # Start the single long-running state poll loop
+        self._running = True
+        page.on_close = self._on_close
         page.run_task(self._poll_loop)
 
 
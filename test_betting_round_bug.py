@@ -3,225 +3,88 @@
 テキサスホールデムのベッティングルール確認テスト
 """
 
-from poker.game import PokerGame, GamePhase
-from poker.player_models import RandomPlayer, PlayerStatus
-
-
-def test_preflop_betting_round():
-    """プリフロップでベッティングラウンドが適切に管理されるかテスト"""
-    print("=== テスト1: プリフロップでのコール ===")
-    game = PokerGame(small_blind=10, big_blind=20, initial_chips=1000)
-
-    # 4人のRandomPlayerを追加
-    for i in range(4):
-        game.add_player(RandomPlayer(i, f"Player{i}", 1000))
-
-    # ゲーム開始
-    game.start_new_hand()
+import logging
 
-    print(f"Phase: {game.current_phase}")
-    print(f"Current bet: {game.current_bet}")
-    print(f"Pot: {game.pot}")
-    print(f"Current player: {game.current_player_index}")
-    print(f"Last raiser index: {game.last_raiser_index}")
-    print(f"Betting round complete: {game.betting_round_complete}")
+import pytest
 
-    # プレイヤーの状態確認
-    for i, player in enumerate(game.players):
-        print(
-            f"Player {i}: chips={player.chips}, current_bet={player.current_bet}, "
-            f"status={player.status}, is_big_blind={player.is_big_blind}"
-        )
-
-    print("\n--- 各プレイヤーがコールする ---")
-
-    # 最初の2人がコール（UTGとその次）
-    for _ in range(2):
-        current_player = game.players[game.current_player_index]
-        print(
-            f"\nPlayer {game.current_player_index} (chips: {current_player.chips}) calls"
-        )
-
-        # コールアクション
-        success = game.process_player_action(game.current_player_index, "call", 0)
-        print(f"Action success: {success}")
-        print(f"Betting round complete: {game.betting_round_complete}")
-
-        if game.betting_round_complete:
-            print("❌ ERROR: Betting round completed too early!")
-            return False
-
-    # スモールブラインドプレイヤーがコール
-    current_player = game.players[game.current_player_index]
-    print(
-        f"\nPlayer {game.current_player_index} (Small Blind, chips: {current_player.chips}) calls"
-    )
-
-    success = game.process_player_action(game.current_player_index, "call", 0)
-    print(f"Action success: {success}")
-    print(f"Betting round complete: {game.betting_round_complete}")
-
-    if game.betting_round_complete:
-        print("❌ ERROR: Betting round completed before Big Blind had a chance to act!")
-        return False
-
-    # ビッグブラインドプレイヤーの番になっているか確認
-    bb_player = None
-    for player in game.players:
-        if player.is_big_blind:
-            bb_player = player
-            break
-
-    if bb_player and game.current_player_index == bb_player.id:
-        print(f"✅ Correct: Big Blind player {bb_player.id} has a chance to act")
-
-        # ビッグブラインドがチェック
-        print(f"\nPlayer {game.current_player_index} (Big Blind) checks")
-        success = game.process_player_action(game.current_player_index, "check", 0)
-        print(f"Action success: {success}")
-        print(f"Betting round complete: {game.betting_round_complete}")
-
-        if not game.betting_round_complete:
-            print("❌ ERROR: Betting round should be complete after Big Blind checks!")
-            return False
+from poker.game import PokerGame, GamePhase
+from poker.player_models import RandomPlayer, PlayerStatus
 
-        print("✅ Correct: Betting round completed after Big Blind acted")
-        return True
-    else:
-        print(
-            f"❌ ERROR: Current player {game.current_player_index} is not the Big Blind"
-        )
-        return False
+logger = logging.getLogger(__name__)
 
 
-def test_preflop_with_raise():
-    """プリフロップでレイズがある場合のテスト"""
-    print("\n=== テスト2: プリフロップでのレイズ ===")
+@pytest.fixture
+def game():
+    """4人のRandomPlayerでハンドを開始したゲーム"""
     game = PokerGame(small_blind=10, big_blind=20, initial_chips=1000)
-
-    # 4人のRandomPlayerを追加
     for i in range(4):
         game.add_player(RandomPlayer(i, f"Player{i}", 1000))
-
-    # ゲーム開始
     game.start_new_hand()
-
-    print(
-        f"Initial state - Current player: {game.current_player_index}, Last raiser: {game.last_raiser_index}"
-    )
-
-    # UTGがレイズ
-    print(f"\nPlayer {game.current_player_index} raises to 40")
-    success = game.process_player_action(game.current_player_index, "raise", 20)
-    print(f"Action success: {success}")
-    print(f"New current bet: {game.current_bet}, Last raiser: {game.last_raiser_index}")
-    print(f"Betting round complete: {game.betting_round_complete}")
-
-    # 次の2人がフォールド
-    for _ in range(2):
-        current_player = game.players[game.current_player_index]
-        print(f"\nPlayer {game.current_player_index} folds")
-        success = game.process_player_action(game.current_player_index, "fold", 0)
-        print(f"Action success: {success}")
-        print(f"Betting round complete: {game.betting_round_complete}")
-
-    # スモールブラインドがコール
-    print(f"\nPlayer {game.current_player_index} (Small Blind) calls")
-    success = game.process_player_action(game.current_player_index, "call", 0)
-    print(f"Action success: {success}")
-    print(f"Betting round complete: {game.betting_round_complete}")
-
-    # ビッグブラインドがコール
-    print(f"\nPlayer {game.current_player_index} (Big Blind) calls")
-    success = game.process_player_action(game.current_player_index, "call", 0)
-    print(f"Action success: {success}")
-    print(f"Betting round complete: {game.betting_round_complete}")
-
-    if not game.betting_round_complete:
-        print("❌ ERROR: Betting round should be complete after all players acted!")
-        return False
-
-    print("✅ Correct: Betting round completed correctly with raise")
-    return True
+    return game
+
+
+@pytest.mark.parametrize(
+    "scenario_name, actions",
+    [
+        # UTGとディーラーがコール、SBがコール、最後にBBがチェック
+        (
+            "call",
+            [("call", 0), ("call", 0), ("call", 0), ("check", 0)],
+        ),
+        # UTGが40にレイズ、ディーラーがフォールド、SBとBBがコール
+        (
+            "raise",
+            [("raise", 20), ("fold", 0), ("call", 0), ("call", 0)],
+        ),
+    ],
+)
+def test_preflop_betting_round(game, scenario_name, actions):
+    """プリフロップのベッティングラウンドが全員のアクション後にだけ完了するかテスト"""
+    for i, (action, amount) in enumerate(actions):
+        logger.debug(
+            "%s: Player %d %s %d",
+            scenario_name,
+            game.current_player_index,
+            action,
+            amount,
+        )
+        is_last = i == len(actions) - 1
+        if is_last:
+            # ビッグブラインドにもアクションの機会があること
+            assert game.players[game.current_player_index].is_big_blind
+        assert game.process_player_action(game.current_player_index, action, amount)
+        assert game.betting_round_complete == is_last
 
 
-def test_postflop_betting():
+def test_postflop_betting(game):
     """フロップ以降のベッティングテスト"""
-    print("\n=== テスト3: フロップでのベッティング ===")
-    game = PokerGame(small_blind=10, big_blind=20, initial_chips=1000)
-
-    # 4人のRandomPlayerを追加
-    for i in range(4):
-        game.add_player(RandomPlayer(i, f"Player{i}", 1000))
-
-    # ゲーム開始（プリフロップを完了）
-    game.start_new_hand()
-
-    # プリフロップを簡単に終了（全員コール）
+    # プリフロップを簡単に終了（全員コール、ビッグブラインドはチェック）
     while not game.betting_round_complete:
         current_player = game.players[game.current_player_index]
         if (
             current_player.is_big_blind
             and game.current_bet == current_player.current_bet
         ):
-            # ビッグブラインドがチェック
             game.process_player_action(game.current_player_index, "check", 0)
         else:
-            # 他はコール
             game.process_player_action(game.current_player_index, "call", 0)
 
     # フロップに進む
     game.advance_to_next_phase()
-    print(f"Phase: {game.current_phase}")
-    print(f"Current player: {game.current_player_index}")
-    print(f"Current bet: {game.current_bet}")
-    print(f"Last raiser: {game.last_raiser_index}")
+    assert game.current_phase == GamePhase.FLOP
 
     # 最初のプレイヤーがベット
-    print(f"\nPlayer {game.current_player_index} bets 30")
-    success = game.process_player_action(game.current_player_index, "raise", 30)
-    print(f"Action success: {success}")
-    print(f"Last raiser: {game.last_raiser_index}")
-    print(f"Betting round complete: {game.betting_round_complete}")
+    logger.debug("Player %d bets 30", game.current_player_index)
+    assert game.process_player_action(game.current_player_index, "raise", 30)
+    assert not game.betting_round_complete
 
     # 他のプレイヤーがフォールド
+    folds = 0
     while not game.betting_round_complete:
-        current_player = game.players[game.current_player_index]
-        print(f"\nPlayer {game.current_player_index} folds")
-        success = game.process_player_action(game.current_player_index, "fold", 0)
-        print(f"Action success: {success}")
-        print(f"Betting round complete: {game.betting_round_complete}")
-
-    print("✅ Correct: Post-flop betting completed correctly")
-    return True
-
-
-def run_all_tests():
-    """全テストを実行"""
-    tests = [test_preflop_betting_round, test_preflop_with_raise, test_postflop_betting]
-
-    passed = 0
-    total = len(tests)
-
-    for test in tests:
-        try:
-            if test():
-                passed += 1
-            else:
-                print(f"❌ Test {test.__name__} failed!")
-        except Exception as e:
-            print(f"❌ Test {test.__name__} failed with exception: {e}")
-
-    print(f"\n=== テスト結果 ===")
-    print(f"合格: {passed}/{total}")
-
-    if passed == total:
-        print("✅ 全テスト合格！ベッティングラウンドは正しく動作しています。")
-        return True
-    else:
-        print("❌ 一部のテストが失敗しました。")
-        return False
-
+        logger.debug("Player %d folds", game.current_player_index)
+        assert game.process_player_action(game.current_player_index, "fold", 0)
+        folds += 1
 
-if __name__ == "__main__":
-    run_all_tests()
+    assert folds == 3
+    active = [p for p in game.players if p.status == PlayerStatus.ACTIVE]
+    assert len(active) == 1
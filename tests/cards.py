@@ -0,0 +1,8 @@
+"""
+Card table shared by the test modules
+"""
+
+from poker.game_models import Card, Suit
+
+# (rank, suit) ごとに1つだけ作った Card。生成・検証自体を見るテスト以外はこれを使う
+CARDS = {(rank, suit): Card(rank, suit) for suit in Suit for rank in range(2, 15)}
@@ -0,0 +1,39 @@
+"""
+Micro-benchmarks for poker.game_models / poker.player_models
+
+pytest-benchmark がインストールされていない環境ではモジュールごとスキップする。
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from poker.game_models import Card, Deck, Suit
+from poker.player_models import RandomPlayer
+
+
+def test_bench_deck_init(benchmark):
+    """52枚のデッキ生成"""
+    deck = benchmark(Deck)
+    assert deck.cards_remaining() == 52
+
+
+def test_bench_card_hash(benchmark):
+    """Card.__hash__"""
+    card = Card(14, Suit.SPADES)
+    assert benchmark(hash, card) == hash(Card(14, Suit.SPADES))
+
+
+def test_bench_player_bet(benchmark):
+    """RandomPlayer.bet（毎回新しいプレイヤーで計測）"""
+
+    def setup():
+        # 準備（プレイヤー生成）は計測に含めない
+        return (RandomPlayer(1, "Bench Player", 1000), 100), {}
+
+    actual = benchmark.pedantic(
+        lambda player, amount: player.bet(amount),
+        setup=setup,
+        rounds=1000,
+    )
+    assert actual == 100
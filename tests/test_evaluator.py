@@ -2,9 +2,91 @@
 Tests for poker.evaluator module
 """
 
+import random
+from collections import Counter
+from itertools import combinations
+
 import pytest
 from poker.game_models import Card, Suit
 from poker.evaluator import HandRank, HandResult, HandEvaluator
+from poker import evaluator_lut
+from poker.evaluator_lut import KICKERS, card_index
+
+
+def _reference_five(cards):
+    """ルックアップテーブルを使わない素朴な5枚評価（テスト用の基準実装）
+
+    Returns:
+        (HandRank.value, キッカー) - evaluator_lut.KICKERS と同じ形式
+    """
+    ranks = sorted((card.rank for card in cards), reverse=True)
+    counts = Counter(ranks)
+    # 枚数の多い順、同じ枚数ならランクの高い順
+    grouped = tuple(sorted(counts, key=lambda r: (counts[r], r), reverse=True))
+    shape = sorted(counts.values(), reverse=True)
+    flush = len({card.suit for card in cards}) == 1
+
+    straight_high = None
+    if len(counts) == 5:
+        if ranks[0] - ranks[4] == 4:
+            straight_high = ranks[0]
+        elif ranks == [14, 5, 4, 3, 2]:
+            straight_high = 5
+
+    if straight_high and flush:
+        return (10 if straight_high == 14 else 9), (straight_high,)
+    if shape == [4, 1]:
+        return 8, grouped
+    if shape == [3, 2]:
+        return 7, grouped
+    if flush:
+        return 6, tuple(ranks)
+    if straight_high:
+        return 5, (straight_high,)
+    if shape == [3, 1, 1]:
+        return 4, grouped
+    if shape == [2, 2, 1]:
+        return 3, grouped
+    if shape == [2, 1, 1, 1]:
+        return 2, grouped
+    return 1, tuple(ranks)
+
+
+def _reference_best(cards):
+    """5〜7枚から最も強い5枚の (HandRank.value, キッカー) を総当たりで求める"""
+    return max(_reference_five(five) for five in combinations(cards, 5))
+
+
+def _cards(text):
+    """「As Kh 10d」形式の文字列から Card のリストを作る"""
+    ranks = {"J": 11, "Q": 12, "K": 13, "A": 14}
+    suits = {"s": Suit.SPADES, "h": Suit.HEARTS, "d": Suit.DIAMONDS, "c": Suit.CLUBS}
+    return [
+        Card(ranks.get(token[:-1]) or int(token[:-1]), suits[token[-1]])
+        for token in text.split()
+    ]
+
+
+def _batch_values(hands, use_numpy):
+    """hands（各行の先頭2枚がホールカード）を evaluate_batch で評価"""
+    hole = [[card_index(card) for card in hand[:2]] for hand in hands]
+    board = [[card_index(card) for card in hand[2:]] for hand in hands]
+    if use_numpy:
+        np = evaluator_lut.np
+        hole = np.array(hole, dtype=np.uint8)
+        board = np.array(board, dtype=np.uint8)
+    return [int(value) for value in HandEvaluator.evaluate_batch(hole, board)]
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "fallback"])
+def use_numpy(request, monkeypatch):
+    """evaluate_batch を NumPy 実装とフォールバック実装の両方で実行する"""
+    if request.param:
+        if evaluator_lut.np is None:
+            pytest.skip("numpy is not installed")
+    else:
+        monkeypatch.setattr(evaluator_lut, "np", None)
+    return request.param
 
 
 class TestHandRank:
@@ -390,3 +472,44 @@ class TestHandEvaluator:
 
         with pytest.raises(ValueError, match="Must evaluate exactly 5 cards"):
             HandEvaluator._evaluate_five_cards(cards)
+
+
+class TestEvaluateBatch:
+    """HandEvaluator.evaluate_batchのテスト"""
+
+    @pytest.mark.parametrize(
+        "hand, expected",
+        [
+            # ロイヤルフラッシュは最強（1）
+            ("As Ks Qs Js 10s", 1),
+            ("9s 8s As Ks Qs Js 10s", 1),
+            # 5ハイのストレートフラッシュはストレートフラッシュの最弱（10）
+            ("5h 4h 3h 2h Ah", 10),
+            # A のフォーカード + K がフォーカードの最強（11）
+            ("Ac Ad Ah As Kc 2d", 11),
+            # 7-5-4-3-2 のオフスートが全体の最弱（7462）
+            ("7s 5h 4d 3c 2s", 7462),
+        ],
+    )
+    def test_known_hands(self, use_numpy, hand, expected):
+        """値が既知のハンドの評価テスト"""
+        assert _batch_values([_cards(hand)], use_numpy) == [expected]
+
+    @pytest.mark.parametrize("board_size", [3, 4, 5])
+    def test_matches_reference(self, use_numpy, board_size):
+        """総当たりの基準実装と役・キッカー・強さの順序が一致するテスト"""
+        rng = random.Random(42 + board_size)
+        deck = [Card(rank, suit) for suit in Suit for rank in range(2, 15)]
+        hands = [rng.sample(deck, 2 + board_size) for _ in range(300)]
+
+        values = _batch_values(hands, use_numpy)
+
+        expected = [_reference_best(hand) for hand in hands]
+        assert [
+            (HandEvaluator.rank_of_value(value).value, KICKERS[value])
+            for value in values
+        ] == expected
+        # 評価値が小さいほど基準実装でも強く、同じ値なら同じ強さ
+        ordered = sorted(zip(values, expected))
+        for (v1, e1), (v2, e2) in zip(ordered, ordered[1:]):
+            assert (e1 > e2) if v1 < v2 else (e1 == e2)
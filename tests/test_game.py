@@ -3,8 +3,23 @@ Tests for poker.game module
 """
 
 import pytest
-from poker.player_models import HumanPlayer, RandomPlayer, LLMPlayer, PlayerStatus
+from poker.player_models import (
+    HumanPlayer,
+    RandomPlayer,
+    LLMPlayer,
+    LLMApiPlayer,
+    PlayerStatus,
+)
 from poker.game import GamePhase, PokerGame
+from poker.game_models import ActionRecord
+
+
+@pytest.fixture
+def game():
+    """デフォルト構成（人間1人とCPU3人）をセットアップしたゲーム"""
+    game = PokerGame()
+    game.setup_default_game()
+    return game
 
 
 class TestGamePhase:
@@ -75,6 +90,23 @@ class TestPokerGame:
         with pytest.raises(ValueError, match="Maximum 10 players allowed"):
             game.add_player(RandomPlayer(10, "Player10", 1000))
 
+    def test_llm_api_players_index(self):
+        """LLMApiPlayerが専用リストにも登録されることのテスト"""
+        game = PokerGame()
+        game.setup_configurable_game_with_models(
+            [{"type": "random"}, {"type": "llm_api", "agent_id": "team1_agent"}]
+        )
+
+        assert len(game.llm_api_players) == 1
+        assert isinstance(game.llm_api_players[0], LLMApiPlayer)
+        assert game.llm_api_players[0] is game.players[1]
+
+        # 再セットアップ時は作り直される
+        game.setup_configurable_game_with_models(
+            [{"type": "random"}, {"type": "random"}]
+        )
+        assert game.llm_api_players == []
+
     def test_get_player_existing(self):
         """存在するプレイヤーの取得テスト"""
         game = PokerGame()
@@ -117,10 +149,8 @@ class TestPokerGame:
         for player in game.players:
             assert player.chips == game.initial_chips
 
-    def test_start_new_hand_initialization(self):
+    def test_start_new_hand_initialization(self, game):
         """新ハンド開始時の初期化テスト"""
-        game = PokerGame()
-        game.setup_default_game()
 
         # 事前にいくつかの値を設定
         game.hand_number = 5
@@ -178,10 +208,8 @@ class TestPokerGame:
         assert len(game.players[1].hole_cards) == 0  # バスト
         assert len(game.players[2].hole_cards) == 2
 
-    def test_get_llm_game_state_valid_player(self):
+    def test_get_llm_game_state_valid_player(self, game):
         """有効なプレイヤーのゲーム状態取得テスト"""
-        game = PokerGame()
-        game.setup_default_game()
         game.start_new_hand()
 
         game_state = game.get_llm_game_state(0)  # Human player
@@ -226,10 +254,8 @@ class TestPokerGame:
         # 他のプレイヤー情報（自分以外の3人）
         assert len(game_state["players"]) == 3
 
-    def test_get_llm_game_state_invalid_player(self):
+    def test_get_llm_game_state_invalid_player(self, game):
         """無効なプレイヤーのゲーム状態取得エラーテスト"""
-        game = PokerGame()
-        game.setup_default_game()
 
         with pytest.raises(ValueError, match="Invalid player_id: 99"):
             game.get_llm_game_state(99)
@@ -245,10 +271,40 @@ class TestPokerGame:
         ):
             game.get_llm_game_state(1)
 
-    def test_get_available_actions_active_player(self):
+    def test_get_llm_game_state_cached_until_state_changes(self, game):
+        """状態が変わるまで同じゲーム状態が返されることのテスト"""
+        game.start_new_hand()
+        player_id = game.current_player_index
+
+        first = game.get_llm_game_state(player_id)
+        assert game.get_llm_game_state(player_id) == first
+        assert game._llm_state_cache[player_id][1] is not first
+
+        assert game.process_player_action(player_id, "fold")
+        updated = game.get_llm_game_state(player_id)
+        assert updated != first
+        assert updated.actions == []
+
+    def test_get_llm_game_state_copy_is_independent(self, game):
+        """返されたゲーム状態を書き換えても次の呼び出しに影響しないテスト"""
+        game.start_new_hand()
+        player_id = game.current_player_index
+        expected = game.get_llm_game_state(player_id).to_dict()
+
+        state = game.get_llm_game_state(player_id)
+        state.pot = 0
+        state.actions.clear()
+        state.your_cards.append("X")
+        state.players[0].chips = -1
+        state.as_dict["history"].append("tampered")
+
+        again = game.get_llm_game_state(player_id)
+        assert again.to_dict() == expected
+        assert again.as_dict == expected
+        assert again.parsed_actions.can_fold
+
+    def test_get_available_actions_active_player(self, game):
         """アクティブなプレイヤーのアクション取得テスト"""
-        game = PokerGame()
-        game.setup_default_game()
         game.start_new_hand()
 
         # アクティブなプレイヤーのアクションを取得
@@ -264,10 +320,8 @@ class TestPokerGame:
         # アクションが返されることを確認（詳細は実装によるが、空でないことを確認）
         assert isinstance(actions, list)
 
-    def test_get_available_actions_invalid_player(self):
+    def test_get_available_actions_invalid_player(self, game):
         """無効なプレイヤーのアクション取得テスト"""
-        game = PokerGame()
-        game.setup_default_game()
 
         actions = game._get_available_actions(99)
         assert actions == []
@@ -281,10 +335,48 @@ class TestPokerGame:
         actions = game._get_available_actions(1)
         assert actions == []
 
-    def test_move_dealer_button(self):
-        """ディーラーボタン移動のテスト"""
+    def test_last_action_by_player(self):
+        """プレイヤーごとの最新アクションが記録されることのテスト"""
         game = PokerGame()
-        game.setup_default_game()
+        game.setup_cpu_only_game()
+        game.start_new_hand()
+
+        first = game.current_player_index
+        assert game.process_player_action(first, "call")
+        assert game.last_action_by_player[first] == ActionRecord(
+            first, "call", game.big_blind
+        )
+
+        second = game.current_player_index
+        assert game.process_player_action(second, "fold")
+        assert game.last_action_by_player[second] == ActionRecord(second, "fold", 0)
+        # 他のプレイヤーのアクションで以前の記録は上書きされない
+        assert game.last_action_by_player[first].action == "call"
+
+    @pytest.mark.parametrize(
+        "setup, config",
+        [
+            ("setup_configurable_game", ["random", "random", "random"]),
+            (
+                "setup_configurable_game_with_models",
+                [{"type": "random"}, {"type": "random"}, {"type": "random"}],
+            ),
+        ],
+    )
+    def test_reconfigure_clears_last_actions(self, setup, config):
+        """ゲームを組み直すと前のゲームの最新アクションが消えることのテスト"""
+        game = PokerGame()
+        getattr(game, setup)(config)
+        game.start_new_hand()
+        assert game.process_player_action(game.current_player_index, "call")
+        assert game.last_action_by_player
+
+        getattr(game, setup)(config)
+
+        assert game.last_action_by_player == {}
+
+    def test_move_dealer_button(self, game):
+        """ディーラーボタン移動のテスト"""
 
         initial_dealer = game.dealer_button
         game._move_dealer_button()
@@ -297,10 +389,8 @@ class TestPokerGame:
         assert dealer_count == 1
         assert game.players[game.dealer_button].is_dealer
 
-    def test_post_blinds(self):
+    def test_post_blinds(self, game):
         """ブラインド投稿のテスト"""
-        game = PokerGame()
-        game.setup_default_game()
 
         initial_pot = game.pot
         game._post_blinds()
@@ -322,10 +412,8 @@ class TestPokerGame:
         blind_actions = [action for action in game.action_history if "blind" in action]
         assert len(blind_actions) >= 2
 
-    def test_deal_hole_cards(self):
+    def test_deal_hole_cards(self, game):
         """ホールカード配布のテスト"""
-        game = PokerGame()
-        game.setup_default_game()
 
         # 配布前の確認
         for player in game.players:
@@ -361,6 +449,19 @@ class TestPokerGame:
         assert game.game_stats["hands_played"] == 0
         assert game.game_stats["players_eliminated"] == []
 
+    def test_export_stats_total_hands(self):
+        """export_statsの総ハンド数が記録済みハンド数と一致することのテスト"""
+        game = PokerGame()
+        game.setup_cpu_only_game()
+        manager = game.stats_manager
+
+        manager.record_hand_end([0], "preflop")
+        manager.record_hand_end([1], "river")
+
+        expected = max(s.preflop_total_hands for s in manager.player_stats.values())
+        assert manager.hands_recorded == expected == 2
+        assert manager.export_stats()["summary"]["total_hands"] == 2
+
     def test_setup_cpu_only_game(self):
         """CPU専用ゲームセットアップのテスト"""
         game = PokerGame()
@@ -0,0 +1,199 @@
+"""
+Tests for poker.game_models module
+"""
+
+import pytest
+import random
+from poker.game_models import Suit, Card, Deck, AvailableActions, GameState
+from tests.cards import CARDS
+
+# 全52枚のカードの Card.bit を OR したもの
+_FULL_DECK_MASK = (1 << 52) - 1
+
+
+@pytest.fixture
+def deck():
+    """リセット直後の52枚のデッキ"""
+    return Deck()
+
+
+class TestSuit:
+    """Suitクラスのテスト"""
+
+    def test_suit_values(self):
+        """スートの値が正しいことを確認"""
+        assert Suit.HEARTS.value == "hearts"
+        assert Suit.DIAMONDS.value == "diamonds"
+        assert Suit.CLUBS.value == "clubs"
+        assert Suit.SPADES.value == "spades"
+
+
+class TestCard:
+    """Cardクラスのテスト"""
+
+    def test_card_creation_valid(self):
+        """正常なカード作成"""
+        card = Card(14, Suit.SPADES)
+        assert card.rank == 14
+        assert card.suit == Suit.SPADES
+
+    @pytest.mark.parametrize("rank", [1, 15], ids=["low", "high"])
+    def test_card_creation_invalid_rank(self, rank):
+        """不正なランク（低すぎる・高すぎる）でのエラー"""
+        with pytest.raises(ValueError, match="Rank must be between 2 and 14"):
+            Card(rank, Suit.HEARTS)
+
+    @pytest.mark.parametrize(
+        "rank, name",
+        [(2, "2"), (10, "10"), (11, "J"), (12, "Q"), (13, "K"), (14, "A")],
+    )
+    def test_rank_name_property(self, rank, name):
+        """rank_nameプロパティのテスト"""
+        assert CARDS[rank, Suit.HEARTS].rank_name == name
+
+    @pytest.mark.parametrize(
+        "suit, symbol",
+        [
+            (Suit.HEARTS, "♥"),
+            (Suit.DIAMONDS, "♦"),
+            (Suit.CLUBS, "♣"),
+            (Suit.SPADES, "♠"),
+        ],
+    )
+    def test_suit_symbol_property(self, suit, symbol):
+        """suit_symbolプロパティのテスト"""
+        assert CARDS[14, suit].suit_symbol == symbol
+
+    @pytest.mark.parametrize(
+        "rank, suit, expected",
+        [(14, Suit.SPADES, "A♠"), (10, Suit.HEARTS, "10♥")],
+    )
+    def test_str_representation(self, rank, suit, expected):
+        """文字列表現のテスト"""
+        assert str(CARDS[rank, suit]) == expected
+
+    @pytest.mark.parametrize(
+        "other, equal",
+        [
+            (CARDS[14, Suit.SPADES], True),
+            (CARDS[14, Suit.HEARTS], False),
+            (CARDS[13, Suit.SPADES], False),
+            ("not a card", False),
+        ],
+        ids=["same", "different_suit", "different_rank", "not_a_card"],
+    )
+    def test_equality(self, other, equal):
+        """等価性テスト"""
+        assert (Card(14, Suit.SPADES) == other) is equal
+
+    @pytest.mark.parametrize(
+        "other, same_hash",
+        [(CARDS[14, Suit.SPADES], True), (CARDS[14, Suit.HEARTS], False)],
+        ids=["same", "different_suit"],
+    )
+    def test_hash(self, other, same_hash):
+        """ハッシュのテスト"""
+        assert (hash(Card(14, Suit.SPADES)) == hash(other)) is same_hash
+
+    def test_repr(self):
+        """repr表現のテスト"""
+        card = CARDS[14, Suit.SPADES]
+        assert repr(card) == "Card(A, spades)"
+
+
+class TestDeck:
+    """Deckクラスのテスト"""
+
+    def test_deck_initialization(self, deck):
+        """デッキの初期化テスト"""
+        assert len(deck.cards) == 52
+        assert deck.cards_remaining() == 52
+
+    def test_deck_has_all_cards(self, deck):
+        """デッキに全52枚のカードが含まれていることを確認"""
+        # 52ビットのハンドマスクが全て立ち、かつ52枚なら重複も欠けもない
+        mask = 0
+        for card in deck.cards:
+            mask |= card.bit
+
+        assert len(deck.cards) == 52
+        assert mask == _FULL_DECK_MASK
+
+    def test_deal_card(self, deck):
+        """カード配布のテスト"""
+        initial_count = deck.cards_remaining()
+
+        card = deck.deal_card()
+        assert 2 <= card.rank <= 14 and card.suit in Suit
+        assert card not in deck.cards
+        assert deck.cards_remaining() == initial_count - 1
+
+    def test_deal_card_empty_deck(self, deck):
+        """空デッキからの配布エラーテスト"""
+        # 全カードを配り終えた状態にする
+        deck.cards.clear()
+
+        with pytest.raises(ValueError, match="Cannot deal from empty deck"):
+            deck.deal_card()
+
+    def test_reset(self, deck):
+        """デッキリセットのテスト"""
+        # いくつかカードを配布
+        for _ in range(10):
+            deck.deal_card()
+
+        assert deck.cards_remaining() == 42
+
+        deck.reset()
+        assert deck.cards_remaining() == 52
+
+    def test_deal_order_random(self):
+        """配る順番が乱数で決まることのテスト（シード固定で決定的に確認）"""
+
+        def deal_all(seed):
+            deck = Deck()
+            random.seed(seed)
+            return [deck.deal_card() for _ in range(52)]
+
+        assert deal_all(1) == deal_all(1)
+        assert deal_all(1) != deal_all(2)
+        # 並び順だけが変わり、52枚すべてが1回ずつ配られる
+        assert set(deal_all(1)) == set(Deck().cards)
+
+
+class TestAvailableActions:
+    """AvailableActionsクラスのテスト"""
+
+    def test_from_strings(self):
+        """アクション文字列のパース"""
+        parsed = AvailableActions.from_strings(
+            ["fold", "call (20)", "raise (min 40)", "all-in (970)"]
+        )
+        assert parsed.can_fold is True
+        assert parsed.can_check is False
+        assert parsed.call_amount == 20
+        assert parsed.min_raise == 40
+        assert parsed.can_allin is True
+
+    def test_from_strings_check_only(self):
+        """チェックのみの場合"""
+        parsed = AvailableActions.from_strings(["fold", "check"])
+        assert parsed.can_fold is True
+        assert parsed.can_check is True
+        assert parsed.call_amount is None
+        assert parsed.min_raise is None
+        assert parsed.can_allin is False
+
+    def test_from_strings_empty(self):
+        """アクションがない場合"""
+        assert AvailableActions.from_strings([]) == AvailableActions()
+
+
+class TestGameState:
+    """GameStateクラスのテスト"""
+
+    def test_as_dict_cached(self):
+        """as_dictがto_dictと同じ内容を1度だけ計算すること"""
+        game_state = GameState.from_dict({"your_id": 1, "actions": ["fold"]})
+        assert game_state.as_dict == game_state.to_dict()
+        assert game_state.as_dict is game_state.as_dict
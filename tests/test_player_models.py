@@ -0,0 +1,332 @@
+"""
+Tests for poker.player_models module
+"""
+
+import pytest
+from types import SimpleNamespace
+from poker.game_models import Suit, AvailableActions
+from poker.player_models import (
+    PlayerStatus,
+    Player,
+    HumanPlayer,
+    RandomPlayer,
+    LLMPlayer,
+)
+from tests.cards import CARDS
+
+# test_to_dict で期待する RandomPlayer(1, "Test Player", 1000) の辞書表現
+_EXPECTED_PLAYER_DICT = {"id": 1, "chips": 1000, "bet": 100, "status": "active"}
+
+
+@pytest.fixture
+def gs_factory():
+    """GameStateの代わりに渡す簡易スタブを作る関数"""
+
+    def make(actions=(), **fields):
+        actions = list(actions)
+        d = {**fields, "actions": actions}
+        return SimpleNamespace(
+            actions=actions,
+            parsed_actions=AvailableActions.from_strings(actions),
+            to_dict=lambda: d,
+            as_dict=d,
+        )
+
+    return make
+
+
+def _assert_initial_state(player, player_id, name, chips):
+    """id・名前・チップがコンストラクタに渡した値のままであることを確認"""
+    assert (player.id, player.name, player.chips) == (player_id, name, chips)
+
+
+# プレイヤーはテスト中に状態が変わるため、フィクスチャは毎回新しく作る
+@pytest.fixture
+def player():
+    """チップ1000のRandomPlayer"""
+    return RandomPlayer(1, "Test Player", 1000)
+
+
+@pytest.fixture
+def human_player():
+    """チップ1000のHumanPlayer"""
+    return HumanPlayer(1, "Human Player", 1000)
+
+
+@pytest.fixture
+def llm_player():
+    """チップ1000のLLMPlayer（モデル指定なし）"""
+    return LLMPlayer(1, "LLM Player", 1000)
+
+
+class TestPlayerStatus:
+    """PlayerStatusクラスのテスト"""
+
+    def test_player_status_values(self):
+        """プレイヤーステータスの値確認"""
+        assert PlayerStatus.ACTIVE.value == "active"
+        assert PlayerStatus.FOLDED.value == "folded"
+        assert PlayerStatus.ALL_IN.value == "all_in"
+        assert PlayerStatus.BUSTED.value == "busted"
+
+
+class TestRandomPlayer:
+    """RandomPlayerクラス（Playerの具象クラス）のテスト"""
+
+    def test_player_initialization(self, player):
+        """プレイヤー初期化のテスト"""
+        _assert_initial_state(player, 1, "Test Player", 1000)
+        assert player.hole_cards == []
+        assert player.current_bet == 0
+        assert player.total_bet_this_hand == 0
+        assert player.status == PlayerStatus.ACTIVE
+        assert not player.is_dealer
+        assert not player.is_small_blind
+        assert not player.is_big_blind
+
+    def test_reset_for_new_hand(self, player):
+        """新ハンド用リセットのテスト"""
+        player.hole_cards = [CARDS[14, Suit.SPADES], CARDS[13, Suit.HEARTS]]
+        player.current_bet = 100
+        player.total_bet_this_hand = 200
+        player.status = PlayerStatus.FOLDED
+        player.is_dealer = True
+
+        player.reset_for_new_hand()
+
+        assert player.hole_cards == []
+        assert player.current_bet == 0
+        assert player.total_bet_this_hand == 0
+        assert player.status == PlayerStatus.ACTIVE
+        assert not player.is_dealer
+        assert not player.is_small_blind
+        assert not player.is_big_blind
+
+    def test_reset_for_new_hand_busted(self):
+        """チップ0でのリセットテスト"""
+        player = RandomPlayer(1, "Test Player", 0)
+        player.reset_for_new_hand()
+        assert player.status == PlayerStatus.BUSTED
+
+    def test_reset_for_new_betting_round(self, player):
+        """新ベッティングラウンド用リセットのテスト"""
+        player.current_bet = 100
+        player.total_bet_this_hand = 200
+
+        player.reset_for_new_betting_round()
+
+        assert player.current_bet == 0
+        assert player.total_bet_this_hand == 200  # これは保持される
+
+    def test_add_hole_card(self, player):
+        """ホールカード追加のテスト"""
+        card1 = CARDS[14, Suit.SPADES]
+        card2 = CARDS[13, Suit.HEARTS]
+
+        player.add_hole_card(card1)
+        assert len(player.hole_cards) == 1
+        assert player.hole_cards[0] == card1
+
+        player.add_hole_card(card2)
+        assert len(player.hole_cards) == 2
+        assert player.hole_cards[1] == card2
+
+    def test_add_hole_card_too_many(self, player):
+        """3枚目のホールカード追加エラー"""
+        player.add_hole_card(CARDS[14, Suit.SPADES])
+        player.add_hole_card(CARDS[13, Suit.HEARTS])
+
+        with pytest.raises(ValueError, match="Player already has 2 hole cards"):
+            player.add_hole_card(CARDS[12, Suit.CLUBS])
+
+    def test_bet_normal(self, player):
+        """通常のベットテスト"""
+        actual_bet = player.bet(100)
+
+        assert actual_bet == 100
+        assert player.chips == 900
+        assert player.current_bet == 100
+        assert player.total_bet_this_hand == 100
+        assert player.status == PlayerStatus.ACTIVE
+
+    def test_bet_all_in(self):
+        """オールインベットのテスト"""
+        player = RandomPlayer(1, "Test Player", 50)
+        actual_bet = player.bet(100)  # チップより多い額をベット
+
+        assert actual_bet == 50
+        assert player.chips == 0
+        assert player.current_bet == 50
+        assert player.total_bet_this_hand == 50
+        assert player.status == PlayerStatus.ALL_IN
+
+    def test_bet_zero_or_negative(self, player):
+        """0以下のベットテスト"""
+        assert player.bet(0) == 0
+        assert player.bet(-10) == 0
+        assert player.chips == 1000
+        assert player.current_bet == 0
+
+    def test_fold(self, player):
+        """フォールドのテスト"""
+        player.fold()
+        assert player.status == PlayerStatus.FOLDED
+
+    @pytest.mark.parametrize(
+        "amount, expected", [(500, True), (1000, True), (1001, False)]
+    )
+    def test_can_bet(self, player, amount, expected):
+        """ベット可能性チェックのテスト（チップ1000が境界）"""
+        assert player.can_bet(amount) is expected
+
+    def test_can_bet_after_fold(self, player):
+        """フォールド後はベットできないことを確認"""
+        player.fold()
+        assert player.can_bet(500) is False
+
+    def test_to_dict(self, player):
+        """辞書変換のテスト"""
+        player.current_bet = 100
+        player.status = PlayerStatus.ACTIVE
+
+        assert player.to_dict() == _EXPECTED_PLAYER_DICT
+
+    def test_str_representation(self, player):
+        """文字列表現のテスト"""
+        assert str(player) == "Test Player (ID: 1, Chips: 1000)"
+
+    def test_make_decision_with_actions(self, player, gs_factory):
+        """意思決定のテスト（利用可能なアクション）"""
+        game_state = gs_factory(
+            ["fold", "check", "call (20)", "raise (min 40)", "all-in"]
+        )
+
+        decision = player.make_decision(game_state)
+
+        assert "action" in decision
+        assert "amount" in decision
+        assert decision["action"] in ["fold", "check", "call", "raise", "all_in"]
+
+        if decision["action"] == "fold":
+            assert decision["amount"] == 0
+        elif decision["action"] == "check":
+            assert decision["amount"] == 0
+        elif decision["action"] == "call":
+            assert decision["amount"] == 20
+        elif decision["action"] == "all_in":
+            assert decision["amount"] == player.chips
+
+    def test_make_decision_no_actions(self, player, gs_factory):
+        """利用可能なアクションがない場合のテスト"""
+        decision = player.make_decision(gs_factory())
+        assert decision == {"action": "fold", "amount": 0}
+
+    def test_action_weights(self, player):
+        """アクション重みのテスト"""
+        # (fold, check_call, raise, all_in)
+        assert player.ACTION_WEIGHTS == (30, 50, 15, 5)
+
+
+class TestHumanPlayer:
+    """HumanPlayerクラスのテスト"""
+
+    def test_initialization(self, human_player):
+        """初期化のテスト"""
+        _assert_initial_state(human_player, 1, "Human Player", 1000)
+
+    def test_make_decision_not_implemented(self, human_player):
+        """make_decisionでNotImplementedErrorが発生することを確認"""
+        with pytest.raises(
+            NotImplementedError, match="Human player decisions are handled by UI layer"
+        ):
+            human_player.make_decision({})
+
+
+class TestLLMPlayer:
+    """LLMPlayerクラスのテスト"""
+
+    def test_initialization(self, llm_player):
+        """初期化のテスト"""
+        _assert_initial_state(llm_player, 1, "LLM Player", 1000)
+        # LLMPlayer は ADK エージェント利用に変更されたためクライアント属性は存在しない
+        assert hasattr(llm_player, "_agent")
+
+    def test_initialization_with_client(self):
+        """LLMクライアント付き初期化のテスト"""
+        # 旧仕様の llm_client 引数は廃止。model 引数に文字列を渡せることを確認
+        model_id = "gemini-2.5-flash-lite"
+        player = LLMPlayer(1, "LLM Player", 1000, model_id)
+        assert player.model == model_id
+
+    @pytest.mark.parametrize(
+        "actions, expected",
+        [
+            (["fold", "check"], {"fold", "check"}),
+            (["fold", "call (20)"], {"fold", "call"}),
+        ],
+    )
+    def test_make_decision_without_client(
+        self, llm_player, gs_factory, actions, expected
+    ):
+        """LLMクライアントなしでの意思決定（ランダム動作）"""
+        decision = llm_player.make_decision(gs_factory(actions))
+
+        assert "action" in decision
+        assert "amount" in decision
+        assert decision["action"] in expected
+
+    def test_create_decision_prompt(self, llm_player, gs_factory):
+        """決定プロンプト作成のテスト"""
+        game_state = gs_factory(["fold", "check"], test="data")
+
+        prompt = llm_player._create_decision_prompt(game_state)
+
+        assert "現在のポーカー状況を分析して" in prompt
+        assert "test" in prompt
+        # 新しいプロンプトはJSONダンプを含む
+        assert "actions" in prompt
+
+    def test_parse_llm_response(self, llm_player):
+        """LLM応答パースのテスト（プレースホルダー）"""
+        response = "ACTION: fold\nAMOUNT: 0\nREASON: Bad hand"
+        game_state = {}
+
+        result = llm_player._parse_llm_response(response, game_state)
+
+        # 現在はプレースホルダーなのでfoldを返す
+        assert result == {"action": "fold", "amount": 0}
+
+    def test_parse_llm_response_braces_in_reasoning(self, llm_player):
+        """reasoning内に波括弧を含むJSON応答のパース"""
+        response = (
+            'Decision: {"action": "check", "amount": 0, '
+            '"reasoning": "range {AK, \\"QQ+\\"} is ahead"}'
+        )
+        game_state = {}
+
+        result = llm_player._parse_llm_response(response, game_state)
+
+        assert result == {"action": "check", "amount": 0}
+        assert llm_player.last_decision_reasoning == 'range {AK, "QQ+"} is ahead'
+
+    @pytest.mark.parametrize(
+        "response",
+        [
+            # "action" キーのないオブジェクトの後ろにある決定
+            '{"meta": {"model": "x"}} then {"action": "call", "amount": 0}',
+            # 文字列中にだけ "action" を含むオブジェクトの後ろにある決定
+            '{"note": "\\"action\\" follows"} {"action": "call", "amount": 0}',
+            # 入れ子になった決定
+            '{"decision": {"action": "call", "amount": 0}}',
+        ],
+        ids=["after_other_object", "after_string_mention", "nested"],
+    )
+    def test_parse_llm_response_finds_action_object(
+        self, llm_player, gs_factory, response
+    ):
+        """ "action" キーを持つオブジェクトを探してパースするテスト"""
+        game_state = gs_factory(["fold", "call (20)"])
+
+        result = llm_player._parse_llm_response(response, game_state)
+
+        assert result == {"action": "call", "amount": 20}
@@ -0,0 +1,102 @@
+"""
+Tests for poker.player_stats module
+"""
+
+import pytest
+from poker.player_stats import ActionType, PlayerActionStats, PlayerStatsManager
+
+
+@pytest.fixture
+def manager():
+    """プレイヤー0〜2を登録した統計マネージャー"""
+    manager = PlayerStatsManager()
+    for i in range(3):
+        manager.register_player(i, f"Player{i}")
+    return manager
+
+
+@pytest.fixture
+def stats():
+    """プリフロップでコールして勝った1ハンド分の統計"""
+    stats = PlayerActionStats(0, "Player0")
+    stats.record_action(ActionType.CALL, "preflop")
+    stats.record_hand_end(True, True)
+    return stats
+
+
+class TestPlayerActionStats:
+    """PlayerActionStatsクラスのテスト"""
+
+    def test_action_summary_cached(self, stats):
+        """統計が変わらない間はキャッシュから同じ内容を返すテスト"""
+        first = stats.get_action_summary()
+        cached = stats._cached_summary
+
+        assert stats.get_action_summary() == first
+        assert stats._cached_summary is cached
+
+    def test_action_summary_copy_is_independent(self, stats):
+        """返したサマリーを書き換えても以降の結果に影響しないテスト"""
+        summary = stats.get_action_summary()
+        expected = stats._build_summary(None)
+
+        summary["ppr"] = 0.5
+        summary["action_counts"]["call"] = 99
+        summary["preflop_stats"]["total_hands"] = 99
+        summary["post_preflop_stats"]["wins"] = 99
+
+        assert stats.get_action_summary() == expected
+
+    @pytest.mark.parametrize(
+        "mutate",
+        [
+            lambda s: s.record_action(ActionType.RAISE, "flop"),
+            lambda s: s.record_hand_end(False, False),
+            lambda s: s.record_hand_result({"hand": 2}),
+        ],
+        ids=["record_action", "record_hand_end", "record_hand_result"],
+    )
+    def test_action_summary_invalidated_by_mutators(self, stats, mutate):
+        """統計を更新するメソッドがキャッシュを無効にするテスト"""
+        stats.get_action_summary()
+        cached = stats._cached_summary
+
+        mutate(stats)
+
+        assert stats.get_action_summary() == stats._build_summary(None)
+        assert stats._cached_summary is not cached
+
+    def test_action_summary_rebuilt_for_other_max_hands(self, stats):
+        """max_handsが変わるとサマリーを作り直すテスト"""
+        assert stats.get_action_summary()["preflop_stats"]["total_hands"] == 1
+        assert stats.get_action_summary(10)["preflop_stats"]["total_hands"] == 10
+        assert stats.get_action_summary()["preflop_stats"]["total_hands"] == 1
+
+
+class TestPlayerStatsManager:
+    """PlayerStatsManagerクラスのテスト"""
+
+    def test_record_hand_end(self, manager):
+        """プリフロップ参加と参加後の勝敗がプレイヤーごとに記録されるテスト"""
+        manager.record_hand_start([0, 1, 2])
+        manager.record_action(0, ActionType.CALL, "preflop")
+        manager.record_action(1, ActionType.RAISE, "preflop")
+        manager.record_action(2, ActionType.FOLD, "preflop")
+
+        manager.record_hand_end([1], "river")
+
+        counts = {
+            player_id: (
+                stats.preflop_total_hands,
+                stats.preflop_participated,
+                stats.post_preflop_hands,
+                stats.post_preflop_wins,
+            )
+            for player_id, stats in manager.player_stats.items()
+        }
+        assert counts == {0: (1, 1, 1, 0), 1: (1, 1, 1, 1), 2: (1, 0, 0, 0)}
+        # 次のハンドに参加フラグを持ち越さない
+        assert not any(
+            stats.preflop_actions_this_hand for stats in manager.player_stats.values()
+        )
+        assert manager.hands_recorded == 1
@@ -0,0 +1,209 @@
+"""
+Tests for poker.state_server module
+"""
+
+import gzip
+import http.client
+import json
+import threading
+
+import pytest
+
+from poker import shared_state, state_server
+from poker.game import GamePhase, PokerGame
+from poker.player_models import RandomPlayer
+from poker.state_server import (
+    _build_viewer_state,
+    _state_delta,
+    start_state_server,
+)
+
+
+@pytest.fixture
+def server():
+    """ポート自動割り当てでバックグラウンド起動した状態サーバー"""
+    server = start_state_server(port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def shared_game(monkeypatch):
+    """4人のRandomPlayerでハンドを開始し、観戦対象として登録したゲーム"""
+    game = PokerGame(small_blind=10, big_blind=20, initial_chips=1000)
+    for i in range(4):
+        game.add_player(RandomPlayer(i, f"Player{i}", 1000))
+    game.start_new_hand()
+    monkeypatch.setattr(shared_state, "_current_game", game)
+    return game
+
+
+def _read_event(resp):
+    """SSEストリームから次のイベントを読み、{フィールド名: 値} を返す"""
+    fields = {}
+    while True:
+        line = resp.readline().decode().rstrip("\n")
+        if not line:
+            if fields:
+                return fields
+            continue
+        if line.startswith(":"):
+            # keep-aliveコメント
+            continue
+        name, _, value = line.partition(": ")
+        fields[name] = value
+
+
+def _get(server, path, headers=None):
+    """GETして (レスポンス, ボディ) を返す"""
+    conn = http.client.HTTPConnection(*server.server_address, timeout=5)
+    try:
+        conn.request("GET", path, headers=headers or {})
+        resp = conn.getresponse()
+        return resp, resp.read()
+    finally:
+        conn.close()
+
+
+def test_community_cards_not_pinned_by_read_before_deal(monkeypatch):
+    """フェーズ変更とカード配布の間に読まれても、配布後のボードを返すこと"""
+    game = PokerGame(small_blind=10, big_blind=20, initial_chips=1000)
+    for i in range(4):
+        game.add_player(RandomPlayer(i, f"Player{i}", 1000))
+    game.start_new_hand()
+    # プリフロップは全員コール（ビッグブラインドはチェック）で終える
+    while not game.betting_round_complete:
+        player = game.players[game.current_player_index]
+        action = "call" if game.current_bet > player.current_bet else "check"
+        assert game.process_player_action(player.id, action, 0)
+
+    deal_flop = game._deal_flop
+    boards_before_deal = []
+
+    def read_then_deal():
+        # current_phase は FLOP に変わっているが、まだカードは配られていない
+        boards_before_deal.append(_build_viewer_state(game)["community_cards"])
+        deal_flop()
+
+    monkeypatch.setattr(game, "_deal_flop", read_then_deal)
+    game.advance_to_next_phase()
+
+    assert game.current_phase == GamePhase.FLOP
+    assert boards_before_deal == [[]]
+    state = _build_viewer_state(game)
+    assert state["community_cards"] == [str(c) for c in game.community_cards]
+    assert len(state["community_cards"]) == 3
+
+
+def test_state_connection_kept_alive(server):
+    """/state と 404 の応答後も同じ接続を使い続けられること"""
+    conn = http.client.HTTPConnection(*server.server_address, timeout=5)
+    try:
+        sockets = []
+        for path, status in [("/state", 200), ("/missing", 404), ("/state", 200)]:
+            conn.request("GET", path)
+            resp = conn.getresponse()
+            resp.read()
+            assert resp.status == status
+            assert resp.version == 11
+            assert not resp.will_close
+            sockets.append(conn.sock)
+        assert sockets[0] is sockets[1] is sockets[2]
+    finally:
+        conn.close()
+
+
+def test_state_etag_and_not_modified(server, shared_game):
+    """ETagが一致すれば304、ゲームが変われば新しいETagで200を返すこと"""
+    resp, body = _get(server, "/state")
+    assert resp.status == 200
+    etag = resp.getheader("ETag")
+    assert etag.startswith('W/"')
+    assert json.loads(body)["hand_number"] == shared_game.hand_number
+
+    resp, body = _get(server, "/state", {"If-None-Match": etag})
+    assert resp.status == 304
+    assert resp.getheader("ETag") == etag
+    assert body == b""
+
+    player = shared_game.players[shared_game.current_player_index]
+    assert shared_game.process_player_action(player.id, "call", 0)
+
+    resp, body = _get(server, "/state", {"If-None-Match": etag})
+    assert resp.status == 200
+    assert resp.getheader("ETag") != etag
+    assert json.loads(body)["pot"] == shared_game.pot
+
+
+def test_state_delta_changed_added_removed():
+    """_state_deltaが変更・追加・削除されたキーを返し、適用すると新しい状態になること"""
+    old = {"pot": 30, "phase": "preflop", "showdown_results": None}
+    new = {"pot": 60, "phase": "preflop", "current_turn": 2}
+
+    delta = _state_delta(old, new)
+
+    assert delta == {
+        "changed": {"pot": 60, "current_turn": 2},
+        "removed": ["showdown_results"],
+    }
+    # ビューアーと同じ手順で適用する
+    merged = {k: v for k, v in old.items() if k not in delta["removed"]}
+    merged.update(delta["changed"])
+    assert merged == new
+
+
+def test_events_stream_full_then_delta(server, shared_game):
+    """/eventsが最初に全体、ゲーム変更後に差分をETagのidつきで送ること"""
+    conn = http.client.HTTPConnection(*server.server_address, timeout=5)
+    try:
+        conn.request("GET", "/events")
+        resp = conn.getresponse()
+        assert resp.status == 200
+        assert resp.getheader("Content-Type") == "text/event-stream"
+        assert resp.getheader("Transfer-Encoding") == "chunked"
+
+        first = _read_event(resp)
+        assert "event" not in first
+        base = json.loads(first["data"])
+        assert base == _build_viewer_state(shared_game)
+        state_resp, _ = _get(server, "/state")
+        assert first["id"] == state_resp.getheader("ETag")
+
+        # state_versionを1回だけ進める変更
+        shared_game.pot += 5
+        shared_game.state_version += 1
+
+        second = _read_event(resp)
+        assert second["event"] == "delta"
+        delta = json.loads(second["data"])
+        assert delta == {"changed": {"pot": base["pot"] + 5}, "removed": []}
+        state_resp, body = _get(server, "/state")
+        assert second["id"] == state_resp.getheader("ETag") != first["id"]
+        merged = {k: v for k, v in base.items() if k not in delta["removed"]}
+        merged.update(delta["changed"])
+        assert merged == json.loads(body)
+    finally:
+        conn.close()
+
+
+def test_state_gzip(server, shared_game):
+    """Accept-Encoding: gzip なら圧縮した同じJSONを返し、ETagごとに1回だけ圧縮すること"""
+    plain_resp, plain = _get(server, "/state")
+    etag = plain_resp.getheader("ETag")
+
+    resp, body = _get(server, "/state", {"Accept-Encoding": "gzip"})
+
+    assert resp.status == 200
+    assert resp.getheader("Content-Encoding") == "gzip"
+    assert resp.getheader("Vary") == "Accept-Encoding"
+    assert int(resp.getheader("Content-Length")) == len(body)
+    assert json.loads(gzip.decompress(body)) == json.loads(plain)
+    assert plain_resp.getheader("Content-Encoding") is None
+
+    # 同じETagなら圧縮済みのボディを使い回す
+    assert state_server._gzip_cache[0] == etag
+    _, again = _get(server, "/state", {"Accept-Encoding": "gzip"})
+    assert again == body